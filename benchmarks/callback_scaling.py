@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# --------------------------------------------------------------------------
+# File: callback_scaling.py
+# ---------------------------------------------------------------------------
+# Licensed Materials - Property of IBM
+# 5725-A06 5725-A29 5724-Y48 5724-Y49 5724-Y54 5724-Y55 5655-Y21
+# Copyright IBM Corporation 2008, 2022. All Rights Reserved.
+#
+# US Government Users Restricted Rights - Use, duplication or
+# disclosure restricted by GSA ADP Schedule Contract with
+# IBM Corp.
+# ------------------------------------------------------------------------
+"""Measures how a callback-heavy MIP scales with parameters.threads.
+
+Usage: python benchmarks/callback_scaling.py [workload [threads ...]]
+
+Solves a random multi-dimensional knapsack problem with a generic
+callback that is invoked in the relaxation and candidate contexts.  On
+every invocation, the callback fetches the current point into a
+per-thread buffer and then performs some work:
+
+* "python" (the default) runs a pure Python loop, which holds the
+  global interpreter lock;
+* "numpy" runs NumPy operations on a large array, which release it;
+* "none" does nothing beyond fetching the point.
+
+For each number of threads (by default 1, 2, 4, ... up to the number
+of CPUs), the solve runs in deterministic parallel mode with a node
+limit, and the script reports the wall-clock time, the number of
+callback invocations, the invocation throughput, and its speedup over
+the first run.
+"""
+import array
+import os
+import random
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import cplex  # noqa: E402  pylint: disable=wrong-import-position
+
+NUM_ITEMS = 400
+NUM_KNAPSACKS = 20
+NODE_LIMIT = 2000
+PYTHON_WORK = 20000
+NUMPY_SIZE = 1 << 20
+
+
+def build_model(seed=12345):
+    """Returns a random multi-dimensional knapsack problem."""
+    rng = random.Random(seed)
+    cpx = cplex.Cplex()
+    cpx.set_results_stream(None)
+    cpx.set_log_stream(None)
+    cpx.objective.set_sense(cpx.objective.sense.maximize)
+    cpx.variables.add(obj=[rng.randint(10, 100) for _ in range(NUM_ITEMS)],
+                      types="B" * NUM_ITEMS)
+    rows = []
+    rhs = []
+    for _ in range(NUM_KNAPSACKS):
+        weights = [float(rng.randint(5, 60)) for _ in range(NUM_ITEMS)]
+        rows.append(cplex.SparsePair(ind=list(range(NUM_ITEMS)),
+                                     val=weights))
+        rhs.append(sum(weights) / 4)
+    cpx.linear_constraints.add(lin_expr=rows, senses="L" * NUM_KNAPSACKS,
+                               rhs=rhs)
+    cpx.parameters.mip.limits.nodes.set(NODE_LIMIT)
+    cpx.parameters.parallel.set(cpx.parameters.parallel.values.deterministic)
+    return cpx
+
+
+class Workload():
+    """Generic callback that fetches the current point and does work."""
+
+    def __init__(self, kind, num_cols):
+        self.kind = kind
+        self.num_cols = num_cols
+        self.count = 0
+        self._count_lock = threading.Lock()
+        self._local = threading.local()
+        if kind == "numpy":
+            import numpy  # pylint: disable=import-outside-toplevel
+            self._numpy = numpy
+
+    def _buffers(self):
+        local = self._local
+        if not hasattr(local, "point"):
+            local.point = array.array("d", bytes(8 * self.num_cols))
+            if self.kind == "numpy":
+                local.data = self._numpy.random.default_rng().random(
+                    NUMPY_SIZE)
+        return local
+
+    def invoke(self, context):
+        """Called by CPLEX."""
+        local = self._buffers()
+        if context.in_relaxation():
+            context.get_relaxation_point(out=local.point)
+        else:
+            context.get_candidate_point(out=local.point)
+        if self.kind == "python":
+            total = 0
+            for i in range(PYTHON_WORK):
+                total += i * i
+        elif self.kind == "numpy":
+            self._numpy.sort(local.data)
+        with self._count_lock:
+            self.count += 1
+
+
+def run(kind, threads):
+    """Solves the model once and returns (seconds, invocations)."""
+    cpx = build_model()
+    cpx.parameters.threads.set(threads)
+    workload = Workload(kind, cpx.variables.get_num())
+    cpx.set_callback(workload, cplex.callbacks.Context.id.relaxation |
+                     cplex.callbacks.Context.id.candidate)
+    start = time.perf_counter()
+    cpx.solve()
+    elapsed = time.perf_counter() - start
+    cpx.end()
+    return elapsed, workload.count
+
+
+def main(argv):
+    """Runs the benchmark."""
+    kind = argv[1] if len(argv) > 1 else "python"
+    if kind not in ("python", "numpy", "none"):
+        raise SystemExit("workload must be python, numpy, or none")
+    if len(argv) > 2:
+        thread_counts = [int(arg) for arg in argv[2:]]
+    else:
+        thread_counts = [1]
+        while thread_counts[-1] * 2 <= (os.cpu_count() or 1):
+            thread_counts.append(thread_counts[-1] * 2)
+    print("workload: {0}".format(kind))
+    print("{0:>7}  {1:>9}  {2:>7}  {3:>10}  {4:>7}".format(
+        "threads", "seconds", "calls", "calls/s", "speedup"))
+    base = None
+    for threads in thread_counts:
+        elapsed, count = run(kind, threads)
+        rate = count / elapsed if elapsed > 0 else 0.0
+        if base is None:
+            base = rate
+        print("{0:7d}  {1:9.3f}  {2:7d}  {3:10.1f}  {4:7.2f}".format(
+            threads, elapsed, count, rate, rate / base if base else 0.0))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
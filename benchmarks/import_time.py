@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# --------------------------------------------------------------------------
+# File: import_time.py
+# ---------------------------------------------------------------------------
+# Licensed Materials - Property of IBM
+# 5725-A06 5725-A29 5724-Y48 5724-Y49 5724-Y54 5724-Y55 5655-Y21
+# Copyright IBM Corporation 2008, 2022. All Rights Reserved.
+#
+# US Government Users Restricted Rights - Use, duplication or
+# disclosure restricted by GSA ADP Schedule Contract with
+# IBM Corp.
+# ------------------------------------------------------------------------
+"""Measures the import time of the cplex package.
+
+Usage: python benchmarks/import_time.py [repeat]
+
+Runs 'python -X importtime -c "import cplex"' in fresh interpreters and
+reports the median cumulative import time of cplex.  For comparison, it
+also measures an import that loads all of the modules that cplex only
+imports on first use (see _LAZY_MODULES in cplex/__init__.py and
+cplex/_internal/__init__.py).
+
+Exits with status 1 if 'import cplex' imports one of those modules,
+e.g., cplex._internal._conflict, cplex._internal._feasopt, or
+cplex._internal._advanced.
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def lazy_modules():
+    """Returns the full names of the modules that cplex imports lazily."""
+    sys.path.insert(0, ROOT)
+    import cplex  # pylint: disable=import-outside-toplevel
+    from cplex import _internal  # pylint: disable=import-outside-toplevel
+    return (["cplex." + name for name in cplex._LAZY_MODULES] +
+            ["cplex._internal." + name for name in _internal._LAZY_MODULES])
+
+
+def import_time(statement, package="cplex"):
+    """Returns the cumulative import time of package in microseconds and
+    the set of modules imported by statement.
+
+    The import time is the sum over the top-level imports of package
+    and its submodules made by statement.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT, stderr=subprocess.PIPE, universal_newlines=True,
+        check=True)
+    cumulative = 0
+    imported = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if not fields[1].strip().isdigit():
+            continue  # the header line
+        # Nested imports are indented by two spaces per level.
+        name = fields[2][1:]
+        imported.add(name.strip())
+        if name == package or name.startswith(package + "."):
+            cumulative += int(fields[1])
+    return cumulative, imported
+
+
+def median_time(statement, repeat):
+    """Returns the median cumulative import time over repeat runs."""
+    return statistics.median(import_time(statement)[0]
+                             for _ in range(repeat))
+
+
+def main(argv):
+    """Runs the benchmark."""
+    repeat = int(argv[1]) if len(argv) > 1 else 10
+    lazy = lazy_modules()
+    _, imported = import_time("import cplex")
+    eager = sorted(imported.intersection(lazy))
+    lazy_time = median_time("import cplex", repeat)
+    full_time = median_time("; ".join(["import cplex"] + [
+        "import " + name for name in lazy]), repeat)
+    print("import cplex:                {0:8d} us".format(int(lazy_time)))
+    print("import cplex + lazy modules: {0:8d} us".format(int(full_time)))
+    if eager:
+        print("imported eagerly: " + ", ".join(eager))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
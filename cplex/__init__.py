@@ -31,30 +31,27 @@ classes for sparse vector and sparse matrix output, respectively. See
 the documentation for individual methods for details about the usage
 of these classes.
 """
-__all__ = ["Cplex", "Stats", "Aborter", "callbacks", "exceptions",
-           "infinity", "ParameterSet", "SparsePair", "SparseTriple",
-           "model_info"]
+__all__ = ["Cplex", "Stats", "Aborter", "batch", "callbacks",
+           "exceptions", "infinity", "ParameterSet", "SparsePair",
+           "SparseTriple", "model_info", "Environment"]
 __version__ = "22.1.0.0"
 
-from contextlib import closing
-from io import BytesIO
+from contextlib import contextmanager
+import copy
+import importlib
 import os
+import tempfile
+import threading
 import weakref
 
 from .aborter import Aborter
-from . import callbacks
-from . import model_info
 from .exceptions import CplexError, WrongNumberOfArgumentsError
 from ._internal import ProblemType, Environment
-from ._internal._anno import (DoubleAnnotationInterface,
-                              LongAnnotationInterface)
 from ._internal._aux_functions import (init_list_args,
                                        validate_arg_lengths)
+from ._internal._baseinterface import LazyInterface
 from ._internal._matrices import SparsePair, SparseTriple
-from ._internal._subinterfaces import (AdvancedCplexInterface,
-                                       ConflictInterface,
-                                       FeasoptInterface,
-                                       IndicatorConstraintInterface,
+from ._internal._subinterfaces import (IndicatorConstraintInterface,
                                        InitialInterface,
                                        LinearConstraintInterface,
                                        MIPStartsInterface,
@@ -67,15 +64,30 @@ from ._internal._subinterfaces import (AdvancedCplexInterface,
                                        SOSInterface,
                                        VariablesInterface)
 from ._internal import _constants as _const
+from ._internal import _ostream
 from ._internal import _procedural as _proc
-from ._internal._multiobj import MultiObjInterface
 from ._internal._parameter_classes import RootParameterGroup  # noqa: F401
-from ._internal._pwl import PWLConstraintInterface
 from .paramset import ParameterSet
 
 infinity = _const.CPX_INFBOUND
 """See CPX_INFBOUND in the C API."""
 
+# Number of bytes or characters requested per call by
+# Cplex.read_from_stream.
+_READ_CHUNK_SIZE = 1 << 20
+
+# Rarely used modules are only imported when they are first accessed
+# as attributes of the package (e.g., cplex.callbacks).
+_LAZY_MODULES = ("batch", "callbacks", "model_info")
+
+
+def __getattr__(name):
+    """Imports the modules in _LAZY_MODULES on first access."""
+    if name in _LAZY_MODULES:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(
+        __name__, name))
+
 
 class Stats():
     """A class whose data members reflect statistics about a CPLEX
@@ -698,6 +710,46 @@ def _is_special_filetype(filename, filetype, ext):
     return False
 
 
+@contextmanager
+def _problem_file(filetype, comptype):
+    """non-public
+
+    Yields a file descriptor open for writing and a path from which
+    CPLEX can read what was written to it. On Linux, this is an
+    anonymous in-memory file (see os.memfd_create), so no data touches
+    the disk. Elsewhere, or if the data is compressed (CPLEX infers the
+    compression from the file extension), a temporary file is used.
+    """
+    if comptype not in ('', 'bz2', 'gz'):
+        raise ValueError(
+            "invalid compression type specified for comptype: {0}".format(
+                comptype))
+    if (not comptype and hasattr(os, "memfd_create") and
+            os.path.isdir("/proc/self/fd")):
+        fd = os.memfd_create("cplex-problem")
+        try:
+            yield fd, "/proc/self/fd/{0}".format(fd)
+        finally:
+            os.close(fd)
+        return
+    suffix = ".{0}".format(filetype.lower())
+    if comptype:
+        suffix += ".{0}".format(comptype)
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    try:
+        yield fd, path
+    finally:
+        os.close(fd)
+        os.remove(path)
+
+
+def _write_all(fd, data):
+    """non-public"""
+    view = memoryview(data).cast("B")
+    while view:
+        view = view[os.write(fd, view):]
+
+
 def _getcplexstudiodir():
     version, release, modification, _ = __version__.split(".")
     # There is a small oddity in how the environment variable
@@ -752,7 +804,23 @@ class Cplex():
     problem_type = ProblemType()
     """See `ProblemType` """
 
-    def __init__(self, *args):
+    multiobj = LazyInterface("._multiobj", "MultiObjInterface",
+                             """See `MultiObjInterface`""")
+    conflict = LazyInterface("._conflict", "ConflictInterface",
+                             """See `ConflictInterface`""")
+    advanced = LazyInterface("._advanced", "AdvancedCplexInterface",
+                             """See `AdvancedCplexInterface`""")
+    feasopt = LazyInterface("._feasopt", "FeasoptInterface",
+                            """See `FeasoptInterface`""")
+    long_annotations = LazyInterface("._anno", "LongAnnotationInterface",
+                                     """See `LongAnnotationInterface`""")
+    double_annotations = LazyInterface("._anno",
+                                       "DoubleAnnotationInterface",
+                                       """See `DoubleAnnotationInterface`""")
+    pwl_constraints = LazyInterface("._pwl", "PWLConstraintInterface",
+                                    """See `PWLConstraintInterface`""")
+
+    def __init__(self, *args, env=None):
         """Constructor of the Cplex class.
 
         The Cplex constructor accepts four types of argument lists.
@@ -778,6 +846,17 @@ class Cplex():
         object and contains no solution data. Future changes to one do
         not affect the other.
 
+        Each of these forms accepts the optional keyword argument env.
+        If env is given, it must be an `Environment` and the new problem
+        is created in that environment instead of a private one.
+        Problems sharing an environment share its parameters, output
+        streams, and legacy callbacks, and must not be solved
+        concurrently.  Ending such a problem does not close the
+        environment; see `Environment` for its lifetime.
+
+        >>> env = cplex.Environment()  # doctest: +SKIP
+        >>> cpx = cplex.Cplex("filename", env=env)  # doctest: +SKIP
+
         The Cplex object is a context manager and can be used, like so:
 
         >>> import cplex
@@ -792,13 +871,25 @@ class Cplex():
         self._disposed = False
         self._aborter = None
         self._env = None
+        self._owns_env = env is None
         self._lp = None
         self._pslst = []
+        # Per-solve state of the generic callback (see _setup_callbacks).
+        self._generic_num_cols = None
+        self._generic_contexts = {}
+        self._self_proxy = weakref.proxy(self)
+        self._callback_profiling = False
+        self._callback_profile = None
         # Initialize data strucutures associated with CPLEX
         nargs = len(args)
         if nargs > 2:
             raise WrongNumberOfArgumentsError()
-        self._env = Environment()
+        if env is None:
+            env = Environment()
+        elif not isinstance(env, Environment):
+            raise TypeError("invalid env argument: {0}".format(env))
+        env._acquire()
+        self._env = env
         if nargs == 0:
             self._lp = _proc.createprob(self._env._e, "")
         elif nargs == 1:
@@ -820,6 +911,10 @@ class Cplex():
 
         self.parameters = self._env.parameters
         """See `RootParameterGroup`"""
+        if not self._owns_env:
+            # The parameter values are shared, but the tuning methods
+            # need to know which problem they act on.
+            self.parameters = copy.copy(self.parameters)
         self.parameters._cplex = weakref.proxy(self)
 
         self.variables = VariablesInterface(self)
@@ -841,9 +936,6 @@ class Cplex():
         self.objective = ObjectiveInterface(self)
         """See `ObjectiveInterface`"""
 
-        self.multiobj = MultiObjInterface(self)
-        """See `MultiObjInterface`"""
-
         self.MIP_starts = MIPStartsInterface(self)
         """See `MIPStartsInterface`"""
 
@@ -856,27 +948,9 @@ class Cplex():
         self.order = OrderInterface(self)
         """See `OrderInterface`"""
 
-        self.conflict = ConflictInterface(self)
-        """See `ConflictInterface`"""
-
-        self.advanced = AdvancedCplexInterface(self)
-        """See `AdvancedCplexInterface`"""
-
         self.start = InitialInterface(self)
         """See `InitialInterface`"""
 
-        self.feasopt = FeasoptInterface(self)
-        """See `FeasoptInterface`"""
-
-        self.long_annotations = LongAnnotationInterface(self)
-        """See `LongAnnotationInterface`"""
-
-        self.double_annotations = DoubleAnnotationInterface(self)
-        """See `DoubleAnnotationInterface`"""
-
-        self.pwl_constraints = PWLConstraintInterface(self)
-        """See `PWLConstraintInterface`"""
-
     def end(self):
         """Releases the Cplex object.
 
@@ -916,9 +990,11 @@ class Cplex():
         # free parameter sets if necc.
         for ps in self._pslst:
             ps.end()
-        # free env
+        # free env, unless it is shared with other problems
         if self._env:
-            self._env._end()
+            self._env._release()
+            if self._owns_env:
+                self._env._end()
 
     def __del__(self):
         """non-public"""
@@ -970,8 +1046,84 @@ class Cplex():
         >>> out = c.set_log_stream(None)
         >>> c.read("lpex.mps")
         """
+        self._invalidate_name_indices()
         _proc.readcopyprob(self._env._e, self._lp, filename, filetype)
 
+    def read_from_bytes(self, data, filetype='LP', comptype=''):
+        """Reads a problem from a bytes-like object.
+
+        data must be an object supporting the buffer protocol, such as
+        bytes, a bytearray, or a memoryview, that holds a problem in the
+        given file format. The filetype argument can be any of "sav",
+        "lp" (the default), or "mps". If comptype is "bz2" (for BZip2)
+        or "gz" (for GNU Zip), data holds a compressed file. This is the
+        counterpart of `Cplex.write_as_string` and
+        `Cplex.write_to_buffer`.
+
+        On Linux, the data is passed to CPLEX through an in-memory file
+        without being copied in Python, so reading a problem received
+        over the network does not touch the disk.
+
+        See :cpxapi:`CPXreadcopyprob` in the Callable Library Reference
+        Manual for more detail.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> out = c.set_results_stream(None)
+        >>> out = c.set_log_stream(None)
+        >>> c.read_from_bytes(b"Minimize obj: x\\nEnd\\n", "lp")
+        >>> c.variables.get_names()
+        ['x']
+        """
+        with _problem_file(filetype, comptype) as (fd, path):
+            _write_all(fd, data)
+            self._invalidate_name_indices()
+            _proc.readcopyprob(self._env._e, self._lp, path, filetype)
+
+    def read_from_stream(self, stream, filetype='LP', comptype=''):
+        """Reads a problem from a file-like object.
+
+        stream must have a read method. It is read until the end and may
+        return either bytes or, for text formats, strings, which are
+        encoded with the encoding given by the parameter
+        Cplex.parameters.read.fileencoding. For an explanation of the
+        filetype and comptype arguments, see `Cplex.read_from_bytes`.
+        This is the counterpart of `Cplex.write_to_stream`.
+
+        See :cpxapi:`CPXreadcopyprob` in the Callable Library Reference
+        Manual for more detail.
+
+        Example usage:
+
+        >>> import io
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> out = c.set_results_stream(None)
+        >>> out = c.set_log_stream(None)
+        >>> c.read_from_stream(io.StringIO("Minimize obj: x\\nEnd\\n"))
+        >>> c.variables.get_names()
+        ['x']
+        """
+        try:
+            callable(stream.read)
+        except AttributeError:
+            raise CplexError("stream must have a read method")
+        fileenc = None
+        with _problem_file(filetype, comptype) as (fd, path):
+            while True:
+                chunk = stream.read(_READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                if isinstance(chunk, str):
+                    if fileenc is None:
+                        fileenc = self.parameters.read.fileencoding.get()
+                    chunk = chunk.encode(fileenc)
+                _write_all(fd, chunk)
+            self._invalidate_name_indices()
+            _proc.readcopyprob(self._env._e, self._lp, path, filetype)
+
     def write(self, filename, filetype=""):
         """Writes a problem to a file.
 
@@ -1026,7 +1178,8 @@ class Cplex():
         else:
             _proc.writeprob(self._env._e, self._lp, filename, filetype)
 
-    def write_to_stream(self, stream, filetype='LP', comptype=''):
+    def write_to_stream(self, stream, filetype='LP', comptype='',
+                        chunk_size=None):
         """Writes a problem to a file-like object in the given file format.
 
         The filetype argument can be any of "sav" (a binary format), "lp"
@@ -1036,6 +1189,13 @@ class Cplex():
         If comptype is "bz2" (for BZip2) or "gz" (for GNU Zip), a
         compressed file is written.
 
+        By default, stream.write is called for every piece of output
+        that CPLEX produces and stream.flush after each of them. If
+        chunk_size is specified, the output is buffered instead:
+        stream.write is called with chunks of at least chunk_size bytes
+        (except for the last one) and stream.flush is called only once,
+        at the end. This is much faster for large problems.
+
         See :cpxapi:`CPXwriteprob` in the Callable Library Reference
         Manual for more detail.
 
@@ -1065,6 +1225,45 @@ class Cplex():
             callable(stream.flush)
         except AttributeError:
             raise CplexError("stream must have a flush method")
+        if chunk_size is None:
+            self._write_to_device(stream, filetype, comptype)
+        else:
+            writer = _ostream.ChunkedWriter(stream, chunk_size)
+            self._write_to_device(writer, filetype, comptype)
+            writer.finish()
+
+    def write_to_buffer(self, buffer, filetype='LP', comptype=''):
+        """Writes a problem into a pre-allocated buffer.
+
+        buffer must be a writable object supporting the buffer protocol,
+        such as a bytearray or a memoryview. The output is copied into
+        it from the start, without creating an intermediate bytes object
+        for the whole problem. For an explanation of the filetype and
+        comptype arguments, see `Cplex.write_to_stream`.
+
+        Returns the number of bytes written. If the buffer is too small,
+        a CplexError is raised whose message includes the required size;
+        the content of the buffer is undefined in that case.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> indices = c.variables.add(names=['x1', 'x2', 'x3'])
+        >>> buf = bytearray(1 << 20)
+        >>> nbytes = c.write_to_buffer(buf, "lp")
+        >>> bytes(buf[:nbytes]) == c.write_as_string("lp").encode()
+        True
+        """
+        writer = _ostream.BufferWriter(buffer)
+        self._write_to_device(writer, filetype, comptype)
+        if writer.overflowed():
+            raise CplexError(
+                "buffer too small: {0} bytes required".format(writer.nbytes))
+        return writer.nbytes
+
+    def _write_to_device(self, stream, filetype, comptype):
+        """non-public"""
         # Since there is no filename argument, we validate the
         # compression type.
         if comptype not in ('', 'bz2', 'gz'):
@@ -1101,13 +1300,12 @@ class Cplex():
         True
         """
         fileenc = self.parameters.read.fileencoding.get()
-        with closing(BytesIO()) as output:
-            self.write_to_stream(output, filetype, comptype)
-            result = output.getvalue()
-            # Never decode for SAV format nor compressed files.
-            if not (filetype.lower().startswith("sav") or comptype):
-                result = result.decode(fileenc)
-            return result
+        writer = _ostream.ByteArrayWriter()
+        self._write_to_device(writer, filetype, comptype)
+        # Never decode for SAV format nor compressed files.
+        if filetype.lower().startswith("sav") or comptype:
+            return bytes(writer.data)
+        return writer.data.decode(fileenc)
 
     def read_annotations(self, filename):
         """Reads annotations from a file.
@@ -1243,6 +1441,16 @@ class Cplex():
         else:
             _proc.chgprobtypesolnpool(self._env._e, self._lp, type, soln)
 
+    def _invalidate_name_indices(self):
+        """non-public"""
+        for name in ("variables", "linear_constraints",
+                     "quadratic_constraints", "indicator_constraints",
+                     "SOS", "pwl_constraints"):
+            # Interfaces that were never created have nothing to clear.
+            iface = self.__dict__.get(name)
+            if iface is not None:
+                iface._invalidate_names()
+
     def _is_MIP(self):
         """non-public"""
         probtype = self.get_problem_type()
@@ -1252,11 +1460,86 @@ class Cplex():
 
     def _setup_callbacks(self):
         """non-public"""
+        self._generic_num_cols = _proc.getnumcols(self._env._e, self._lp)
+        self._generic_contexts = {}
+        if self._callback_profiling:
+            from . import callbacks
+            self._callback_profile = callbacks.CallbackProfile()
+        else:
+            self._callback_profile = None
+        for cb in self._env._callbacks:
+            # Legacy callbacks time themselves while this is set; see
+            # callbacks._profiled_call.
+            cb._callback_profile = self._callback_profile
+            cb._profile_name = "legacy." + cb._cb_type_string
+        snapshot = None
         for cb in self._env._callbacks:
             cb._env_lp_ptr = self._env_lp_ptr
+            if cb.use_snapshot:
+                if snapshot is None:
+                    from . import callbacks
+                    snapshot = callbacks._ProblemSnapshot(self._env._e,
+                                                          self._lp)
+                cb._snapshot = snapshot
+            else:
+                cb._snapshot = None
             if hasattr(cb, "_setup"):
                 cb._setup(self._env._e, self._lp)
 
+    def _finish_callbacks(self):
+        """non-public
+
+        Counterpart of _setup_callbacks, called when the optimization
+        returns.
+        """
+        if self._callback_profile is not None:
+            self._callback_profile._stop()
+            for cb in self._env._callbacks:
+                cb._callback_profile = None
+
+    def set_callback_profiling(self, enabled=True):
+        """Enables or disables the profiling of callbacks.
+
+        If enabled, the time spent in the generic callback and in the
+        legacy callbacks is recorded for every subsequent optimization
+        (e.g., `solve()`). The report of the most recent optimization is
+        returned by `get_callback_profile()`. Profiling adds a small
+        overhead to each callback invocation.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> c.set_callback_profiling(True)
+        >>> c.get_callback_profile() is None
+        True
+        """
+        self._callback_profiling = bool(enabled)
+
+    def get_callback_profile(self):
+        """Returns the callback profile of the most recent optimization.
+
+        The result is a `callbacks.CallbackProfile` instance with
+        invocation counts, total, mean, percentile, and maximum
+        latencies, and the time spent in name conversion for each kind of
+        callback, or None if profiling was not enabled with
+        `set_callback_profiling()` for that optimization.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> out = c.set_results_stream(None)
+        >>> out = c.set_log_stream(None)
+        >>> c.read("lpex.mps")
+        >>> c.set_callback_profiling(True)
+        >>> c.solve()
+        >>> profile = c.get_callback_profile()
+        >>> profile.get_callback_time()
+        0
+        """
+        return self._callback_profile
+
     def solve(self, paramsets=None):
         """Solves the problem.
 
@@ -1286,6 +1569,13 @@ class Cplex():
         """
         (paramsets,) = init_list_args(paramsets)
         self._setup_callbacks()
+        try:
+            self._solve(paramsets)
+        finally:
+            self._finish_callbacks()
+
+    def _solve(self, paramsets):
+        """non-public"""
         ismultiobj = _proc.ismultiobj(self._env._e, self._lp)
         if (not ismultiobj and paramsets):
             raise ValueError("paramsets argument can only be specified"
@@ -1327,7 +1617,10 @@ class Cplex():
         memory.
         """
         self._setup_callbacks()
-        _proc.runseeds(self._env._e, self._lp, cnt)
+        try:
+            _proc.runseeds(self._env._e, self._lp, cnt)
+        finally:
+            self._finish_callbacks()
 
     def populate_solution_pool(self):
         """Generates a variety of solutions to a discrete problem (MIP, MIQP, MIQCP).
@@ -1348,7 +1641,10 @@ class Cplex():
         in the CPLEX User's Manual.
         """
         self._setup_callbacks()
-        _proc.populate(self._env._e, self._lp)
+        try:
+            _proc.populate(self._env._e, self._lp)
+        finally:
+            self._finish_callbacks()
 
     def get_problem_name(self):
         """Returns the problem name.
@@ -1752,6 +2048,20 @@ class Cplex():
         exception. Any exception raised from the callback in this context
         will just be ignored.
 
+        Note about threads: with parallel optimization, CPLEX invokes
+        the callback concurrently from its worker threads, and the
+        Python API does not serialize these invocations. However, Python
+        code (including the methods of `cplex.callbacks.Context`, which
+        call into CPLEX) only runs while the calling thread holds the
+        global interpreter lock. Callbacks therefore scale with the
+        number of threads only to the extent that they spend their time
+        in code that releases the lock, such as NumPy operations on
+        large arrays. To keep the time spent holding the lock short,
+        fetch solution vectors with the `out` argument of the
+        `cplex.callbacks.Context` getters, submit cuts through a
+        `cplex.callbacks.CutPool`, and use `set_callback_profiling()`
+        to measure where the time goes.
+
         See `cplex.callbacks.Context`.
 
         See :cpxapi:`CPXcallbacksetfunc` in the Callable Library
@@ -1791,15 +2101,47 @@ class Cplex():
         # This is invoked by the cpxpygenericcallbackfuncwrap() trampoline
         # function in the native code and is responsible for invoking the
         # user callback.
-        context = callbacks.Context(weakref.proxy(self), contextptr, contextid)
-        if context.get_id() == callbacks.Context.id.thread_down:
+        profile = self._callback_profile
+        if profile is None:
+            self._dispatch_generic_callback(contextptr, contextid)
+        else:
+            from .callbacks import _GENERIC_PROFILE_KEYS
+            name = _GENERIC_PROFILE_KEYS.get(contextid)
+            if name is None:
+                name = "generic.{0}".format(contextid)
+            profile._time_call(name, self._dispatch_generic_callback,
+                               contextptr, contextid)
+
+    def _dispatch_generic_callback(self, contextptr, contextid):
+        """non-public"""
+        # Contexts are pooled per thread (and per solve, see
+        # _setup_callbacks), so a hot callback does not allocate a new
+        # Context and weak proxy on every invocation.
+        contexts = self._generic_contexts
+        ident = threading.get_ident()
+        context = contexts.get(ident)
+        if context is None:
+            from . import callbacks
+            if self._callback_profile is None:
+                context_class = callbacks.Context
+            else:
+                context_class = callbacks._ProfiledContext
+            context = contexts[ident] = context_class(
+                self._self_proxy, contextptr, contextid)
+        else:
+            context._reset(contextptr, contextid)
+        if contextid == _const.CPX_CALLBACKCONTEXT_THREAD_DOWN:
             # For thread_down we ignore any exception
             try:
                 self._genericcallback.invoke(context)
             except:  # noqa: E722
                 pass
+            # The thread is done with this solve; drop its context.
+            contexts.pop(ident, None)
         else:
             self._genericcallback.invoke(context)
+            if context._cut_pool is not None:
+                context._cut_pool._submit_pending()
 
     def set_modeling_assistance_callback(self, functor=None):
         """Set callback function to use for modeling assistance warnings.
@@ -2109,6 +2451,7 @@ class Cplex():
         if nmatind > 0 and nmatind != nnz:
             raise CplexError(
                 "inconsistent arguments: len(matind) != sum(matcnt)")
+        self._invalidate_name_indices()
         _proc.copylpwnames(self._env._e, self._lp, numcols, numrows,
                            objsense, obj, rhs, senses,
                            matbeg, matcnt, matind, matval,
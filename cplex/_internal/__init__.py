@@ -13,7 +13,9 @@
 
 
 """
+import importlib
 import sys
+import threading
 
 from . import _aux_functions
 from . import _baseinterface
@@ -22,29 +24,39 @@ from . import _ostream
 from . import _procedural
 from . import _constants
 from . import _matrices
-from . import _multiobj
-from . import _multiobjsoln
 from . import _parameter_classes
 from . import _parameter_hierarchy
 from . import _subinterfaces
 from . import _pycplex
 from . import _parameters_auto
-from . import _anno
-from . import _pwl
-from . import _constantsenum
-from . import _callbackinfoenum
-from . import _solutionstrategyenum
 from ..exceptions import CplexError
 from ..constant_class import ConstantClass
 
 __all__ = ["Environment", "_aux_functions", "_baseinterface",
            "_list_array_utils", "_ostream", "_procedural",
            "_constants", "_matrices", "_multiobj", "_multiobjsoln",
+           "_conflict", "_feasopt", "_advanced",
            "_parameter_classes", "_subinterfaces", "_pycplex",
            "_parameters_auto", "_anno", "_pwl", "ProblemType",
            "_constantsenum", "_callbackinfoenum",
            "_solutionstrategyenum"]
 
+# These modules are only needed by the legacy callbacks, the
+# multi-objective, conflict, feasopt, and advanced interfaces,
+# annotations, and PWL constraints.  They are imported when first
+# accessed.
+_LAZY_MODULES = ("_multiobj", "_multiobjsoln", "_conflict", "_feasopt",
+                 "_advanced", "_anno", "_pwl", "_constantsenum",
+                 "_callbackinfoenum", "_solutionstrategyenum")
+
+
+def __getattr__(name):
+    """Imports the modules in _LAZY_MODULES on first access."""
+    if name in _LAZY_MODULES:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(
+        __name__, name))
+
 
 class ProblemType(ConstantClass):
     """Types of problems the Cplex object can encapsulate.
@@ -115,7 +127,27 @@ def _checkcbcls(obj):
 
 
 class Environment():
-    """non-public"""
+    """A CPLEX environment.
+
+    Every `Cplex` object creates its own environment unless an existing
+    one is passed as the env argument of its constructor.  Problems
+    that share an environment also share its parameters, output
+    streams, and registered legacy callbacks.
+
+    An environment passed to `Cplex` is owned by the caller: ending
+    one of the problems does not close it.  It is closed by calling
+    `end()` once all problems using it have been ended, or when it is
+    garbage collected.  An environment can also be used as a context
+    manager.
+
+    Example usage:
+
+    >>> import cplex
+    >>> with cplex.Environment() as env:
+    ...     with cplex.Cplex(env=env) as c1, cplex.Cplex(env=env) as c2:
+    ...         c1.parameters is not c2.parameters
+    True
+    """
     RESULTS_CHNL_IDX = 0
     WARNING_CHNL_IDX = 1
     ERROR_CHNL_IDX = 2
@@ -133,6 +165,9 @@ class Environment():
         self._callback_exception = None
         self._callbacks = []
         self._disposed = False
+        # Number of Cplex objects currently using the environment.
+        self._refcount = 0
+        self._refcount_lock = threading.Lock()
         # Initialize data strucutures associated with CPLEX
         self._e = _procedural.openCPLEX()
         self.parameters = _parameter_classes.RootParameterGroup(
@@ -161,6 +196,41 @@ class Environment():
         """non-public"""
         self._end()
 
+    def __enter__(self):
+        """Enter the runtime context related to this object."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exit the runtime context related to this object.
+
+        The environment is ended (see `end()`).
+        """
+        self.end()
+
+    def end(self):
+        """Closes the environment.
+
+        Raises a CplexError if a `Cplex` object that has not been ended
+        is still using the environment.
+        """
+        if self._refcount > 0:
+            raise CplexError(
+                "environment is still used by {0} problem(s)".format(
+                    self._refcount))
+        self._end()
+
+    def _acquire(self):
+        """non-public"""
+        with self._refcount_lock:
+            if self._disposed:
+                raise CplexError("environment has already been ended")
+            self._refcount += 1
+
+    def _release(self):
+        """non-public"""
+        with self._refcount_lock:
+            self._refcount -= 1
+
     def _get_num_delete(self):
         """Count the callbacks that are installed and require a delete
         callback.
@@ -0,0 +1,156 @@
+# --------------------------------------------------------------------------
+# File: _advanced.py
+# ---------------------------------------------------------------------------
+# Licensed Materials - Property of IBM
+# 5725-A06 5725-A29 5724-Y48 5724-Y49 5724-Y54 5724-Y55 5655-Y21
+# Copyright IBM Corporation 2008, 2022. All Rights Reserved.
+#
+# US Government Users Restricted Rights - Use, duplication or
+# disclosure restricted by GSA ADP Schedule Contract with
+# IBM Corp.
+# ------------------------------------------------------------------------
+"""Advanced API"""
+from . import _constants
+from . import _procedural as CPX_PROC
+from ._baseinterface import BaseInterface
+from ._aux_functions import listify, unzip
+from ..exceptions import CplexSolverError
+from ..constant_class import ConstantClass
+
+
+class PivotVarStatus(ConstantClass):
+    """Use as input to pivoting methods."""
+    at_lower_bound = _constants.CPX_AT_LOWER
+    at_upper_bound = _constants.CPX_AT_UPPER
+
+
+class AdvancedCplexInterface(BaseInterface):
+    """Advanced control of a Cplex object."""
+
+    no_variable = _constants.CPX_NO_VARIABLE
+    """See `_constants.CPX_NO_VARIABLE` """
+    variable_status = PivotVarStatus()
+    """See `PivotVarStatus()` """
+
+    def delete_names(self):
+        """Deletes all names from the problem and its objects."""
+        self._cplex._invalidate_name_indices()
+        CPX_PROC.delnames(self._env._e, self._cplex._lp)
+
+    def basic_presolve(self):
+        """Performs bound strengthening and detects redundant rows.
+
+        Returns a tuple containing three lists: a list containing the
+        strengthened lower bounds, a list containing the strengthened
+        upper bounds, and a list containing the status of each row.
+
+        See :cpxapi:`CPXbasicpresolve` in the Callable Library Reference
+        Manual.
+
+        Note
+          This method does not create a presolved problem.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> out = c.set_results_stream(None)
+        >>> out = c.set_log_stream(None)
+        >>> c.read("lpex.mps")
+        >>> redlb, redub, rstat = c.advanced.basic_presolve()
+        """
+        return CPX_PROC.basicpresolve(self._env._e, self._cplex._lp)
+
+    def pivot(self, enter, leave, status):
+        """Pivots a variable into the basis.
+
+        enter is a name or index of a variable or linear constraint.
+        The index of a slack variable is specified by a negative
+        integer; -i - 1 refers to the slack associated with the ith
+        linear constraint.  enter must not identify a basic variable.
+
+        leave is a name or index of a variable or linear constraint.
+        The index of a slack variable is specified by a negative
+        integer; -i - 1 refers to the slack associated with the ith
+        linear constraint.  leave must identify either a basic
+        variable or a non-basic variable with both a lower and upper
+        bound to indicate that it is to move to its opposite bound.
+        leave may also be set to Cplex.advanced.no_variable to
+        instruct CPLEX to use a ratio test to determine the entering
+        variable.
+
+        Note
+          If a linear constraint has the same name as a column, it must
+          be specified by -index - 1, not by name.
+
+        status must be an attribute of Cplex.advanced.variable_status
+        specifying the nonbasic status to be assigned to the leaving
+        variable after the basis change.
+
+        """
+        def conv(var):
+            try:
+                return self._cplex.variables._conv(var)
+            except CplexSolverError:
+                # Variable name not found, try linear constraints.
+                return -self._cplex.linear_constraints._conv(var) - 1
+        CPX_PROC.pivot(self._env._e, self._cplex._lp, conv(enter),
+                       conv(leave), status)
+
+    def pivot_slacks_in(self, which):
+        """Forcibly pivots slack variables into the basis.
+
+        which may be either a single linear constraint index or name
+        or a sequence of linear constraint indices or names.
+
+        """
+        x = listify(self._cplex.linear_constraints._conv(which))
+        CPX_PROC.pivotin(self._env._e, self._cplex._lp, x)
+
+    def pivot_fixed_variables_out(self, which):
+        """Forcibly pivots structural variables out of the basis.
+
+        which may be either a single variable index or name or a
+        sequence of variable indices or names.
+
+        """
+        x = listify(self._cplex.variables._conv(which))
+        CPX_PROC.pivotout(self._env._e, self._cplex._lp, x)
+
+    def strong_branching(self, variables, it_limit):
+        """Performs strong branching.
+
+        variables is a sequence of names or indices of variables.
+
+        it_limit is an integer that specifies the number of iterations
+        allowed.
+
+        Returns a list of pairs (down_penalty, up_penalty) with the
+        same length as variables containing the penalties for
+        branching down or up, respectively, on each variable.
+
+        See :cpxapi:`CPXstrongbranch` in the Callable Library Reference
+        Manual for more detail.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> out = c.set_results_stream(None)
+        >>> out = c.set_log_stream(None)
+        >>> itlim = c.parameters.simplex.limits.iterations.get()
+        >>> c.read("example.mps")
+        >>> c.solve()
+        >>> vars = list(range(c.variables.get_num()))
+        >>> result = c.advanced.strong_branching(vars, itlim)
+        """
+        def conv(var):
+            return self._cplex.variables._conv(var)
+        return unzip(CPX_PROC.strongbranch(
+            self._env._e, self._cplex._lp,
+            conv(variables), it_limit))
+
+    def complete(self):
+        """See :cpxapi:`CPXcompletelp` in the Callable Library Reference
+        Manual."""
+        CPX_PROC.completelp(self._env._e, self._cplex.lp)
@@ -14,12 +14,14 @@ try:
     import collections.abc as collections_abc  # For Python >= 3.3
 except ImportError:
     import collections as collections_abc
+import array
 import functools
 import inspect
 import itertools
 import os
 import warnings
 
+from . import _list_array_utils as LAU
 from ..exceptions import CplexError, WrongNumberOfArgumentsError
 
 CPLEX_PY_DISABLE_NAME_CONV = os.getenv("CPLEX_PY_DISABLE_NAME_CONV")
@@ -156,6 +158,53 @@ def apply_freeform_two_args(fn, conv, args, unpack_single=True):
     raise WrongNumberOfArgumentsError()
 
 
+def apply_freeform_two_args_into(fn, conv, maxval, args, out=None,
+                                 allocate=None):
+    """non-public
+
+    Like `apply_freeform_two_args`, but writes the results into a buffer
+    of float64 values rather than building lists.
+
+    fn(begin, end, buf) must copy the values for the range begin to end
+    into the buffer buf. maxval is the number of items used when args is
+    empty. If out is None, the buffer is obtained by calling
+    allocate(length), or is a new array.array('d') if allocate is None.
+    Returns the filled buffer.
+    """
+    if conv is None:
+        conv = identity
+    nargs = len(args)
+    if nargs == 2:
+        conarg0, conarg1 = (conv(args[0]), conv(args[1]))
+        if not (isinstance(conarg0, int) and isinstance(conarg1, int)):
+            raise TypeError("expecting names or indices")
+        ranges = [(conarg0, conarg1)]
+    elif nargs == 1:
+        if isinstance(args[0], (list, tuple)):
+            ranges = list(make_ranges(conv(args[0])))
+        else:
+            conarg0 = conv(args[0])
+            if not isinstance(conarg0, int):
+                raise TypeError("expecting name or index")
+            ranges = [(conarg0, conarg0)]
+    elif nargs == 0:
+        ranges = [(0, maxval - 1)]
+    else:
+        raise WrongNumberOfArgumentsError()
+    length = sum(max(j - i + 1, 0) for i, j in ranges)
+    if out is None:
+        if allocate is None:
+            allocate = LAU.new_double_buffer
+        out = allocate(length)
+    view = LAU.double_buffer_view(out, length)
+    pos = 0
+    for i, j in ranges:
+        count = max(j - i + 1, 0)
+        fn(i, j, view[pos:pos + count])
+        pos += count
+    return out
+
+
 def apply_freeform_one_arg(fn, conv, maxval, args):
     """non-public"""
     if conv is None:
@@ -214,6 +263,36 @@ def delete_set_by_range(fn, conv, max_num, *args):
         raise WrongNumberOfArgumentsError()
 
 
+def delete_set_with_remap(fn, indices, max_num):
+    """non-public
+
+    Deletes the objects with the given indices (in any order, possibly
+    with duplicates) out of max_num objects. fn(begin, end) must delete
+    an inclusive range; it is called once per maximal contiguous range,
+    from the last range to the first.
+
+    Returns an array('i') of length max_num that maps every old index to
+    its new index, or to -1 if the object was deleted.
+    """
+    indices = sorted(set(indices))
+    if indices and (indices[0] < 0 or indices[-1] >= max_num):
+        bad = indices[0] if indices[0] < 0 else indices[-1]
+        raise CplexError("index out of range: {0}".format(bad))
+    ranges = list(make_ranges(indices))
+    remap = array.array("i")
+    removed = 0
+    kept = 0  # first index after the previous range
+    for begin, end in ranges:
+        remap.extend(range(kept - removed, begin - removed))
+        remap.extend(array.array("i", [-1]) * (end - begin + 1))
+        removed += end - begin + 1
+        kept = end + 1
+    remap.extend(range(kept - removed, max_num - removed))
+    for begin, end in reversed(ranges):
+        fn(begin, end)
+    return remap
+
+
 class _group():
     """Object to contain constraint groups"""
 
@@ -234,8 +313,130 @@ class _group():
         return str(self._gp)
 
 
+class _array_group():
+    """Object to contain constraint groups in compact form
+
+    This is the array counterpart of _group. Group i has the preference
+    pref[i] and contains the constraints whose types and indices are
+    given by types[j] and ind[j] for j between beg[i] (inclusive) and
+    beg[i + 1] (exclusive; len(ind) for the last group).
+    """
+
+    def __init__(self, pref, beg, ind, types):
+        """Constructor for the _array_group object
+
+        pref, beg, and ind must be array.array objects with typecodes
+        "d", "q", and "i", respectively. types must be a bytearray.
+        """
+        self._pref = pref
+        self._beg = beg
+        self._ind = ind
+        self._types = types
+
+    @property
+    def _gp(self):
+        """The groups as a list of tuples, as in _group."""
+        ends = self._beg[1:].tolist() + [len(self._ind)]
+        return [(pref, tuple(zip(self._types[begin:end],
+                                 self._ind[begin:end])))
+                for pref, begin, end in zip(self._pref, self._beg, ends)]
+
+    def __len__(self):
+        return len(self._pref)
+
+    def __str__(self):
+        return str(self._gp)
+
+
+def array_group_from_arrays(pref, beg, ind, types):
+    """Returns an _array_group object for user-supplied arrays
+
+    pref, beg, ind and types may be any sequences or objects supporting
+    the buffer protocol. A trailing entry of beg equal to len(ind) is
+    accepted and ignored.
+    """
+    pref = array.array("d", pref)
+    beg = array.array("q", beg)
+    ind = array.array("i", ind)
+    if not isinstance(types, (bytes, bytearray)):
+        # Converted item by item: bytearray() would copy the raw bytes
+        # of buffers with wider items (e.g., array('i') or int64 NumPy
+        # arrays).
+        types = (int(t) for t in types)
+    types = bytearray(types)
+    if len(beg) == len(pref) + 1 and beg[-1] == len(ind):
+        del beg[-1]
+    if len(beg) != len(pref):
+        raise CplexError("inconsistent argument lengths: pref, beg")
+    if len(types) != len(ind):
+        raise CplexError("inconsistent argument lengths: ind, types")
+    if beg and (beg[0] != 0 or
+                any(a > b for a, b in zip(beg, beg[1:])) or
+                beg[-1] > len(ind)):
+        raise CplexError("beg must be nondecreasing, start at 0, and not"
+                         " exceed len(ind)")
+    return _array_group(pref, beg, ind, types)
+
+
+def concat_groups(groups):
+    """Concatenates _array_group objects into a single one"""
+    pref = array.array("d")
+    beg = array.array("q")
+    ind = array.array("i")
+    types = bytearray()
+    for group in groups:
+        _append_group(pref, beg, ind, types, group)
+    return _array_group(pref, beg, ind, types)
+
+
+def _append_group(pref, beg, ind, types, group):
+    """non-public"""
+    offset = len(ind)
+    pref.extend(group._pref)
+    if offset == 0:
+        beg.extend(group._beg)
+    else:
+        beg.extend(b + offset for b in group._beg)
+    ind.extend(group._ind)
+    types.extend(group._types)
+
+
+def separate_groups(groups, getconvfunc):
+    """Flattens constraint groups into the arrays passed to CPLEX
+
+    groups is a sequence of _array_group objects, _group objects, and
+    tuples of length two (preference, ((type, id), ...)). getconvfunc
+    must return the name conversion function for a constraint type.
+
+    Returns grppref, grpbeg, grpind, and grptype, in order. If there
+    are no groups, these are empty lists.
+    """
+    pref = array.array("d")
+    beg = array.array("q")
+    ind = array.array("i")
+    types = bytearray()
+    for group in groups:
+        if isinstance(group, _array_group):
+            _append_group(pref, beg, ind, types, group)
+            continue
+        if isinstance(group, _group):
+            tuples = group._gp
+        else:
+            tuples = [group]
+        for grppref, cons in tuples:
+            pref.append(grppref)
+            beg.append(len(ind))
+            for contype, conid in cons:
+                types.append(contype)
+                ind.append(getconvfunc(contype)(conid))
+    if not pref:
+        return [], [], [], []
+    # The SWIG wrappers take the constraint types as a list.
+    return pref, beg, ind, list(types)
+
+
 def make_group(conv, max_num, c_type, *args):
-    """Returns a _group object
+    """Returns an _array_group object
 
     input:
     conv    - a function that will convert names to indices
@@ -256,11 +457,11 @@ def make_group(conv, max_num, c_type, *args):
     indices is passed in, all of their constraints/bounds will be
     included.
 
-    See example usage in _subinterfaces.ConflictInterface.
+    See example usage in _conflict.ConflictInterface.
     """
     nargs = len(args)
     if nargs <= 1:
-        cons = list(range(max_num))
+        cons = range(max_num)
     if nargs == 0:
         weight = 1.0
     else:
@@ -269,8 +470,13 @@ def make_group(conv, max_num, c_type, *args):
         weight = args[0]
         cons = listify(conv(args[1]))
     elif nargs == 3:
-        cons = list(range(conv(args[1]), conv(args[2]) + 1))
-    return _group([(weight, ((c_type, i),)) for i in cons])
+        cons = range(conv(args[1]), conv(args[2]) + 1)
+    # Every constraint forms a group of its own.
+    ind = array.array("i", cons)
+    num = len(ind)
+    return _array_group(array.array("d", [weight]) * num,
+                        array.array("q", range(num)), ind,
+                        bytearray([c_type]) * num)
 
 
 def init_list_args(*args):
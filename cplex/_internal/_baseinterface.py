@@ -10,18 +10,114 @@
 # IBM Corp.
 # ------------------------------------------------------------------------
 """Base-interface of the CPLEX API"""
+import array
+import bisect
+import importlib
 import weakref
 from . import _aux_functions as _aux
+from ..exceptions import CplexSolverError, error_codes
+
+# Interfaces without a persistent name index look up each name
+# separately in get_indices_array unless there are more than
+# 1/_BULK_LOOKUP_RATIO as many names as objects.
+_BULK_LOOKUP_RATIO = 4
+
+
+class _NameIndex(dict):
+    """non-public
+
+    Dictionary mapping names to indices that also keeps the reverse
+    mapping, so that the entry of a renamed object can be found without
+    scanning the whole index.  Lookups are plain dict lookups; only the
+    methods that modify the dictionary are overridden.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._names = {}
+
+    def name_of(self, idx):
+        """Returns the name recorded for idx, or None."""
+        return self._names.get(idx)
+
+    def _forget(self, name, idx):
+        if self._names.get(idx) == name:
+            del self._names[idx]
+
+    def __setitem__(self, name, idx):
+        old = self.get(name)
+        if old is not None:
+            self._forget(name, old)
+        super().__setitem__(name, idx)
+        self._names[idx] = name
+
+    def __delitem__(self, name):
+        idx = self[name]
+        super().__delitem__(name)
+        self._forget(name, idx)
+
+    def pop(self, name, *default):
+        if name in self:
+            idx = self[name]
+            del self[name]
+            return idx
+        return super().pop(name, *default)
+
+    def setdefault(self, name, idx=None):
+        if name not in self:
+            self[name] = idx
+        return self[name]
+
+    def update(self, *args, **kwargs):
+        for name, idx in dict(*args, **kwargs).items():
+            self[name] = idx
+
+    def clear(self):
+        super().clear()
+        self._names.clear()
+
+
+class LazyInterface():
+    """non-public
+
+    Descriptor for a sub-interface that is only imported and created
+    when it is first accessed.  The created interface is stored in the
+    instance dictionary, so later lookups do not go through the
+    descriptor at all.
+    """
+
+    def __init__(self, module, classname, doc=None):
+        self._module = module
+        self._classname = classname
+        self._name = None
+        self.__doc__ = doc
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        module = importlib.import_module(self._module, __package__)
+        iface = getattr(module, self._classname)(instance)
+        instance.__dict__[self._name] = iface
+        return iface
 
 
 class BaseInterface():
     """Common methods for sub-interfaces."""
 
-    def __init__(self, cplex, advanced=False, getindexfunc=None):
+    def __init__(self, cplex, advanced=False, getindexfunc=None,
+                 nameindex=False):
         """Creates a new BaseInterface.
 
         This class is not meant to be instantiated directly nor used
         externally.
+
+        If nameindex is True, name-to-index lookups are memoized in a
+        dictionary that lives as long as the interface.  Subclasses that
+        enable it are responsible for keeping it up to date when objects
+        are added, deleted, or renamed.
         """
         if advanced:
             self._cplex = cplex
@@ -29,11 +125,144 @@ class BaseInterface():
             self._cplex = weakref.proxy(cplex)
         self._env = weakref.proxy(cplex._env)
         self._get_index_function = getindexfunc
+        self._name_index = _NameIndex() if nameindex else None
+        self._name_index_complete = False
 
     def _conv(self, name, cache=None):
         """Converts from names to indices as necessary."""
+        if cache is None:
+            cache = self._name_index
         return _aux.convert(name, self._get_index, cache)
 
+    def _lookup_index(self, name):
+        """non-public"""
+        if self._name_index is None:
+            return self._get_index(name)
+        # pylint: disable=protected-access
+        return _aux._cachelookup(name, self._get_index, self._name_index)
+
+    def _invalidate_names(self):
+        """non-public"""
+        if self._name_index is not None:
+            self._name_index.clear()
+        self._name_index_complete = False
+
+    def _names_added(self, indices, names):
+        """non-public
+
+        Records the names of newly added objects in the name index.
+        This is only done if the index holds every name; otherwise an
+        older object that was never looked up may have the same name,
+        so the lookup is left to CPLEX.
+        """
+        index = self._name_index
+        if (index is None or not self._name_index_complete or
+                len(names) == 0):
+            return
+        for idx, name in zip(indices, names):
+            if isinstance(name, str) and name:
+                index.setdefault(name, idx)
+
+    def _names_changed(self, indices, names):
+        """non-public
+
+        Drops stale entries from the name index after a rename.
+        """
+        self._name_index_complete = False
+        index = self._name_index
+        if not index:
+            return
+        for idx in indices:
+            name = index.name_of(idx)
+            if name is not None:
+                del index[name]
+        for name in names:
+            index.pop(name, None)
+
+    def _names_deleted(self, ranges):
+        """non-public
+
+        Shifts the entries of the name index after the objects in ranges
+        have been deleted.  ranges is a sequence of disjoint, inclusive
+        (begin, end) pairs expressed in the indices from before the
+        deletion.
+        """
+        index = self._name_index
+        if not index or not ranges:
+            return
+        self._name_index_complete = False
+        ranges = sorted(ranges)
+        begins = [begin for begin, _ in ranges]
+        removed = [0]
+        for begin, end in ranges:
+            removed.append(removed[-1] + end - begin + 1)
+        remapped = {}
+        for name, idx in index.items():
+            pos = bisect.bisect_right(begins, idx)
+            if pos > 0 and idx <= ranges[pos - 1][1]:
+                continue
+            remapped[name] = idx - removed[pos]
+        index.clear()
+        index.update(remapped)
+
+    def _load_name_index(self):
+        """non-public
+
+        Returns a dictionary mapping every name of the interface to its
+        index, built from a single query of all names.
+        """
+        if self._name_index_complete:
+            return self._name_index
+        index = {}
+        if self.get_num() > 0:
+            for idx, name in enumerate(self.get_names()):
+                if name:
+                    index.setdefault(name, idx)
+        if self._name_index is not None:
+            self._name_index.clear()
+            self._name_index.update(index)
+            self._name_index_complete = True
+            return self._name_index
+        return index
+
+    def _delete_set(self, fn, *args):
+        """non-public
+
+        Wraps `delete_set_by_range` so that the name index follows the
+        deletion.
+        """
+        if self._name_index is None:
+            _aux.delete_set_by_range(fn, self._conv, self.get_num(), *args)
+            return
+        deleted = []
+
+        def _delete(begin, end=None):
+            fn(begin, end)
+            deleted.append((begin, end))
+        try:
+            _aux.delete_set_by_range(_delete, self._conv, self.get_num(),
+                                     *args)
+        finally:
+            self._names_deleted(deleted)
+
+    def _delete_with_remap(self, fn, indices):
+        """non-public
+
+        Wraps `delete_set_with_remap` so that the name index follows the
+        deletion.
+        """
+        indices = _aux.listify(self._conv(indices))
+        deleted = []
+
+        def _delete(begin, end):
+            fn(begin, end)
+            deleted.append((begin, end))
+        try:
+            return _aux.delete_set_with_remap(_delete, indices,
+                                              self.get_num())
+        finally:
+            self._names_deleted(deleted)
+
     @staticmethod
     def _add_iter(getnumfun, addfun, *args, **kwargs):
         """non-public"""
@@ -78,5 +307,82 @@ class BaseInterface():
         if self._get_index_function is None:
             raise NotImplementedError("This is not an indexed interface")
         if isinstance(name, str):
-            return self._get_index(name)
-        return [self._get_index(x) for x in name]
+            return self._lookup_index(name)
+        return [self._lookup_index(x) for x in name]
+
+    def get_indices_array(self, names, with_missing=False):
+        """Converts a sequence of names to indices in bulk.
+
+        names may be any iterable of strings (e.g., a list or a NumPy
+        array of strings).  Unless names is short compared to the number
+        of objects, all names of the interface are queried at once
+        rather than one at a time, which makes this method much faster
+        than `get_indices` for long sequences.
+
+        Returns an array.array of type 'i' (32-bit integers) containing
+        the index of each name.  If with_missing is False (the default),
+        an exception is raised for the first name that does not exist,
+        as with `get_indices`.  If with_missing is True, a tuple
+        (indices, missing) is returned instead, where missing is an
+        array.array of type 'b' holding 1 for each name that was not
+        found and 0 otherwise; the index of a missing name is -1.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> indices = c.variables.add(names=["a", "b", "c"])
+        >>> c.variables.get_indices_array(["c", "a"]).tolist()
+        [2, 0]
+        >>> idx, missing = c.variables.get_indices_array(
+        ...     ["b", "z"], with_missing=True)
+        >>> idx.tolist(), missing.tolist()
+        ([1, -1], [0, 1])
+        """
+        if self._get_index_function is None:
+            raise NotImplementedError("This is not an indexed interface")
+        if self._name_index is None:
+            # Without a persistent index, loading all names costs
+            # O(get_num()) on every call.
+            if not hasattr(names, "__len__"):
+                names = list(names)
+            if len(names) * _BULK_LOOKUP_RATIO < self.get_num():
+                return self._get_indices_each(names, with_missing)
+        index = self._load_name_index()
+        result = array.array("i")
+        missing = array.array("b")
+        if with_missing:
+            for name in names:
+                idx = index.get(name, -1)
+                result.append(idx)
+                missing.append(idx < 0)
+            return result, missing
+        for name in names:
+            try:
+                result.append(index[name])
+            except KeyError:
+                # Let CPLEX raise the usual error for unknown names.
+                result.append(self._get_index(name))
+        return result
+
+    def _get_indices_each(self, names, with_missing):
+        """non-public
+
+        Implements `get_indices_array` with one CPLEX lookup per name.
+        """
+        result = array.array("i")
+        if not with_missing:
+            for name in names:
+                result.append(self._get_index(name))
+            return result
+        missing = array.array("b")
+        for name in names:
+            try:
+                idx = self._get_index(name)
+            except CplexSolverError as cse:
+                if cse.args[2] != error_codes.CPXERR_NAME_NOT_FOUND:
+                    raise
+                idx = -1
+            result.append(idx)
+            missing.append(idx < 0)
+        return result, missing
@@ -0,0 +1,589 @@
+# --------------------------------------------------------------------------
+# File: _conflict.py
+# ---------------------------------------------------------------------------
+# Licensed Materials - Property of IBM
+# 5725-A06 5725-A29 5724-Y48 5724-Y49 5724-Y54 5724-Y55 5655-Y21
+# Copyright IBM Corporation 2008, 2022. All Rights Reserved.
+#
+# US Government Users Restricted Rights - Use, duplication or
+# disclosure restricted by GSA ADP Schedule Contract with
+# IBM Corp.
+# ------------------------------------------------------------------------
+"""Conflict refiner API"""
+from . import _constants
+from . import _procedural as CPX_PROC
+from ._baseinterface import BaseInterface
+from ._aux_functions import (apply_freeform_two_args, make_group,
+                             concat_groups, separate_groups,
+                             array_group_from_arrays)
+from ..constant_class import ConstantClass
+
+
+class ConflictStatus(ConstantClass):
+    """Status codes returned by conflict.get"""
+    excluded = _constants.CPX_CONFLICT_EXCLUDED
+    possible_member = _constants.CPX_CONFLICT_POSSIBLE_MEMBER
+    member = _constants.CPX_CONFLICT_MEMBER
+
+
+class ConflictConstraintType(ConstantClass):
+    """Types of constraints"""
+    lower_bound = _constants.CPX_CON_LOWER_BOUND
+    upper_bound = _constants.CPX_CON_UPPER_BOUND
+    linear = _constants.CPX_CON_LINEAR
+    quadratic = _constants.CPX_CON_QUADRATIC
+    indicator = _constants.CPX_CON_INDICATOR
+    SOS = _constants.CPX_CON_SOS
+    pwl = _constants.CPX_CON_PWL
+
+
+class ConflictInterface(BaseInterface):
+    """Methods for identifying conflicts among constraints."""
+
+    group_status = ConflictStatus()
+    """See `ConflictStatus()` """
+    constraint_type = ConflictConstraintType()
+    """See `ConflictConstraintType()` """
+
+    def __init__(self, cplex):
+        """Creates a new ConflictInterface.
+
+        The conflict interface is exposed by the top-level `Cplex` class
+        as Cplex.conflict.  This constructor is not meant to be used
+        externally.
+        """
+        super().__init__(cplex)
+
+    def all_constraints(self):
+        """Returns an object instructing the conflict refiner to include
+        all constraints.
+
+        Calling
+        Cplex.conflict.refine(Cplex.conflict.all_constraints()) or
+        Cplex.conflict.refine_MIP_start(Cplex.conflict.all_constraints())
+        will result in every constraint being included in the search
+        for conflicts with equal preference.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> group = c.conflict.all_constraints()
+        """
+        return concat_groups([self.upper_bound_constraints(),
+                              self.lower_bound_constraints(),
+                              self.linear_constraints(),
+                              self.quadratic_constraints(),
+                              self.SOS_constraints(),
+                              self.indicator_constraints(),
+                              self.pwl_constraints()])
+
+    def groups_from_arrays(self, pref, beg, ind, types):
+        """Returns constraint groups given in compact array form.
+
+        This is a compact alternative to a list of constraint groups
+        (see `refine`) for large models. The result may be passed to
+        `refine` and `refine_MIP_start` like the objects returned by
+        `linear_constraints()` and the like.
+
+        pref contains the preference of each group.
+
+        beg contains, for each group, the position in ind and types at
+        which its constraints begin. A trailing entry equal to len(ind)
+        is accepted and ignored.
+
+        ind contains the constraint indices. Names are not accepted
+        here.
+
+        types contains the type of each constraint, an attribute of
+        conflict.constraint_type. It may also be given as bytes.
+
+        All arguments may be lists or objects supporting the buffer
+        protocol (e.g., NumPy arrays).
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> indices = c.linear_constraints.add(names=["c0", "c1", "c2"])
+        >>> linear = c.conflict.constraint_type.linear
+        >>> groups = c.conflict.groups_from_arrays(
+        ...     [1.0, 2.0], [0, 1], [0, 1, 2], [linear] * 3)
+        >>> print(groups)
+        [(1.0, ((3, 0),)), (2.0, ((3, 1), (3, 2)))]
+        """
+        return array_group_from_arrays(pref, beg, ind, types)
+
+    def upper_bound_constraints(self, *args):
+        """Returns an object instructing the conflict refiner to include
+        all upper bounds.
+
+        If called with no arguments, every upper bound is assigned
+        weight 1.0.
+
+        If called with one or more arguments, every upper bound is
+        assigned a weight equal to the float passed in as the first
+        argument.
+
+        If additional arguments are specified, they determine a subset
+        of upper bounds to be included.  If one variable index or name
+        is specified, it is the only upper bound that will be
+        included.  If two variable indices or names are specified, then
+        upper bounds of all variables between the first and the
+        second, inclusive, will be included.  If a sequence of
+        variable names or indices is passed in, all of their upper
+        bounds will be included.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> group = c.conflict.upper_bound_constraints()
+        """
+        return self._make_group(self.constraint_type.upper_bound, *args)
+
+    def lower_bound_constraints(self, *args):
+        """Returns an object instructing the conflict refiner to include
+        all lower bounds.
+
+        If called with no arguments, every lower bound is assigned
+        weight 1.0.
+
+        If called with one or more arguments, every lower bound is
+        assigned a weight equal to the float passed in as the first
+        argument.
+
+        If additional arguments are specified, they determine a subset
+        of lower bounds to be included.  If one variable index or name
+        is specified, it is the only lower bound that will be
+        included.  If two variable indices or names are specified, then
+        lower bounds of all variables between the first and the
+        second, inclusive, will be included.  If a sequence of
+        variable names or indices is passed in, all of their lower
+        bounds will be included.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> group = c.conflict.lower_bound_constraints()
+        """
+        return self._make_group(self.constraint_type.lower_bound, *args)
+
+    def linear_constraints(self, *args):
+        """Returns an object instructing the conflict refiner to include
+        all linear constraints.
+
+        If called with no arguments, every linear constraint is
+        assigned weight 1.0.
+
+        If called with one or more arguments, every linear constraint
+        is assigned a weight equal to the float passed in as the first
+        argument.
+
+        If additional arguments are specified, they determine a subset
+        of linear constraints to be included.  If one linear
+        constraint index or name is specified, it is the only linear
+        constraint that will be included.  If two linear constraint
+        indices or names are specified, then all linear constraints
+        between the first and the second, inclusive, will be included.
+        If a sequence of linear constraint names or indices is passed
+        in, they will all be included.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> group = c.conflict.linear_constraints()
+        """
+        return self._make_group(self.constraint_type.linear, *args)
+
+    def quadratic_constraints(self, *args):
+        """Returns an object instructing the conflict refiner to include
+        all quadratic constraints.
+
+        If called with no arguments, every quadratic constraint is
+        assigned weight 1.0.
+
+        If called with one or more arguments, every quadratic
+        constraint is assigned a weight equal to the float passed in
+        as the first argument.
+
+        If additional arguments are specified, they determine a subset
+        of quadratic constraints to be included.  If one quadratic
+        constraint index or name is specified, it is the only
+        quadratic constraint that will be included.  If two quadratic
+        constraint indices or names are specified, then all quadratic
+        constraints between the first and the second, inclusive, will
+        be included.  If a sequence of quadratic constraint names or
+        indices is passed in, they will all be included.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> group = c.conflict.quadratic_constraints()
+        """
+        return self._make_group(self.constraint_type.quadratic, *args)
+
+    def indicator_constraints(self, *args):
+        """Returns an object instructing the conflict refiner to include
+        all indicator constraints.
+
+        If called with no arguments, every indicator constraint is
+        assigned weight 1.0.
+
+        If called with one or more arguments, every indicator
+        constraint is assigned a weight equal to the float passed in
+        as the first argument.
+
+        If additional arguments are specified, they determine a subset
+        of indicator constraints to be included.  If one indicator
+        constraint index or name is specified, it is the only
+        indicator constraint that will be included.  If two indicator
+        constraint indices or names are specified, the all indicator
+        constraints between the first and the second, inclusive, will
+        be included.  If a sequence of indicator constraint names or
+        indices is passed in, they will all be included.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> group = c.conflict.indicator_constraints()
+        """
+        return self._make_group(self.constraint_type.indicator, *args)
+
+    def pwl_constraints(self, *args):
+        """Returns an object instructing the conflict refiner to include
+        all PWL constraints.
+
+        If called with no arguments, every PWL constraint is assigned
+        weight 1.0.
+
+        If called with one or more arguments, every PWL constraint is
+        assigned a weight equal to the float passed in as the first
+        argument.
+
+        If additional arguments are specified, they determine a subset
+        of PWL constraints to be included. If one PWL constraint index or
+        name is specified, it is the only PWL constraint that will be
+        included. If two PWL constraint indices or names are specified,
+        then all PWL constraints between the first and the second,
+        inclusive, will be included. If a sequence of PWL constraint
+        names or indices is passed in, they will all be included.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> group = c.conflict.pwl_constraints()
+        """
+        return self._make_group(self.constraint_type.pwl, *args)
+
+    def SOS_constraints(self, *args):
+        """Returns an object instructing the conflict refiner to include
+        all SOS constraints.
+
+        If called with no arguments, every SOS constraint is assigned
+        weight 1.0.
+
+        If called with one or more arguments, every SOS constraint is
+        assigned a weight equal to the float passed in as the first
+        argument.
+
+        If additional arguments are specified, they determine a subset
+        of SOS constraints to be included.  If one SOS constraint
+        index or name is specified, it is the only SOS constraint that
+        will be included.  If two SOS constraint indices or names are
+        specified, then all SOS constraints between the first and the
+        second, inclusive, will be included.  If a sequence of SOS
+        constraint names or indices is passed in, they will all be
+        included.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> group = c.conflict.SOS_constraints()
+        """
+        return self._make_group(self.constraint_type.SOS, *args)
+
+    def _separate_groups(self, args):
+        """Separates group information into individual arrays.
+
+        This, so they can be passed into the callable library in the
+        expected format.
+        """
+        return separate_groups(args, self._getconvfunc)
+
+    def _compose_groups(self, grppref, grpbeg, grpind, grptype):
+        """Convert individual lists of group information into group
+        format.
+
+        These are tuples of length two (the first entry of which is the
+        preference for the group (a float), the second of which is a
+        tuple of pairs (type, id), where type is an attribute of
+        conflict.constraint_type and id is either an index or a valid
+        name for the type).
+        """
+        groups = []
+        grpbeglen = len(grpbeg)
+        for i in range(grpbeglen):
+            begin = grpbeg[i]
+            if i == grpbeglen - 1:
+                end = len(grpind)
+            else:
+                end = grpbeg[i + 1]
+            groups.append((grppref[i], tuple(zip(grptype[begin:end],
+                                                 grpind[begin:end]))))
+        return groups
+
+    def _make_group(self, which, *args):
+        conv = self._getconvfunc(which)
+        max_num = self._getnum(which)
+        return make_group(conv, max_num, which, *args)
+
+    def _getinterface(self, which):
+        contype = self.constraint_type
+        switcher = {
+            contype.lower_bound: self._cplex.variables,
+            contype.upper_bound: self._cplex.variables,
+            contype.linear: self._cplex.linear_constraints,
+            contype.quadratic: self._cplex.quadratic_constraints,
+            contype.SOS: self._cplex.SOS,
+            contype.indicator: self._cplex.indicator_constraints,
+            contype.pwl: self._cplex.pwl_constraints
+        }
+        return switcher[which]
+
+    def _getnum(self, which):
+        interface = self._getinterface(which)
+        return interface.get_num()
+
+    def _getconvfunc(self, which):
+        interface = self._getinterface(which)
+        return interface._conv
+
+    def refine_MIP_start(self, MIP_start, *args):
+        """Identifies a minimal conflict among a set of constraints for a
+        given MIP start.
+
+        This method can take arbitrarily many arguments.  The first
+        argument must be either a name or index of a MIP start.
+        Additional arguments are optional and can be the object returned
+        by `all_constraints()` or any combination of constraint groups
+        and objects returned by `upper_bound_constraints()`,
+        `lower_bound_constraints()`, `linear_constraints()`,
+        `quadratic_constraints()`, `indicator_constraints()`,
+        `pwl_constraints()`, `SOS_constraints()`, or
+        `groups_from_arrays()` may be used to specify the constraints to
+        consider. If no additional arguments are specified, then
+        constraint groups are created automatically as in the CPLEX
+        interactive.
+
+        Constraint groups are sequences of length two, the first entry
+        of which is the preference for the group (a float), the second
+        of which is a sequence of pairs (type, id), where type is an
+        attribute of conflict.constraint_type and id is either an index
+        or a valid name for the type.
+
+        See :mipapi:`CPXrefinemipstartconflictext` and in the Callable
+        Library Reference Manual.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> out = c.set_results_stream(None)
+        >>> indices = c.variables.add([1], [0], [0], c.variables.type.binary)
+        >>> indices = c.variables.add([2], [0], [0], c.variables.type.binary)
+        >>> c.solve()
+        >>> indices = c.linear_constraints.add(
+        ...     lin_expr=[[[0, 1], [1.0, 1.0]]], senses="E", rhs=[2.0])
+        >>> c.conflict.refine_MIP_start(0, c.conflict.all_constraints())
+        >>> c.conflict.get()
+        [-1, -1, -1, -1, 3]
+        >>> c.conflict.group_status[3], c.conflict.group_status[-1]
+        ('member', 'excluded')
+        >>> c.conflict.get_groups(0, 3)
+        [(1.0, ((2, 0),)), (1.0, ((2, 1),)), (1.0, ((1, 0),)), (1.0, ((1, 1),))]
+        """
+        mipstartindex = self._cplex.MIP_starts._conv(MIP_start)
+        if args:
+            grppref, grpbeg, grpind, grptype = self._separate_groups(args)
+        else:
+            grppref, grpbeg, grpind, grptype = None, None, None, None
+        self._cplex._setup_callbacks()
+        try:
+            CPX_PROC.refinemipstartconflictext(
+                self._env._e, self._cplex._lp, mipstartindex,
+                grppref, grpbeg, grpind, grptype)
+        finally:
+            self._cplex._finish_callbacks()
+
+    def refine(self, *args):
+        """Identifies a minimal conflict among a set of constraints.
+
+        This method can take arbitrarily many arguments.  Either the
+        object returned by `all_constraints()` or any combination of
+        constraint groups and objects returned by
+        `upper_bound_constraints()`, `lower_bound_constraints()`,
+        `linear_constraints()`, `quadratic_constraints()`,
+        `indicator_constraints()`, `pwl_constraints()`,
+        `SOS_constraints()`, or `groups_from_arrays()` may be used to
+        specify the constraints to consider. Alternatively, if no
+        arguments are specified, then constraint groups are created
+        automatically as in the CPLEX interactive.
+
+        Constraint groups are sequences of length two, the first entry
+        of which is the preference for the group (a float), the second
+        of which is a sequence of pairs (type, id), where type is an
+        attribute of conflict.constraint_type and id is either an index or
+        a valid name for the type.
+
+        See :cpxapi:`CPXrefineconflictext` in the Callable Library
+        Reference Manual.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> out = c.set_results_stream(None)
+        >>> c.read("infeasible.lp")
+        >>> c.conflict.refine(c.conflict.linear_constraints(),
+        ...                   c.conflict.lower_bound_constraints())
+        >>> c.conflict.get()
+        [3, -1, 3, -1, -1, -1]
+        >>> c.conflict.group_status[3], c.conflict.group_status[-1]
+        ('member', 'excluded')
+        >>> c.conflict.get_groups([0, 2])
+        [(1.0, ((3, 0),)), (1.0, ((1, 0),))]
+        """
+        if args:
+            grppref, grpbeg, grpind, grptype = self._separate_groups(args)
+        else:
+            grppref, grpbeg, grpind, grptype = None, None, None, None
+        self._cplex._setup_callbacks()
+        try:
+            CPX_PROC.refineconflictext(self._env._e, self._cplex._lp,
+                                       grppref, grpbeg, grpind, grptype)
+        finally:
+            self._cplex._finish_callbacks()
+
+    def get(self, *args):
+        """Returns the status of a set of groups of constraints.
+
+        Can be called by four forms.
+
+        If called with no arguments, returns a list containing the
+        status of all constraint groups.
+
+        If called with one integer argument, returns the status of
+        that constraint group.
+
+        If called with two integer arguments, returns the status of
+        all constraint groups between the first and second argument,
+        inclusive.
+
+        If called with a sequence of integers as its argument, returns
+        the status of all constraint groups in the sequence.
+
+        The status codes are attributes of
+        Cplex.conflict.group_status.
+
+        See :cpxapi:`CPXgetconflictext` in the Callable Library Reference
+        Manual.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> out = c.set_results_stream(None)
+        >>> c.read("infeasible.lp")
+        >>> c.conflict.refine(c.conflict.all_constraints())
+        >>> confstatus = c.conflict.get()
+        """
+        def getconflict(a, b=self.get_num_groups() - 1):
+            return CPX_PROC.getconflictext(self._env._e, self._cplex._lp, a, b)
+        return apply_freeform_two_args(getconflict, None, args)
+
+    def get_num_groups(self):
+        """Returns the number of constraint groups used in the last call
+        to `refine()` or `refine_MIP_start()`.
+
+        See :cpxapi:`CPXgetconflictnumgroups` in the Callable Library
+        Reference Manual.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> out = c.set_results_stream(None)
+        >>> c.read("infeasible.lp")
+        >>> c.conflict.refine(c.conflict.all_constraints())
+        >>> c.conflict.get_num_groups()
+        10
+        """
+        return CPX_PROC.getconflictnumgroups(self._env._e, self._cplex._lp)
+
+    def get_groups(self, *args):
+        """Returns the groups of constraints used in the last call to
+        `refine()` or `refine_MIP_start()`.
+
+        Can be called by four forms.
+
+        If called with no arguments, returns a list containing all
+        constraint groups.
+
+        If called with one integer argument, returns that constraint
+        group.
+
+        If called with two integer arguments, returns all constraint
+        groups between the first and second argument, inclusive.
+
+        If called with a sequence of integers as its argument, returns
+        all constraint groups in the sequence.
+
+        Constraint groups are tuples of length two, the first entry of
+        which is the preference for the group (a float), the second of
+        which is a tuple of pairs (type, id), where type is an
+        attribute of conflict.constraint_type and id is either an index
+        or a valid name for the type.
+
+        See :cpxapi:`CPXgetconflictgroups` in the Callable Library
+        Reference Manual.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> out = c.set_results_stream(None)
+        >>> c.read("infeasible.lp")
+        >>> c.conflict.refine(c.conflict.all_constraints())
+        >>> groups = c.conflict.get_groups()
+        """
+        def getgroups(begin, end=self.get_num_groups() - 1):
+            (grppref, grpbeg, grpind,
+             grptype) = CPX_PROC.getconflictgroups(self._env._e,
+                                                   self._cplex._lp,
+                                                   begin, end)
+            return self._compose_groups(grppref, grpbeg, grpind, grptype)
+        return apply_freeform_two_args(getgroups, None, args)
+
+    def write(self, filename):
+        """Writes the conflict to a file.
+
+        See :cpxapi:`CPXclpwrite` in the Callable Library Reference
+        Manual.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> out = c.set_results_stream(None)
+        >>> c.read("infeasible.lp")
+        >>> c.conflict.refine(c.conflict.all_constraints())
+        >>> c.conflict.write("conflict.clp")
+        """
+        CPX_PROC.clpwrite(self._env._e, self._cplex._lp, filename)
@@ -0,0 +1,312 @@
+# --------------------------------------------------------------------------
+# File: _feasopt.py
+# ---------------------------------------------------------------------------
+# Licensed Materials - Property of IBM
+# 5725-A06 5725-A29 5724-Y48 5724-Y49 5724-Y54 5724-Y55 5655-Y21
+# Copyright IBM Corporation 2008, 2022. All Rights Reserved.
+#
+# US Government Users Restricted Rights - Use, duplication or
+# disclosure restricted by GSA ADP Schedule Contract with
+# IBM Corp.
+# ------------------------------------------------------------------------
+"""Feasopt API"""
+from . import _constants
+from . import _procedural as CPX_PROC
+from ._baseinterface import BaseInterface
+from ._aux_functions import (make_group, concat_groups, separate_groups,
+                             array_group_from_arrays)
+from ..exceptions import WrongNumberOfArgumentsError
+from ..constant_class import ConstantClass
+
+
+class FeasoptConstraintType(ConstantClass):
+    """Types of constraints"""
+    lower_bound = _constants.CPX_CON_LOWER_BOUND
+    upper_bound = _constants.CPX_CON_UPPER_BOUND
+    linear = _constants.CPX_CON_LINEAR
+    quadratic = _constants.CPX_CON_QUADRATIC
+    indicator = _constants.CPX_CON_INDICATOR
+
+
+class FeasoptInterface(BaseInterface):
+    """Finds a minimal relaxation of the problem that is feasible.
+
+    This is a callable class. To find a feasible relaxation of a problem,
+    invoke the `__call__` method of this class.
+    """
+
+    constraint_type = FeasoptConstraintType()
+    """See `FeasoptConstraintType()` """
+
+    def all_constraints(self):
+        """Returns an object instructing feasopt to relax all constraints.
+
+        Calling Cplex.feasopt(Cplex.feasopt.all_constraints()) will
+        result in every constraint being relaxed independently with
+        equal weight.
+
+        See also the `__call__` method of this class.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> group = c.feasopt.all_constraints()
+        """
+        return concat_groups([self.upper_bound_constraints(),
+                              self.lower_bound_constraints(),
+                              self.linear_constraints(),
+                              self.quadratic_constraints(),
+                              self.indicator_constraints()])
+
+    def groups_from_arrays(self, pref, beg, ind, types):
+        """Returns constraint groups given in compact array form.
+
+        This is a compact alternative to a list of constraint groups
+        (see `__call__`) for large models. The result may be passed to
+        `__call__` like the objects returned by
+        `linear_constraints()` and the like.
+
+        pref contains the preference of each group.
+
+        beg contains, for each group, the position in ind and types at
+        which its constraints begin. A trailing entry equal to len(ind)
+        is accepted and ignored.
+
+        ind contains the constraint indices. Names are not accepted
+        here.
+
+        types contains the type of each constraint, an attribute of
+        feasopt.constraint_type. It may also be given as bytes.
+
+        All arguments may be lists or objects supporting the buffer
+        protocol (e.g., NumPy arrays).
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> indices = c.linear_constraints.add(names=["c0", "c1", "c2"])
+        >>> linear = c.feasopt.constraint_type.linear
+        >>> groups = c.feasopt.groups_from_arrays(
+        ...     [1.0, 2.0], [0, 1], [0, 1, 2], [linear] * 3)
+        >>> print(groups)
+        [(1.0, ((3, 0),)), (2.0, ((3, 1), (3, 2)))]
+        >>> import array
+        >>> groups = c.feasopt.groups_from_arrays(
+        ...     [1.0], [0], [0, 1], array.array("i", [linear] * 2))
+        >>> print(groups)
+        [(1.0, ((3, 0), (3, 1)))]
+        """
+        return array_group_from_arrays(pref, beg, ind, types)
+
+    def upper_bound_constraints(self, *args):
+        """Returns an object instructing feasopt to relax all upper bounds.
+
+        If called with no arguments, every upper bound is assigned
+        weight 1.0.
+
+        If called with one or more arguments, every upper bound is
+        assigned a weight equal to the float passed in as the first
+        argument.
+
+        If additional arguments are specified, they determine a subset
+        of upper bounds to be relaxed.  If one variable index or name
+        is specified, it is the only upper bound that can be relaxed.
+        If two variable indices or names are specified, then upper
+        bounds of all variables between the first and the second,
+        inclusive, can be relaxed.  If a sequence of variable names or
+        indices is passed in, all of their upper bounds can be
+        relaxed.
+
+        See also the `__call__` method of this class.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> group = c.feasopt.upper_bound_constraints()
+        """
+        return self._make_group(self.constraint_type.upper_bound, *args)
+
+    def lower_bound_constraints(self, *args):
+        """Returns an object instructing feasopt to relax all lower bounds.
+
+        If called with no arguments, every lower bound is assigned
+        weight 1.0.
+
+        If called with one or more arguments, every lower bound is
+        assigned a weight equal to the float passed in as the first
+        argument.
+
+        If additional arguments are specified, they determine a subset
+        of lower bounds to be relaxed.  If one variable index or name
+        is specified, it is the only lower bound that can be relaxed.
+        If two variable indices or names are specified, then lower
+        bounds of all variables between the first and the second,
+        inclusive, can be relaxed.  If a sequence of variable names or
+        indices is passed in, all of their lower bounds can be
+        relaxed.
+
+        See also the `__call__` method of this class.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> group = c.feasopt.lower_bound_constraints()
+        """
+        return self._make_group(self.constraint_type.lower_bound, *args)
+
+    def linear_constraints(self, *args):
+        """Returns an object instructing feasopt to relax all linear constraints.
+
+        If called with no arguments, every linear constraint is
+        assigned weight 1.0.
+
+        If called with one or more arguments, every linear constraint
+        is assigned a weight equal to the float passed in as the first
+        argument.
+
+        If additional arguments are specified, they determine a subset
+        of linear constraints to be relaxed.  If one linear constraint
+        index or name is specified, it is the only linear constraint
+        that can be relaxed.  If two linear constraint indices or
+        names are specified, then all linear constraints between the
+        first and the second, inclusive, can be relaxed.  If a sequence
+        of linear constraint names or indices is passed in, all of their
+        linear constraints can be relaxed.
+
+        See also the `__call__` method of this class.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> group = c.feasopt.linear_constraints()
+        """
+        return self._make_group(self.constraint_type.linear, *args)
+
+    def quadratic_constraints(self, *args):
+        """Returns an object instructing feasopt to relax all quadratic constraints.
+
+        If called with no arguments, every quadratic constraint is
+        assigned weight 1.0.
+
+        If called with one or more arguments, every quadratic
+        constraint is assigned a weight equal to the float passed in
+        as the first argument.
+
+        If additional arguments are specified, they determine a subset
+        of quadratic constraints to be relaxed.  If one quadratic
+        constraint index or name is specified, it is the only
+        quadratic constraint that can be relaxed.  If two quadratic
+        constraint indices or names are specified, then all quadratic
+        constraints between the first and the second, inclusive, can be
+        relaxed.  If a sequence of quadratic constraint names or indices
+        is passed in, all of their quadratic constraints can be relaxed.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> group = c.feasopt.quadratic_constraints()
+        """
+        return self._make_group(self.constraint_type.quadratic, *args)
+
+    def indicator_constraints(self, *args):
+        """Returns an object instructing feasopt to relax all indicator constraints.
+
+        If called with no arguments, every indicator constraint is
+        assigned weight 1.0.
+
+        If called with one or more arguments, every indicator
+        constraint is assigned a weight equal to the float passed in
+        as the first argument.
+
+        If additional arguments are specified, they determine a subset
+        of indicator constraints to be relaxed.  If one indicator
+        constraint index or name is specified, it is the only
+        indicator constraint that can be relaxed.  If two indicator
+        constraint indices or names are specified, then all indicator
+        constraints between the first and the second, inclusive, can be
+        relaxed.  If a sequence of indicator constraint names or indices
+        is passed in, all of their indicator constraints can be relaxed.
+
+        See also the `__call__` method of this class.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> group = c.feasopt.indicator_constraints()
+        """
+        return self._make_group(self.constraint_type.indicator, *args)
+
+    def __call__(self, *args):
+        """Finds a minimal relaxation of the problem that is feasible.
+
+        This method can take arbitrarily many arguments. Either the
+        object returned by feasopt.all_constraints() or any combination
+        of constraint groups and objects returned by
+        `upper_bound_constraints()`, `lower_bound_constraints()`,
+        `linear_constraints()`, `quadratic_constraints()`,
+        `indicator_constraints()`, or `groups_from_arrays()` may be used
+        to specify the constraints to consider.
+
+        Constraint groups are sequences of length two, the first entry of
+        which is the preference for the group (a float), the second of
+        which is a sequence of pairs (type, id), where type is an
+        attribute of self.constraint_type and id is either an index or a
+        valid name for the type.
+
+        See :cpxapi:`CPXfeasoptext` in the Callable Library Reference
+        Manual.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> out = c.set_results_stream(None)
+        >>> out = c.set_log_stream(None)
+        >>> c.read("infeasible.lp")
+        >>> c.feasopt(c.feasopt.all_constraints())
+        >>> c.solution.get_objective_value()
+        2.0
+        >>> c.solution.get_values()
+        [3.0, 2.0, 3.0, 2.0]
+        """
+        if not args:
+            raise WrongNumberOfArgumentsError(
+                "Requires at least one argument")
+        gpref, gbeg, ind, indt = separate_groups(args, self._getconvfunc)
+        self._cplex._setup_callbacks()
+        try:
+            CPX_PROC.feasoptext(self._env._e, self._cplex._lp,
+                                gpref, gbeg, ind, indt)
+        finally:
+            self._cplex._finish_callbacks()
+
+    def _make_group(self, which, *args):
+        conv = self._getconvfunc(which)
+        max_num = self._getnum(which)
+        return make_group(conv, max_num, which, *args)
+
+    def _getinterface(self, which):
+        contype = self.constraint_type
+        switcher = {
+            contype.lower_bound: self._cplex.variables,
+            contype.upper_bound: self._cplex.variables,
+            contype.linear: self._cplex.linear_constraints,
+            contype.quadratic: self._cplex.quadratic_constraints,
+            contype.indicator: self._cplex.indicator_constraints
+        }
+        return switcher[which]
+
+    def _getnum(self, which):
+        interface = self._getinterface(which)
+        return interface.get_num()
+
+    def _getconvfunc(self, which):
+        interface = self._getinterface(which)
+        return interface._conv
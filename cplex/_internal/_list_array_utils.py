@@ -10,9 +10,46 @@
 # IBM Corp.
 # ------------------------------------------------------------------------
 """Functions to convert Python lists to C arrays."""
+import array
 from contextlib import contextmanager
+import ctypes
+import sys
+
 from . import _pycplex as CPX
 
+# Buffer format characters that can be copied as is into C arrays of the
+# corresponding type (see the struct module for the format syntax).
+_NATIVE_BYTE_ORDER = "<" if sys.byteorder == "little" else ">"
+_INT_FORMATS = ("i", "l") if ctypes.sizeof(ctypes.c_long) == 4 else ("i",)
+_LONG_FORMATS = ("q", "l") if ctypes.sizeof(ctypes.c_long) == 8 else ("q",)
+_DOUBLE_FORMATS = ("d",)
+_CHAR_FORMATS = ("c", "b", "B", "s", "1s")
+
+
+class _PyBuffer(ctypes.Structure):
+    """non-public
+
+    The C Py_buffer structure, used to get the address of read-only
+    buffers, which ctypes cannot wrap.
+    """
+    _fields_ = [("buf", ctypes.c_void_p), ("obj", ctypes.c_void_p),
+                ("len", ctypes.c_ssize_t), ("itemsize", ctypes.c_ssize_t),
+                ("readonly", ctypes.c_int), ("ndim", ctypes.c_int),
+                ("format", ctypes.c_char_p), ("shape", ctypes.c_void_p),
+                ("strides", ctypes.c_void_p),
+                ("suboffsets", ctypes.c_void_p),
+                ("internal", ctypes.c_void_p)]
+
+
+_PyObject_GetBuffer = ctypes.pythonapi.PyObject_GetBuffer
+_PyObject_GetBuffer.argtypes = [ctypes.py_object,
+                                ctypes.POINTER(_PyBuffer), ctypes.c_int]
+_PyObject_GetBuffer.restype = ctypes.c_int
+_PyBuffer_Release = ctypes.pythonapi.PyBuffer_Release
+_PyBuffer_Release.argtypes = [ctypes.POINTER(_PyBuffer)]
+_PyBuffer_Release.restype = None
+_PyBUF_SIMPLE = 0
+
 # int_list_to_C_array    = CPX.int_list_to_C_array
 # double_list_to_C_array = CPX.double_list_to_C_array
 
@@ -73,6 +110,52 @@ def double_list_to_array(inputlist):
     return output
 
 
+def int_range_array(begin, count):
+    """Returns an array.array of C ints from begin to begin + count - 1.
+
+    The result supports the buffer protocol, so it can be passed to
+    `int_c_array` without element-wise conversion.
+    """
+    return array.array("i", range(begin, begin + count))
+
+
+def new_double_buffer(length):
+    """Returns a new array.array('d') of the given length."""
+    return array.array("d", [0.0]) * length
+
+
+def double_buffer_view(out, length):
+    """Returns a memoryview of out for writing length C doubles.
+
+    Raises a TypeError if out is not a writable, contiguous buffer with
+    float64 items, and a ValueError if it does not hold exactly length
+    items.
+    """
+    view = buffer_view(out, ctypes.sizeof(ctypes.c_double), _DOUBLE_FORMATS)
+    if view is None or view.readonly:
+        raise TypeError("out must be a writable, contiguous buffer of"
+                        " float64 values")
+    if len(view) != length:
+        raise ValueError("out has length {0} (expected {1})".format(
+            len(view), length))
+    return view
+
+
+def c_array_to_buffer(inputarray, length, out):
+    """Copies the first length items of a C array of doubles into out.
+
+    inputarray is an array as created by `double_list_to_array`.
+
+    out must be a writable buffer with length float64 items (see
+    `double_buffer_view`). Returns out.
+    """
+    view = double_buffer_view(out, length)
+    if length > 0:
+        dest = (ctypes.c_char * view.nbytes).from_buffer(view)
+        ctypes.memmove(dest, int(inputarray.cast()), view.nbytes)
+    return out
+
+
 def array_to_list(inputarray, length):
     """Converts an "array" to a list.
 
@@ -94,13 +177,106 @@ def fast_array_to_list(inputarray, length):
         return inputarray
     return [inputarray[i] for i in range(length)]
 
+def buffer_view(seq, itemsize, formats):
+    """Returns a memoryview of seq if its memory can be copied as is.
+
+    That is, if seq supports the buffer protocol, is one-dimensional and
+    C-contiguous, and its items have the given size and one of the given
+    struct format characters (in native byte order). Otherwise, None is
+    returned and the caller is expected to fall back to element-wise
+    conversion.
+    """
+    if isinstance(seq, (str, list, tuple)) or seq is None:
+        return None
+    try:
+        view = memoryview(seq)
+    except TypeError:
+        return None
+    fmt = view.format.lstrip("@=" + _NATIVE_BYTE_ORDER)
+    if (view.ndim != 1 or not view.c_contiguous or
+            view.itemsize != itemsize or fmt not in formats):
+        return None
+    return view
+
+
+def copy_buffer_to_c_array(view, arrayptr):
+    """Copies the memory behind view into the C array arrayptr.
+
+    arrayptr is a raw pointer as returned by, for example,
+    `allocate_double_C_array`.
+    """
+    nbytes = view.nbytes
+    if nbytes == 0:
+        return
+    if not view.readonly:
+        src = (ctypes.c_char * nbytes).from_buffer(view)
+        ctypes.memmove(int(arrayptr), src, nbytes)
+        return
+    # ctypes only wraps writable buffers; ask the exporter for the
+    # address of a read-only one instead of copying it first.
+    buf = _PyBuffer()
+    _PyObject_GetBuffer(view, ctypes.byref(buf), _PyBUF_SIMPLE)
+    try:
+        ctypes.memmove(int(arrayptr), buf.buf, nbytes)
+    finally:
+        _PyBuffer_Release(ctypes.byref(buf))
+
+
+def _as_list(seq):
+    """non-public
+
+    Converts seq to a list for the list_to_C_array functions unless it
+    already is a list or tuple.  Buffers that cannot be copied as is
+    (e.g., empty ones or those with another item type) are converted
+    with their tolist method if they have one.
+    """
+    if seq is None or isinstance(seq, (list, tuple)):
+        return seq
+    tolist = getattr(seq, "tolist", None)
+    if tolist is not None:
+        return tolist()
+    return list(seq)
+
+
+def char_seq_to_str(seq):
+    """Converts a sequence of single characters to a str.
+
+    Objects supporting the buffer protocol with one-byte items (e.g.,
+    bytes, bytearray, or a NumPy uint8 array) are decoded in a single
+    pass. Any other sequence must contain single-character strings.
+    """
+    if isinstance(seq, str):
+        return seq
+    view = buffer_view(seq, 1, _CHAR_FORMATS)
+    if view is not None:
+        return view.tobytes().decode("ascii")
+    return "".join(seq)
+
+
+@contextmanager
+def _buffer_c_array(view, allocate):
+    with allocate(len(view)) as array:
+        copy_buffer_to_c_array(view, array._arrayC)
+        yield array._arrayC
+
+
 @contextmanager
 def int_c_array(seq):
-    """See matrix_conversion.c:int_list_to_C_array.()"""
+    """See matrix_conversion.c:int_list_to_C_array.()
+
+    If seq supports the buffer protocol with C int items (e.g., a NumPy
+    int32 array), its memory is copied directly without creating any
+    intermediate Python objects.
+    """
     if isinstance(seq, CPX.intC_array):
         yield seq._arrayC
+        return
+    view = buffer_view(seq, ctypes.sizeof(ctypes.c_int), _INT_FORMATS)
+    if view is not None and len(view) > 0:
+        with _buffer_c_array(view, allocate_int_C_array) as arrayptr:
+            yield arrayptr
     else:
-        array = CPX.int_list_to_C_array(seq)
+        array = CPX.int_list_to_C_array(_as_list(seq))
         try:
             yield array
         finally:
@@ -138,11 +314,20 @@ def allocate_double_C_array(nb):
 
 @contextmanager
 def long_c_array(seq):
-    """See matrix_conversion.c:long_list_to_C_array.()"""
+    """See matrix_conversion.c:long_list_to_C_array.()
+
+    If seq supports the buffer protocol with 64-bit integer items (e.g.,
+    a NumPy int64 array), its memory is copied directly.
+    """
     if isinstance(seq, CPX.longC_array):
         yield seq._arrayC
+        return
+    view = buffer_view(seq, ctypes.sizeof(ctypes.c_longlong), _LONG_FORMATS)
+    if view is not None and len(view) > 0:
+        with _buffer_c_array(view, allocate_long_C_array) as arrayptr:
+            yield arrayptr
     else:
-        array = CPX.long_list_to_C_array(seq)
+        array = CPX.long_list_to_C_array(_as_list(seq))
         try:
             yield array
         finally:
@@ -151,11 +336,21 @@ def long_c_array(seq):
 
 @contextmanager
 def double_c_array(seq):
-    """See matrix_conversion.c:double_list_to_C_array()."""
+    """See matrix_conversion.c:double_list_to_C_array().
+
+    If seq supports the buffer protocol with float64 items (e.g., a NumPy
+    float64 array or an array.array('d')), its memory is copied directly
+    without creating any intermediate Python objects.
+    """
     if isinstance(seq, CPX.doubleC_array):
         yield seq._arrayC
+        return
+    view = buffer_view(seq, ctypes.sizeof(ctypes.c_double), _DOUBLE_FORMATS)
+    if view is not None and len(view) > 0:
+        with _buffer_c_array(view, allocate_double_C_array) as arrayptr:
+            yield arrayptr
     else:
-        array = CPX.double_list_to_C_array(seq)
+        array = CPX.double_list_to_C_array(_as_list(seq))
         try:
             yield array
         finally:
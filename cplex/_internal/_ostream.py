@@ -146,3 +146,99 @@ class OutputStream():
     def flush(self):
         """Flushes the buffer."""
         self._file.flush()
+
+
+class ChunkedWriter():
+    """File-like object that coalesces small writes into large chunks.
+
+    Writes are collected until at least chunk_size bytes are pending
+    and then passed to the write method of stream in a single call.
+    Calls to flush are ignored; the pending bytes are written and
+    stream is flushed once by `finish`.
+
+    This class is not meant to be used externally.
+    """
+
+    def __init__(self, stream, chunk_size):
+        """ChunkedWriter constructor."""
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._pending = bytearray()
+
+    def write(self, data):
+        """Buffers data, writing a chunk once enough is pending."""
+        pending = self._pending
+        if not pending and len(data) >= self._chunk_size:
+            self._stream.write(data)
+            return
+        pending += data
+        if len(pending) >= self._chunk_size:
+            # Hand over the buffer rather than copying it, in case the
+            # stream keeps a reference to it.
+            self._pending = bytearray()
+            self._stream.write(pending)
+
+    def flush(self):
+        """Ignored; see `finish`."""
+
+    def finish(self):
+        """Writes any pending bytes and flushes the stream."""
+        if self._pending:
+            pending, self._pending = self._pending, bytearray()
+            self._stream.write(pending)
+        self._stream.flush()
+
+
+class BufferWriter():
+    """File-like object that writes into a pre-allocated buffer.
+
+    buffer must be a writable object supporting the buffer protocol
+    (e.g., a bytearray or a memoryview). Bytes that do not fit are
+    counted but discarded, so that nbytes always holds the total size
+    written and the caller can detect an overflow.
+
+    This class is not meant to be used externally.
+    """
+
+    def __init__(self, buffer):
+        """BufferWriter constructor."""
+        view = memoryview(buffer)
+        if view.readonly:
+            raise TypeError("buffer must be writable")
+        self._view = view.cast("B")
+        self.nbytes = 0
+
+    def write(self, data):
+        """Copies data to the buffer."""
+        begin = self.nbytes
+        end = begin + len(data)
+        if end <= len(self._view):
+            self._view[begin:end] = data
+        self.nbytes = end
+
+    def flush(self):
+        """No-op flush method."""
+
+    def overflowed(self):
+        """Returns True if more bytes were written than fit."""
+        return self.nbytes > len(self._view)
+
+
+class ByteArrayWriter():
+    """File-like object that collects everything written in a bytearray.
+
+    This class is not meant to be used externally.
+    """
+
+    def __init__(self):
+        """ByteArrayWriter constructor."""
+        self.data = bytearray()
+
+    def write(self, data):
+        """Appends data."""
+        self.data += data
+
+    def flush(self):
+        """No-op flush method."""
@@ -43,6 +43,37 @@ def _get_info_wrapper(func):
     return wrap
 
 
+# Parameter metadata that does not depend on the environment is shared
+# by all environments: the constant classes used for Parameter.values
+# and the (default, min, max) information queried from the library.
+_constants_instances = {}
+_info_by_id = {}
+
+
+def _shared_constants(constants):
+    """non-public"""
+    try:
+        return _constants_instances[constants]
+    except KeyError:
+        return _constants_instances.setdefault(constants, constants())
+
+
+def _shared_info(env, which_parameter, paramtype):
+    """non-public"""
+    try:
+        return _info_by_id[which_parameter]
+    except KeyError:
+        info = env.parameters._get_info(which_parameter, paramtype)
+        return _info_by_id.setdefault(which_parameter, info)
+
+
+def _env_proxy(env):
+    """non-public"""
+    if isinstance(env, weakref.ProxyTypes):
+        return env
+    return weakref.proxy(env)
+
+
 class Parameter():
     """Base class for Cplex parameters.
 
@@ -50,12 +81,12 @@ class Parameter():
 
     def __init__(self, env, about, parent, name, constants=None):
         """non-public"""
-        self._env = weakref.proxy(env)
+        self._env = _env_proxy(env)
         self._id, self._help, self._type = about
         self._parent = parent
         self._name = name
         if constants is not None:
-            self.values = constants()
+            self.values = _shared_constants(constants)
         self._has_info = False
         # self._defval gets set lazily by self._get_info().
         self._defval = None
@@ -136,7 +167,7 @@ class NumParameter(Parameter):
         self._has_info = True
         (self._defval,
          self._minval,
-         self._maxval) = self._env.parameters._get_info(self._id, self._type)
+         self._maxval) = _shared_info(self._env, self._id, self._type)
         # Override some default values for the Python API.
         if self._id == _constants.CPX_PARAM_CLONELOG:
             self._minval = 0
@@ -171,7 +202,7 @@ class StrParameter(Parameter):
         if self._has_info:
             return
         self._has_info = True
-        self._defval = self._env.parameters._get_info(self._id, self._type)
+        self._defval = _shared_info(self._env, self._id, self._type)
 
 
 class ParameterGroup():
@@ -181,12 +212,33 @@ class ParameterGroup():
 
     def __init__(self, env, members, parent):
         """non-public"""
-        self._env = weakref.proxy(env)
+        self._env = _env_proxy(env)
         self._parent = parent
-        # self._name gets set dynamically below when we call
-        # self.__dict__.update() (see _parameter_hierarchy.py).
-        self._name = None
-        self.__dict__.update(members(env, self))
+        # The members of the group (including self._name) are only
+        # created on first access; see _create_members().
+        self._members = members
+
+    def _create_members(self):
+        """non-public"""
+        members = self.__dict__.get("_members")
+        if members is not None:
+            # self._name gets set dynamically here (see
+            # _parameter_hierarchy.py).
+            self.__dict__.update(members(self._env, self))
+            self.__dict__.pop("_members", None)
+
+    def __getattr__(self, name):
+        """Creates the members of the group on first access."""
+        # Only called if name is not already in the instance dictionary.
+        if self.__dict__.get("_members") is None:
+            raise AttributeError("{0!r} object has no attribute {1!r}".format(
+                type(self).__name__, name))
+        self._create_members()
+        return object.__getattribute__(self, name)
+
+    def __dir__(self):
+        self._create_members()
+        return super().__dir__()
 
     def __repr__(self):
         """Returns the name of the parameter group within the hierarchy."""
@@ -194,6 +246,7 @@ class ParameterGroup():
 
     def reset(self):
         """Sets the parameters in the group to their default values."""
+        self._create_members()
         for member in self.__dict__.values():
             if (isinstance(member, (ParameterGroup, Parameter)) and
                     member != self._parent):
@@ -201,6 +254,7 @@ class ParameterGroup():
 
     def _get_params(self, filterfunc):
         """non-public"""
+        self._create_members()
         retval = []
         for member in self.__dict__.values():
             if isinstance(member, ParameterGroup) and member != self._parent:
@@ -479,6 +533,103 @@ class RootParameterGroup(ParameterGroup):
                                          dbl_params_and_values,
                                          str_params_and_values)
 
+    def _settings_list(self, parameters_and_values):
+        """non-public"""
+        if __debug__:
+            self._validate_fixed_args(parameters_and_values)
+        return [(param_id, value)
+                for (param_id, _, value) in self._get_fixed_args_iter(
+                    parameters_and_values)]
+
+    def tune_problem_set_parallel(self, filenames, candidates,
+                                  filetypes=None,
+                                  fixed_parameters_and_values=None,
+                                  workers=None, threads_per_worker=1):
+        """Ranks candidate parameter settings over a set of problems.
+
+        Unlike tune_problem_set, which searches for parameter settings
+        within a single call to CPLEX, this method evaluates a given
+        list of candidate settings.  Every candidate is solved on
+        every problem in a local pool of worker processes, each of
+        which holds its own Cplex object, and the candidates are
+        ranked by the mean deterministic time over the problems.
+
+        filenames must be a sequence of strings specifying a set of
+        problems.  If filetypes is given, it must be a sequence of the
+        same length as filenames also consisting of strings that
+        specify the types of the corresponding files.
+
+        candidates must be a sequence whose members may be either
+        ParameterSet instances or sequences of sequences of length 2
+        containing instances of the Parameter class and the values to
+        try.
+
+        If fixed_parameters_and_values is given, it has the same form
+        as a candidate and is applied on top of every candidate.
+
+        workers is the number of worker processes; if it is None, one
+        worker is started per CPU.  If threads_per_worker is not None,
+        the threads parameter is set to it in every run before the
+        candidate and fixed settings are applied.  The worker processes
+        are spawned rather than forked, so a script calling this method
+        must guard its main code with an if __name__ == "__main__": block.
+
+        Returns a pair (ranking, paramset).  ranking is a list of
+        tuples (candidate, mean_dettime, dettimes) sorted by
+        mean_dettime, where dettimes holds the deterministic time in
+        ticks for each problem, in the order of filenames.  Runs that
+        fail to read or solve a problem count as float("inf").
+        paramset is a new ParameterSet containing the settings of the
+        best candidate together with the fixed settings.
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> ranking, ps = c.parameters.tune_problem_set_parallel(
+        ...     filenames=["lpex.mps", "example.mps"],
+        ...     candidates=[
+        ...         [(c.parameters.lpmethod,
+        ...           c.parameters.lpmethod.values.primal)],
+        ...         [(c.parameters.lpmethod,
+        ...           c.parameters.lpmethod.values.dual)]],
+        ...     workers=2)
+        >>> len(ranking)
+        2
+        >>> len(ps) >= 1
+        True
+        """
+        # Imported here so that concurrent.futures and multiprocessing
+        # are only loaded when this method is used.
+        from . import _workers  # pylint: disable=import-outside-toplevel
+        filetypes, fixed_parameters_and_values = init_list_args(
+            filetypes, fixed_parameters_and_values)
+        if not filetypes:
+            filetypes = [""] * len(filenames)
+        elif len(filetypes) != len(filenames):
+            raise CplexError(
+                "filenames and filetypes must have the same length")
+        if not candidates:
+            raise CplexError("no candidate parameter settings given")
+        fixed = self._settings_list(fixed_parameters_and_values)
+        settings = [self._settings_list(cand) + fixed
+                    for cand in candidates]
+        with _workers.make_executor(workers) as executor:
+            futures = [[executor.submit(_workers.tune_run, filename,
+                                        filetype, threads_per_worker,
+                                        cand_settings)
+                        for (filename, filetype) in zip(filenames,
+                                                        filetypes)]
+                       for cand_settings in settings]
+            dettimes = [[fut.result() for fut in row] for row in futures]
+        means = [sum(times) / len(times) if times else 0.0
+                 for times in dettimes]
+        order = sorted(range(len(candidates)), key=means.__getitem__)
+        ranking = [(candidates[i], means[i], dettimes[i]) for i in order]
+        best = settings[order[0]]
+        paramset = self._cplex.create_parameter_set()
+        for (param_id, value) in best:
+            paramset.add(param_id, value)
+        return ranking, paramset
+
     def tune_problem(self, fixed_parameters_and_values=None):
         """Tunes parameters for a Cplex problem.
 
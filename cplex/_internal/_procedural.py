@@ -1058,6 +1058,19 @@ def addcols(env, lp, ccnt, nzcnt, obj, cmat, lb, ub, colname):
     check_status(env, status)
 
 
+def addcols_csc(env, lp, obj, cmatbeg, cmatind, cmatval, lb, ub, colname):
+    with LAU.double_c_array(obj) as c_obj, \
+         LAU.long_c_array(cmatbeg) as c_cmatbeg, \
+         LAU.int_c_array(cmatind) as c_cmatind, \
+         LAU.double_c_array(cmatval) as c_cmatval, \
+         LAU.double_c_array(lb) as c_lb, \
+         LAU.double_c_array(ub) as c_ub:  # noqa: E126
+        status = CR.CPXXaddcols(
+            env, lp, len(cmatbeg), len(cmatind), c_obj,
+            [c_cmatbeg, c_cmatind, c_cmatval], c_lb, c_ub, colname)
+    check_status(env, status)
+
+
 def delcols(env, lp, begin, end):
     delfn = CR.CPXXdelcols
     _delbyrange(delfn, env, lp, begin, end)
@@ -1184,6 +1197,17 @@ def addrows(env, lp, ccnt, rcnt, nzcnt, rhs, sense, rmat, colname, rowname):
     check_status(env, status)
 
 
+def addrows_csr(env, lp, rhs, sense, rmatbeg, rmatind, rmatval, rowname):
+    with LAU.double_c_array(rhs) as c_rhs, \
+         LAU.long_c_array(rmatbeg) as c_rmatbeg, \
+         LAU.int_c_array(rmatind) as c_rmatind, \
+         LAU.double_c_array(rmatval) as c_rmatval:  # noqa: E126
+        status = CR.CPXXaddrows(
+            env, lp, 0, len(rmatbeg), len(rmatind), c_rhs,
+            sense, [c_rmatbeg, c_rmatind, c_rmatval], [], rowname)
+    check_status(env, status)
+
+
 def delrows(env, lp, begin, end):
     delfn = CR.CPXXdelrows
     _delbyrange(delfn, env, lp, begin, end)
@@ -2056,11 +2080,13 @@ def getobjval(env, lp):
     return objval.value()
 
 
-def getx(env, lp, begin, end):
+def getx(env, lp, begin, end, out=None):
     xlen = _rangelen(begin, end)
     x = _safeDoubleArray(xlen)
     status = CR.CPXXgetx(env, lp, x, begin, end)
     check_status(env, status)
+    if out is not None:
+        return LAU.c_array_to_buffer(x, xlen, out)
     return LAU.array_to_list(x, xlen)
 
 
@@ -2071,11 +2097,13 @@ def getnumcores(env):
     return numcores.value()
 
 
-def getax(env, lp, begin, end):
+def getax(env, lp, begin, end, out=None):
     axlen = _rangelen(begin, end)
     ax = _safeDoubleArray(axlen)
     status = CR.CPXXgetax(env, lp, ax, begin, end)
     check_status(env, status)
+    if out is not None:
+        return LAU.c_array_to_buffer(ax, axlen, out)
     return LAU.array_to_list(ax, axlen)
 
 
@@ -2087,27 +2115,33 @@ def getxqxax(env, lp, begin, end):
     return LAU.array_to_list(qax, qaxlen)
 
 
-def getpi(env, lp, begin, end):
+def getpi(env, lp, begin, end, out=None):
     pilen = _rangelen(begin, end)
     pi = _safeDoubleArray(pilen)
     status = CR.CPXXgetpi(env, lp, pi, begin, end)
     check_status(env, status)
+    if out is not None:
+        return LAU.c_array_to_buffer(pi, pilen, out)
     return LAU.array_to_list(pi, pilen)
 
 
-def getslack(env, lp, begin, end):
+def getslack(env, lp, begin, end, out=None):
     slacklen = _rangelen(begin, end)
     slack = _safeDoubleArray(slacklen)
     status = CR.CPXXgetslack(env, lp, slack, begin, end)
     check_status(env, status)
+    if out is not None:
+        return LAU.c_array_to_buffer(slack, slacklen, out)
     return LAU.array_to_list(slack, slacklen)
 
 
-def getdj(env, lp, begin, end):
+def getdj(env, lp, begin, end, out=None):
     djlen = _rangelen(begin, end)
     dj = _safeDoubleArray(djlen)
     status = CR.CPXXgetdj(env, lp, dj, begin, end)
     check_status(env, status)
+    if out is not None:
+        return LAU.c_array_to_buffer(dj, djlen, out)
     return LAU.array_to_list(dj, djlen)
 
 
@@ -3417,11 +3451,13 @@ def getsolnpoolobjval(env, lp, soln):
     return obj.value()
 
 
-def getsolnpoolx(env, lp, soln, begin, end):
+def getsolnpoolx(env, lp, soln, begin, end, out=None):
     xlen = _rangelen(begin, end)
     x = _safeDoubleArray(xlen)
     status = CR.CPXXgetsolnpoolx(env, lp, soln, x, begin, end)
     check_status(env, status)
+    if out is not None:
+        return LAU.c_array_to_buffer(x, xlen, out)
     return LAU.array_to_list(x, xlen)
 
 
@@ -3957,11 +3993,13 @@ def callbackcandidateispoint(contextptr):
     check_status(None, status)
     return bounded.value() != 0
 
-def callbackgetcandidatepoint(contextptr, begin, end):
+def callbackgetcandidatepoint(contextptr, begin, end, out=None):
     xlen = _rangelen(begin, end)
     x = _safeDoubleArray(xlen)
     status = CR.CPXXcallbackgetcandidatepoint(contextptr, x, begin, end, None)
     check_status(None, status)
+    if out is not None:
+        return LAU.c_array_to_buffer(x, xlen, out)
     return LAU.array_to_list(x, xlen)
 
 def callbackcandidateisray(contextptr):
@@ -3970,11 +4008,13 @@ def callbackcandidateisray(contextptr):
     check_status(None, status)
     return ray.value() != 0
 
-def callbackgetcandidateray(contextptr, begin, end):
+def callbackgetcandidateray(contextptr, begin, end, out=None):
     raylen = _rangelen(begin, end)
     ray = _safeDoubleArray(raylen)
     status = CR.CPXXcallbackgetcandidateray(contextptr, ray, begin, end)
     check_status(None, status)
+    if out is not None:
+        return LAU.c_array_to_buffer(ray, raylen, out)
     return LAU.array_to_list(ray, raylen)
 
 def callbackgetcandidateobj(contextptr):
@@ -3984,11 +4024,13 @@ def callbackgetcandidateobj(contextptr):
     return obj_p.value()
 
 
-def callbackgetrelaxationpoint(contextptr, begin, end):
+def callbackgetrelaxationpoint(contextptr, begin, end, out=None):
     xlen = _rangelen(begin, end)
     x = _safeDoubleArray(xlen)
     status = CR.CPXXcallbackgetrelaxationpoint(contextptr, x, begin, end, None)
     check_status(None, status)
+    if out is not None:
+        return LAU.c_array_to_buffer(x, xlen, out)
     return LAU.array_to_list(x, xlen)
 
 def callbackgetrelaxationpointobj(contextptr):
@@ -4029,11 +4071,13 @@ def callbackexitcutloop(contextptr):
     status = CR.CPXXcallbackexitcutloop(contextptr)
     check_status(None, status)
 
-def callbackgetincumbent(contextptr, begin, end):
+def callbackgetincumbent(contextptr, begin, end, out=None):
     xlen = _rangelen(begin, end)
     x = _safeDoubleArray(xlen)
     status = CR.CPXXcallbackgetincumbent(contextptr, x, begin, end, None)
     check_status(None, status)
+    if out is not None:
+        return LAU.c_array_to_buffer(x, xlen, out)
     return LAU.array_to_list(x, xlen)
 
 
@@ -4044,34 +4088,42 @@ def callbackgetincumbentobj(contextptr):
     return obj_p.value()
 
 
-def callbackgetlocallb(contextptr, begin, end):
+def callbackgetlocallb(contextptr, begin, end, out=None):
     xlen = _rangelen(begin, end)
     x = _safeDoubleArray(xlen)
     status = CR.CPXXcallbackgetlocallb(contextptr, x, begin, end)
     check_status(None, status)
+    if out is not None:
+        return LAU.c_array_to_buffer(x, xlen, out)
     return LAU.array_to_list(x, xlen)
 
 
-def callbackgetlocalub(contextptr, begin, end):
+def callbackgetlocalub(contextptr, begin, end, out=None):
     xlen = _rangelen(begin, end)
     x = _safeDoubleArray(xlen)
     status = CR.CPXXcallbackgetlocalub(contextptr, x, begin, end)
     check_status(None, status)
+    if out is not None:
+        return LAU.c_array_to_buffer(x, xlen, out)
     return LAU.array_to_list(x, xlen)
 
-def callbackgetgloballb(contextptr, begin, end):
+def callbackgetgloballb(contextptr, begin, end, out=None):
     xlen = _rangelen(begin, end)
     x = _safeDoubleArray(xlen)
     status = CR.CPXXcallbackgetgloballb(contextptr, x, begin, end)
     check_status(None, status)
+    if out is not None:
+        return LAU.c_array_to_buffer(x, xlen, out)
     return LAU.array_to_list(x, xlen)
 
 
-def callbackgetglobalub(contextptr, begin, end):
+def callbackgetglobalub(contextptr, begin, end, out=None):
     xlen = _rangelen(begin, end)
     x = _safeDoubleArray(xlen)
     status = CR.CPXXcallbackgetglobalub(contextptr, x, begin, end)
     check_status(None, status)
+    if out is not None:
+        return LAU.c_array_to_buffer(x, xlen, out)
     return LAU.array_to_list(x, xlen)
 
 def callbackpostheursoln(contextptr, cnt, ind, val, obj, strategy):
@@ -4105,6 +4157,35 @@ def callbackrejectcandidatelocal(contextptr, rcnt, nzcnt, rhs, sense, rmat):
                                                      c_rhs, sense, rmat)
     check_status(None, status)
 
+
+def callbackaddusercuts_csr(contextptr, rhs, sense, rmatbeg, rmatind,
+                            rmatval, cutmanagement, local):
+    with LAU.double_c_array(rhs) as c_rhs, \
+            LAU.long_c_array(rmatbeg) as c_rmatbeg, \
+            LAU.int_c_array(rmatind) as c_rmatind, \
+            LAU.double_c_array(rmatval) as c_rmatval, \
+            LAU.int_c_array(cutmanagement) as c_cutmanagement, \
+            LAU.int_c_array(local) as c_local:
+        status = CR.CPXXcallbackaddusercuts(
+            contextptr, len(rmatbeg), len(rmatind), c_rhs, sense,
+            [c_rmatbeg, c_rmatind, c_rmatval], c_cutmanagement, c_local)
+    check_status(None, status)
+
+
+def callbackrejectcandidate_csr(contextptr, rhs, sense, rmatbeg, rmatind,
+                                rmatval, local=False):
+    if local:
+        rejectfn = CR.CPXXcallbackrejectcandidatelocal
+    else:
+        rejectfn = CR.CPXXcallbackrejectcandidate
+    with LAU.double_c_array(rhs) as c_rhs, \
+            LAU.long_c_array(rmatbeg) as c_rmatbeg, \
+            LAU.int_c_array(rmatind) as c_rmatind, \
+            LAU.double_c_array(rmatval) as c_rmatval:
+        status = rejectfn(contextptr, len(rmatbeg), len(rmatind), c_rhs,
+                          sense, [c_rmatbeg, c_rmatind, c_rmatval])
+    check_status(None, status)
+
 # ########## Expert Callback END ##########################################
 
 # ########## Modeling Assistance Callback BEGIN ###########################
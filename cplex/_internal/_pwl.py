@@ -38,7 +38,8 @@ class PWLConstraintInterface(BaseInterface):
         class as `Cplex.pwl_constraints`.  This constructor is not meant
         to be used externally.
         """
-        super().__init__(cplex=cpx, getindexfunc=_proc.getpwlindex)
+        super().__init__(cplex=cpx, getindexfunc=_proc.getpwlindex,
+                         nameindex=True)
 
     def get_num(self):
         """Returns the number of PWL constraints in the problem.
@@ -116,9 +117,11 @@ class PWLConstraintInterface(BaseInterface):
                          preslope, postslope,
                          nbreaks, breakx, breaky,
                          name)
-        return self._add_single(self.get_num, _add, yidx, xidx,
-                                preslope, postslope, breakx, breaky,
-                                name)
+        idx = self._add_single(self.get_num, _add, yidx, xidx,
+                               preslope, postslope, breakx, breaky,
+                               name)
+        self._names_added([idx], [name])
+        return idx
 
     def delete(self, *args):
         """Deletes PWL constraints from the problem.
@@ -166,7 +169,7 @@ class PWLConstraintInterface(BaseInterface):
         """
         def _delete(begin, end=None):
             _proc.delpwl(self._env._e, self._cplex._lp, begin, end)
-        _aux.delete_set_by_range(_delete, self._conv, self.get_num(), *args)
+        self._delete_set(_delete, *args)
 
     def get_names(self, *args):
         """Returns the names of a set of PWL constraints.
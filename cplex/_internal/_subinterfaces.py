@@ -10,28 +10,80 @@
 # IBM Corp.
 # ------------------------------------------------------------------------
 """Sub-interfaces of the CPLEX API."""
+import array
 from contextlib import closing, contextmanager
 from io import StringIO
+import itertools
 import numbers
 
 from . import _constants
+from . import _list_array_utils as LAU
 from . import _procedural as CPX_PROC
-from ._baseinterface import BaseInterface
-from ._multiobjsoln import MultiObjSolnInterface
+from ._baseinterface import BaseInterface, LazyInterface
 from ._matrices import (SparsePair, SparseTriple, _HBMatrix,
                         unpack_pair, unpack_triple)
 from ._aux_functions import (apply_freeform_one_arg,
                              apply_freeform_two_args,
+                             apply_freeform_two_args_into,
                              max_arg_length,
                              validate_arg_lengths, apply_pairs,
                              delete_set_by_range,
-                             make_group, _group,
+                             make_group, concat_groups,
+                             separate_groups, array_group_from_arrays,
                              init_list_args, listify,
                              unzip, convert_sequence)
-from ..exceptions import CplexSolverError, WrongNumberOfArgumentsError
+from ..exceptions import (CplexError, CplexSolverError,
+                          WrongNumberOfArgumentsError)
 from ..constant_class import ConstantClass
 
 
+def _compressed_matrix_args(matbeg, matind, matval, num, indptr=False):
+    """non-public
+
+    Validates the arrays of a matrix in compressed sparse row or column
+    format with num rows or columns. If num is zero, it is taken from
+    matbeg. If indptr is True, matbeg must have a trailing entry equal
+    to the number of nonzeros (e.g., the indptr array of a scipy.sparse
+    matrix), and it is returned without that entry. Otherwise, matbeg
+    is returned as it is.
+    """
+    nnz = len(matind)
+    if len(matval) != nnz:
+        raise CplexError("inconsistent argument lengths: matind, matval")
+    if indptr:
+        if len(matbeg) == 0 or matbeg[-1] != nnz:
+            raise CplexError("the last entry of indptr must be the number"
+                             " of nonzeros")
+        matbeg = matbeg[:-1]
+    if num == 0:
+        num = len(matbeg)
+    if len(matbeg) != num:
+        raise CplexError("inconsistent argument lengths: matbeg")
+    # Bad offsets would make CPLEX read past the end of matind and matval.
+    prev = 0
+    for beg in matbeg:
+        if beg < prev or beg > nnz:
+            raise CplexError("matbeg must be nondecreasing, nonnegative,"
+                             " and not exceed the number of nonzeros")
+        prev = beg
+    return matbeg
+
+
+def _compressed_matrix_arrays(mat, indptr):
+    """non-public
+
+    Converts the (matbeg, matind, matval) lists returned by
+    `CPX_PROC.getrows` or `CPX_PROC.getcols` to typed arrays. If indptr
+    is True, the number of nonzeros is appended to matbeg.
+    """
+    matbeg = array.array("q", mat[0])
+    matind = array.array("i", mat[1])
+    matval = array.array("d", mat[2])
+    if indptr:
+        matbeg.append(len(matind))
+    return matbeg, matind, matval
+
+
 class Histogram():
     """A class to retrieve histogram data of the columns or rows of the
     linear constraint matrix.
@@ -291,7 +343,8 @@ class VariablesInterface(BaseInterface):
         as `Cplex.variables`.  This constructor is not meant to be used
         externally.
         """
-        super().__init__(cplex=cplex, getindexfunc=CPX_PROC.getcolindex)
+        super().__init__(cplex=cplex, getindexfunc=CPX_PROC.getcolindex,
+                         nameindex=True)
         self.advanced = AdvancedVariablesInterface(self)
         """See `AdvancedVariablesInterface()` """
 
@@ -367,8 +420,7 @@ class VariablesInterface(BaseInterface):
 
     def _add(self, obj, lb, ub, types, names, columns):
         """non-public"""
-        if not isinstance(types, str):
-            types = "".join(types)
+        types = LAU.char_seq_to_str(types)
         arg_list = [obj, lb, ub, types, names, columns]
         num_new_cols = max_arg_length(arg_list)
         validate_arg_lengths(
@@ -388,7 +440,7 @@ class VariablesInterface(BaseInterface):
             if types != "":
                 CPX_PROC.chgctype(
                     self._env._e, self._cplex._lp,
-                    list(range(num_old_cols, num_old_cols + num_new_cols)),
+                    LAU.int_range_array(num_old_cols, num_new_cols),
                     types)
 
     def add(self, obj=None, lb=None, ub=None, types="", names=None,
@@ -410,8 +462,15 @@ class VariablesInterface(BaseInterface):
         ub is a list of floats specifying the upper bounds on the
         variables.
 
+        Instead of lists, obj, lb, and ub may be any objects supporting
+        the buffer protocol with float64 items (e.g., NumPy float64
+        arrays or array.array('d') objects). Their memory is then copied
+        directly to CPLEX without creating intermediate Python objects.
+
         types must be either a list of single-character strings or a
-        string containing the types of the variables.
+        string containing the types of the variables. It may also be an
+        object supporting the buffer protocol with one-byte items (e.g.,
+        bytes or a NumPy uint8 array) holding the type characters.
 
         Note
           If types is specified, the problem type will be a MIP, even if
@@ -455,8 +514,100 @@ class VariablesInterface(BaseInterface):
         """
         obj, lb, ub, names, columns = init_list_args(obj, lb, ub, names,
                                                      columns)
-        return self._add_iter(self.get_num, self._add,
-                              obj, lb, ub, types, names, columns)
+        indices = self._add_iter(self.get_num, self._add,
+                                 obj, lb, ub, types, names, columns)
+        self._names_added(indices, names)
+        return indices
+
+    def _add_csc(self, matbeg, matind, matval, obj, lb, ub, types, names,
+                 indptr):
+        """non-public"""
+        types = LAU.char_seq_to_str(types)
+        arg_list = [obj, lb, ub, types, names]
+        validate_arg_lengths(
+            arg_list,
+            extra_msg=": obj, lb, ub, types, names"
+        )
+        matbeg = _compressed_matrix_args(matbeg, matind, matval,
+                                         max_arg_length(arg_list), indptr)
+        num_new_cols = len(matbeg)
+        num_old_cols = self.get_num()
+        CPX_PROC.addcols_csc(self._env._e, self._cplex._lp, obj,
+                             matbeg, matind, matval, lb, ub, names)
+        if types != "":
+            CPX_PROC.chgctype(
+                self._env._e, self._cplex._lp,
+                LAU.int_range_array(num_old_cols, num_new_cols),
+                types)
+
+    def add_csc(self, matbeg, matind, matval, obj=None, lb=None, ub=None,
+                types="", names=None, indptr=False):
+        """Adds variables given with their columns in compressed sparse
+        column format.
+
+        This is a bulk alternative to `add` with the columns argument,
+        intended for column generation and other code that adds many
+        columns at a time. The coefficients of the new variables in the
+        existing linear constraints are given as three arrays that are
+        passed to CPLEX as they are:
+
+        matbeg contains, for each new variable, the position in matind
+        and matval at which its nonzeros begin. Its entries must be
+        nondecreasing and must not exceed the number of nonzeros. If
+        indptr is True, matbeg has an additional trailing entry equal
+        to the number of nonzeros, as in the indptr array of a
+        scipy.sparse.csc_matrix.
+
+        matind contains the linear constraint indices of the nonzeros.
+        Linear constraint names are not accepted here.
+
+        matval contains the values of the nonzeros.
+
+        obj, lb, ub, types, and names have the same meaning as in `add`.
+        If more than one of them is specified, they must have the same
+        length.
+
+        matbeg, matind, matval, obj, lb, and ub may be lists or objects
+        supporting the buffer protocol (e.g., NumPy arrays). If the item
+        types match the C types used by CPLEX (64-bit integers for
+        matbeg, 32-bit integers for matind, and float64 for the others),
+        their memory is copied directly without creating any
+        intermediate Python objects.
+
+        The columns are added with a single call to CPXaddcols, followed
+        by a single call to CPXchgctype if types is specified.
+
+        See :cpxapi:`CPXaddcols` in the Callable Library Reference Manual
+        for more detail.
+
+        Returns an iterator containing the indices of the added
+        variables.
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> indices = c.linear_constraints.add(names=["c0", "c1", "c2"])
+        >>> indices = c.variables.add_csc(
+        ...     matbeg=[0, 2, 3],
+        ...     matind=[0, 2, 2, 0, 1],
+        ...     matval=[1.0, -1.0, 2.0, 3.0, 4.0],
+        ...     obj=[1.0, 2.0, 3.0],
+        ...     types=[c.variables.type.integer] * 3,
+        ...     names=["x0", "x1", "x2"])
+        >>> c.variables.get_cols("x1")
+        SparsePair(ind = [2], val = [2.0])
+        >>> indices = c.variables.add_csc(
+        ...     *c.variables.get_cols_csc(indptr=True), indptr=True)
+        >>> c.variables.get_num()
+        6
+        >>> c.variables.get_cols(5)
+        SparsePair(ind = [0, 1], val = [3.0, 4.0])
+        """
+        obj, lb, ub, names = init_list_args(obj, lb, ub, names)
+        indices = self._add_iter(self.get_num, self._add_csc,
+                                 matbeg, matind, matval, obj, lb, ub, types,
+                                 names, indptr)
+        self._names_added(indices, names)
+        return indices
 
     def delete(self, *args):
         """Deletes variables from the problem.
@@ -507,7 +658,36 @@ class VariablesInterface(BaseInterface):
         """
         def _delete(begin, end=None):
             CPX_PROC.delcols(self._env._e, self._cplex._lp, begin, end)
-        delete_set_by_range(_delete, self._conv, self.get_num(), *args)
+        self._delete_set(_delete, *args)
+
+    def delete_with_remap(self, s):
+        """Deletes a set of variables and returns the new indices.
+
+        s must be a sequence of variable names or indices, in any order.
+        Duplicates are ignored. The variables are deleted with one call
+        to CPLEX per contiguous range of indices.
+
+        Returns an array.array of C ints with one entry per variable
+        before the deletion: the new index of the variable, or -1 if it
+        was deleted. This allows callers to update their own index maps
+        without querying names.
+
+        See :cpxapi:`CPXdelcols` in the Callable Library Reference Manual
+        for more detail.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> indices = c.variables.add(names=[str(i) for i in range(6)])
+        >>> c.variables.delete_with_remap([4, "1", 2]).tolist()
+        [0, -1, -1, 1, -1, 2]
+        >>> c.variables.get_names()
+        ['0', '3', '5']
+        """
+        def _delete(begin, end):
+            CPX_PROC.delcols(self._env._e, self._cplex._lp, begin, end)
+        return self._delete_with_remap(_delete, s)
 
     def set_lower_bounds(self, *args):
         """Sets the lower bound for a variable or set of variables.
@@ -598,6 +778,7 @@ class VariablesInterface(BaseInterface):
         ['first', 'second', 'third']
         """
         def setnames(a, b):
+            self._names_changed(a, b)
             CPX_PROC.chgcolname(self._env._e, self._cplex._lp, a, b)
         apply_pairs(setnames, self._conv, *args)
 
@@ -882,6 +1063,48 @@ class VariablesInterface(BaseInterface):
             return [m for m in mat]
         return apply_freeform_two_args(getcols, self._conv, args)
 
+    def get_cols_csc(self, begin=None, end=None, indptr=False):
+        """Returns a range of columns of the linear constraint matrix in
+        compressed sparse column format.
+
+        This is a bulk alternative to `get_cols` that does not create a
+        SparsePair per column.
+
+        begin and end must be variable indices or variable names. The
+        columns with indices between begin and end, inclusive of end,
+        are returned. If begin is omitted, it defaults to the first
+        variable. If end is omitted, it defaults to the last variable.
+
+        Returns a tuple (matbeg, matind, matval) of array.array objects
+        with typecodes "q", "i", and "d", respectively, as described for
+        `add_csc`. If indptr is True, matbeg has an extra trailing entry
+        equal to the number of nonzeros, as in the indptr array of a
+        scipy.sparse.csc_matrix. All three arrays support the buffer
+        protocol, so they can be wrapped without copying (e.g., with
+        numpy.frombuffer).
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> indices = c.linear_constraints.add(names=["c0", "c1"])
+        >>> indices = c.variables.add(
+        ...     names=["x0", "x1", "x2"],
+        ...     columns=[cplex.SparsePair(ind=[0], val=[1.0]),
+        ...              cplex.SparsePair(ind=[1], val=[2.0]),
+        ...              cplex.SparsePair(ind=[0, 1], val=[3.0, 4.0])])
+        >>> matbeg, matind, matval = c.variables.get_cols_csc()
+        >>> list(matbeg), list(matind), list(matval)
+        ([0, 1, 2], [0, 1, 0, 1], [1.0, 2.0, 3.0, 4.0])
+        >>> matbeg, matind, matval = c.variables.get_cols_csc(
+        ...     "x1", "x2", indptr=True)
+        >>> list(matbeg)
+        [0, 1, 3]
+        """
+        begin = 0 if begin is None else self._conv(begin)
+        end = self.get_num() - 1 if end is None else self._conv(end)
+        return _compressed_matrix_arrays(
+            CPX_PROC.getcols(self._env._e, self._cplex._lp, begin, end),
+            indptr)
+
     def get_histogram(self):
         """Returns a histogram of the columns of the linear constraint matrix.
 
@@ -1167,7 +1390,8 @@ class LinearConstraintInterface(BaseInterface):
         `Cplex` class as `Cplex.linear_constraints`.  This constructor is
         not meant to be used externally.
         """
-        super().__init__(cplex=cplex, getindexfunc=CPX_PROC.getrowindex)
+        super().__init__(cplex=cplex, getindexfunc=CPX_PROC.getrowindex,
+                         nameindex=True)
         self.advanced = AdvancedLinearConstraintInterface(self)
         """See `AdvancedLinearConstraintInterface()` """
 
@@ -1204,7 +1428,7 @@ class LinearConstraintInterface(BaseInterface):
             if range_values != []:
                 CPX_PROC.chgrngval(
                     self._env._e, self._cplex._lp,
-                    list(range(num_old_rows, num_old_rows + num_new_rows)),
+                    LAU.int_range_array(num_old_rows, num_new_rows),
                     range_values)
         else:
             if senses.find('R') != -1 and not range_values:
@@ -1270,8 +1494,102 @@ class LinearConstraintInterface(BaseInterface):
         """
         lin_expr, senses, rhs, range_values, names = init_list_args(
             lin_expr, senses, rhs, range_values, names)
-        return self._add_iter(self.get_num, self._add,
-                              lin_expr, senses, rhs, range_values, names)
+        indices = self._add_iter(self.get_num, self._add,
+                                 lin_expr, senses, rhs, range_values, names)
+        self._names_added(indices, names)
+        return indices
+
+    def _add_csr(self, rmatbeg, rmatind, rmatval, senses, rhs,
+                 range_values, names, indptr):
+        """non-public"""
+        senses = LAU.char_seq_to_str(senses)
+        arg_list = [rhs, senses, range_values, names]
+        validate_arg_lengths(
+            arg_list,
+            extra_msg=": senses, rhs, range_values, names"
+        )
+        rmatbeg = _compressed_matrix_args(rmatbeg, rmatind, rmatval,
+                                          max_arg_length(arg_list), indptr)
+        num_new_rows = len(rmatbeg)
+        num_old_rows = self.get_num()
+        if senses.find('R') != -1 and len(range_values) == 0:
+            range_values = [0.0] * len(senses)
+        CPX_PROC.addrows_csr(self._env._e, self._cplex._lp, rhs, senses,
+                             rmatbeg, rmatind, rmatval, names)
+        if len(range_values) > 0:
+            CPX_PROC.chgrngval(
+                self._env._e, self._cplex._lp,
+                LAU.int_range_array(num_old_rows, num_new_rows),
+                range_values)
+
+    def add_csr(self, rmatbeg, rmatind, rmatval, senses="", rhs=None,
+                range_values=None, names=None, indptr=False):
+        """Adds linear constraints given in compressed sparse row format.
+
+        This is a bulk alternative to `add` for large models. Instead of
+        one SparsePair per constraint, the constraint matrix is given as
+        three arrays that are passed to CPLEX as they are:
+
+        rmatbeg contains, for each new constraint, the position in
+        rmatind and rmatval at which its nonzeros begin. Its entries
+        must be nondecreasing and must not exceed the number of
+        nonzeros. If indptr is True, rmatbeg has an additional trailing
+        entry equal to the number of nonzeros, as in the indptr array
+        of a scipy.sparse.csr_matrix.
+
+        rmatind contains the column indices of the nonzeros. Variable
+        names are not accepted here.
+
+        rmatval contains the values of the nonzeros.
+
+        senses, rhs, range_values, and names have the same meaning as in
+        `add`. If more than one of them is specified, they must have the
+        same length.
+
+        rmatbeg, rmatind, rmatval, rhs, and range_values may be lists or
+        objects supporting the buffer protocol (e.g., NumPy arrays). If
+        the item types match the C types used by CPLEX (64-bit integers
+        for rmatbeg, 32-bit integers for rmatind, and float64 for the
+        others), their memory is copied directly without creating any
+        intermediate Python objects. senses may also be given as bytes.
+
+        See :cpxapi:`CPXaddrows` in the Callable Library Reference Manual
+        for more detail.
+
+        Returns an iterator containing the indices of the added linear
+        constraints.
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> indices = c.variables.add(names = ["x1", "x2", "x3"])
+        >>> indices = c.linear_constraints.add_csr(
+        ...     rmatbeg=[0, 2],
+        ...     rmatind=[0, 2, 0, 1],
+        ...     rmatval=[1.0, -1.0, 1.0, 1.0],
+        ...     senses="EL",
+        ...     rhs=[0.0, 1.0],
+        ...     names=["c0", "c1"])
+        >>> c.linear_constraints.get_rows("c1")
+        SparsePair(ind = [0, 1], val = [1.0, 1.0])
+        >>> indices = c.linear_constraints.add_csr(
+        ...     *c.linear_constraints.get_rows_csr(indptr=True),
+        ...     indptr=True)
+        >>> c.linear_constraints.get_num()
+        4
+        >>> c.linear_constraints.get_rows(3)
+        SparsePair(ind = [0, 1], val = [1.0, 1.0])
+        >>> indices = c.linear_constraints.add_csr([0, 2], [0, 1],
+        ...                                        [1.0, 1.0])
+        >>> c.linear_constraints.get_num()
+        6
+        """
+        senses, rhs, range_values, names = init_list_args(
+            senses, rhs, range_values, names)
+        indices = self._add_iter(self.get_num, self._add_csr,
+                                 rmatbeg, rmatind, rmatval, senses, rhs,
+                                 range_values, names, indptr)
+        self._names_added(indices, names)
+        return indices
 
     def delete(self, *args):
         """Removes linear constraints from the problem.
@@ -1324,7 +1642,37 @@ class LinearConstraintInterface(BaseInterface):
         """
         def _delete(begin, end=None):
             CPX_PROC.delrows(self._env._e, self._cplex._lp, begin, end)
-        delete_set_by_range(_delete, self._conv, self.get_num(), *args)
+        self._delete_set(_delete, *args)
+
+    def delete_with_remap(self, s):
+        """Deletes a set of linear constraints and returns the new indices.
+
+        s must be a sequence of linear constraint names or indices, in
+        any order. Duplicates are ignored. The linear constraints are
+        deleted with one call to CPLEX per contiguous range of indices.
+
+        Returns an array.array of C ints with one entry per linear
+        constraint before the deletion: the new index of the constraint,
+        or -1 if it was deleted. This allows callers to update their own
+        index maps without querying names.
+
+        See :cpxapi:`CPXdelrows` in the Callable Library Reference Manual
+        for more detail.
+
+        Example usage:
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> indices = c.linear_constraints.add(
+        ...     names=[str(i) for i in range(6)])
+        >>> c.linear_constraints.delete_with_remap([4, "1", 2]).tolist()
+        [0, -1, -1, 1, -1, 2]
+        >>> c.linear_constraints.get_names()
+        ['0', '3', '5']
+        """
+        def _delete(begin, end):
+            CPX_PROC.delrows(self._env._e, self._cplex._lp, begin, end)
+        return self._delete_with_remap(_delete, s)
 
     def set_rhs(self, *args):
         """Sets the righthand side of a set of linear constraints.
@@ -1388,6 +1736,7 @@ class LinearConstraintInterface(BaseInterface):
         ['c0', 'second', 'middle', 'last']
         """
         def setnames(a, b):
+            self._names_changed(a, b)
             CPX_PROC.chgrowname(self._env._e, self._cplex._lp, a, b)
         apply_pairs(setnames, self._conv, *args)
 
@@ -1831,6 +2180,51 @@ class LinearConstraintInterface(BaseInterface):
             return [m for m in mat]
         return apply_freeform_two_args(getrows, self._conv, args)
 
+    def get_rows_csr(self, begin=None, end=None, indptr=False):
+        """Returns a range of rows of the linear constraint matrix in
+        compressed sparse row format.
+
+        This is a bulk alternative to `get_rows` that does not create a
+        SparsePair per row.
+
+        begin and end must be linear constraint indices or names. The
+        rows with indices between begin and end, inclusive of end, are
+        returned. If begin is omitted, it defaults to the first linear
+        constraint. If end is omitted, it defaults to the last one.
+
+        Returns a tuple (rmatbeg, rmatind, rmatval) of array.array
+        objects with typecodes "q", "i", and "d", respectively, as
+        described for `add_csr`. If indptr is True, rmatbeg has an extra
+        trailing entry equal to the number of nonzeros, as in the indptr
+        array of a scipy.sparse.csr_matrix. All three arrays support the
+        buffer protocol, so they can be wrapped without copying (e.g.,
+        with numpy.frombuffer).
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> indices = c.variables.add(names=["x1", "x2", "x3"])
+        >>> indices = c.linear_constraints.add(
+        ...     names=["c0", "c1", "c2"],
+        ...     lin_expr=[
+        ...         cplex.SparsePair(ind=["x1", "x3"], val=[1.0, -1.0]),
+        ...         cplex.SparsePair(ind=["x1", "x2"], val=[1.0, 1.0]),
+        ...         cplex.SparsePair(ind=["x2", "x3"], val=[10.0, -2.0])
+        ...     ]
+        ... )
+        >>> rmatbeg, rmatind, rmatval = c.linear_constraints.get_rows_csr()
+        >>> list(rmatbeg), list(rmatind)
+        ([0, 2, 4], [0, 2, 0, 1, 1, 2])
+        >>> rmatbeg, rmatind, rmatval = c.linear_constraints.get_rows_csr(
+        ...     1, "c2", indptr=True)
+        >>> list(rmatbeg), list(rmatval)
+        ([0, 2, 4], [1.0, 1.0, 10.0, -2.0])
+        """
+        begin = 0 if begin is None else self._conv(begin)
+        end = self.get_num() - 1 if end is None else self._conv(end)
+        return _compressed_matrix_arrays(
+            CPX_PROC.getrows(self._env._e, self._cplex._lp, begin, end),
+            indptr)
+
     def get_num_nonzeros(self):
         """Returns the number of nonzeros in the linear constraint
         matrix.
@@ -1952,7 +2346,8 @@ class IndicatorConstraintInterface(BaseInterface):
         is not meant to be used externally.
         """
         super().__init__(cplex=cplex,
-                         getindexfunc=CPX_PROC.getindconstrindex)
+                         getindexfunc=CPX_PROC.getindconstrindex,
+                         nameindex=True)
 
     def get_num(self):
         """Returns the number of indicator constraints.
@@ -2051,9 +2446,11 @@ class IndicatorConstraintInterface(BaseInterface):
         (lin_expr, sense, rhs, indvar,
          complemented, name, indtype) = init_list_args(
              lin_expr, sense, rhs, indvar, complemented, name, indtype)
-        return self._add_iter(self.get_num, self._add_batch,
-                              lin_expr, sense, rhs, indvar, complemented,
-                              name, indtype)
+        indices = self._add_iter(self.get_num, self._add_batch,
+                                 lin_expr, sense, rhs, indvar, complemented,
+                                 name, indtype)
+        self._names_added(indices, name)
+        return indices
 
     def _add(self, lin_expr, sense, rhs, indvar, complemented, name,
              indtype):
@@ -2113,9 +2510,11 @@ class IndicatorConstraintInterface(BaseInterface):
         if lin_expr is None:
             lin_expr = SparsePair()
         # We only ever create one indicator constraint at a time.
-        return self._add_single(self.get_num, self._add, lin_expr,
-                                sense, rhs, indvar, complemented,
-                                name, indtype)
+        idx = self._add_single(self.get_num, self._add, lin_expr,
+                               sense, rhs, indvar, complemented,
+                               name, indtype)
+        self._names_added([idx], [name])
+        return idx
 
     def delete(self, *args):
         """Deletes indicator constraints from the problem.
@@ -2170,7 +2569,7 @@ class IndicatorConstraintInterface(BaseInterface):
         """
         def _delete(begin, end=None):
             CPX_PROC.delindconstrs(self._env._e, self._cplex._lp, begin, end)
-        delete_set_by_range(_delete, self._conv, self.get_num(), *args)
+        self._delete_set(_delete, *args)
 
     def get_indicator_variables(self, *args):
         """Returns the indicator variables of a set of indicator constraints.
@@ -2590,7 +2989,9 @@ class QuadraticConstraintInterface(BaseInterface):
         `Cplex` class as `Cplex.quadratic_constraints`.  This constructor
         is not meant to be used externally.
         """
-        super().__init__(cplex=cplex, getindexfunc=CPX_PROC.getqconstrindex)
+        super().__init__(cplex=cplex,
+                         getindexfunc=CPX_PROC.getqconstrindex,
+                         nameindex=True)
 
     def get_num(self):
         """Returns the number of quadratic constraints.
@@ -2673,8 +3074,10 @@ class QuadraticConstraintInterface(BaseInterface):
         if quad_expr is None:
             quad_expr = SparseTriple([0], [0], [0.0])
         # We only ever create one quadratic constraint at a time.
-        return self._add_single(self.get_num, self._add,
-                                lin_expr, quad_expr, sense, rhs, name)
+        idx = self._add_single(self.get_num, self._add,
+                               lin_expr, quad_expr, sense, rhs, name)
+        self._names_added([idx], [name])
+        return idx
 
     def delete(self, *args):
         """Deletes quadratic constraints from the problem.
@@ -2734,7 +3137,7 @@ class QuadraticConstraintInterface(BaseInterface):
         """
         def _delete(begin, end=None):
             CPX_PROC.delqconstrs(self._env._e, self._cplex._lp, begin, end)
-        delete_set_by_range(_delete, self._conv, self.get_num(), *args)
+        self._delete_set(_delete, *args)
 
     def get_rhs(self, *args):
         """Returns the righthand side of a set of quadratic constraints.
@@ -3139,7 +3542,8 @@ class SOSInterface(BaseInterface):
         `Cplex.SOS`.  This constructor is not meant to be used
         externally.
         """
-        super().__init__(cplex=cplex, getindexfunc=CPX_PROC.getsosindex)
+        super().__init__(cplex=cplex, getindexfunc=CPX_PROC.getsosindex,
+                         nameindex=True)
 
     def get_num(self):
         """Returns the number of special ordered sets."""
@@ -3184,8 +3588,10 @@ class SOSInterface(BaseInterface):
         if SOS is None:
             SOS = SparsePair([0], [0.0])
         # We only ever create one sos constraint at a time.
-        return self._add_single(self.get_num, self._add,
-                                type, SOS, name)
+        idx = self._add_single(self.get_num, self._add,
+                               type, SOS, name)
+        self._names_added([idx], [name])
+        return idx
 
     def delete(self, *args):
         """Deletes special ordered sets from the problem.
@@ -3239,7 +3645,7 @@ class SOSInterface(BaseInterface):
         """
         def _delete(begin, end=None):
             CPX_PROC.delsos(self._env._e, self._cplex._lp, begin, end)
-        delete_set_by_range(_delete, self._conv, self.get_num(), *args)
+        self._delete_set(_delete, *args)
 
     def get_sets(self, *args):
         """Returns the sets of variables and their corresponding weights.
@@ -3553,20 +3959,48 @@ class MIPStartsInterface(BaseInterface):
     def _add(self, *args):
         """non-public"""
         if len(args) == 1:
-            for arg in args[0]:
-                self._add(*arg)
+            starts = args[0]
         else:
-            if len(args) == 2:
+            starts = [args]
+        # Pack all MIP starts into a single call to CPXaddmipstarts and
+        # convert all variable names with a single conversion.
+        beg, varindices, values, effort, names = [], [], [], [], []
+        for start in starts:
+            if len(start) == 2:
                 name = ""
-            elif len(args) == 3:
-                name = args[2]
+            elif len(start) == 3:
+                name = start[2]
             else:
                 raise WrongNumberOfArgumentsError()
-            ind, val = unpack_pair(args[0])
+            ind, val = unpack_pair(start[0])
+            beg.append(len(varindices))
+            varindices.extend(ind)
+            values.extend(val)
+            effort.append(start[1])
+            names.append(name)
+        if beg:
             CPX_PROC.addmipstarts(
-                self._env._e, self._cplex._lp, [0],
-                self._cplex.variables._conv(ind),
-                val, [args[1]], [name])
+                self._env._e, self._cplex._lp, beg,
+                self._cplex.variables._conv(varindices),
+                values, effort, names)
+
+    def _add_csr(self, beg, varindices, values, effort_levels, names,
+                 indptr):
+        """non-public"""
+        validate_arg_lengths(
+            [effort_levels, names],
+            extra_msg=": effort_levels, names"
+        )
+        beg = _compressed_matrix_args(beg, varindices, values,
+                                      len(effort_levels), indptr)
+        # With no effort levels, the number of starts is taken from beg
+        # above, so a non-empty beg is caught here.
+        if len(beg) != len(effort_levels):
+            raise CplexError("inconsistent argument lengths: beg, "
+                             "effort_levels")
+        if len(beg) > 0:
+            CPX_PROC.addmipstarts(self._env._e, self._cplex._lp, beg,
+                                  varindices, values, effort_levels, names)
 
     def add(self, *args):
         """Adds MIP starts to the problem.
@@ -3615,6 +4049,64 @@ class MIPStartsInterface(BaseInterface):
         """
         return self._add_iter(self.get_num, self._add, *args)
 
+    def add_csr(self, beg, varindices, values, effort_levels, names=None,
+                indptr=False):
+        """Adds a batch of MIP starts given in compressed sparse format.
+
+        This is a bulk alternative to `add` for many large MIP starts.
+        All MIP starts are passed to CPLEX in a single call:
+
+        beg contains, for each new MIP start, the position in varindices
+        and values at which its entries begin. Its entries must be
+        nondecreasing and must not exceed the total number of entries.
+        If indptr is True, beg has an additional trailing entry equal to
+        the total number of entries, as in the indptr array of a
+        scipy.sparse.csr_matrix.
+
+        varindices contains the variable indices of the entries.
+        Variable names are not accepted here; see
+        `VariablesInterface.get_indices_array` to convert them.
+
+        values contains the values of the entries.
+
+        effort_levels contains one attribute of MIP_starts.effort_level
+        for each MIP start.
+
+        names, if given, contains the names of the MIP starts and must
+        have the same length as effort_levels.
+
+        beg, varindices, values, and effort_levels may be lists or
+        objects supporting the buffer protocol (e.g., NumPy arrays). If
+        the item types match the C types used by CPLEX (64-bit integers
+        for beg, 32-bit integers for varindices and effort_levels, and
+        float64 for values), their memory is copied directly without
+        creating any intermediate Python objects.
+
+        See :mipapi:`CPXaddmipstarts` in the Callable Library Reference
+        Manual for more detail.
+
+        Returns an iterator containing the indices of the added MIP
+        starts.
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> indices = c.variables.add(names = [str(i) for i in range(4)],
+        ...                           types = "I" * 4)
+        >>> effort = c.MIP_starts.effort_level.auto
+        >>> indices = c.MIP_starts.add_csr(
+        ...     beg=[0, 2, 3],
+        ...     varindices=[0, 1, 3],
+        ...     values=[1.0, 0.0, 2.0],
+        ...     effort_levels=[effort, effort],
+        ...     names=["s1", "s2"])
+        >>> c.MIP_starts.get_names()
+        ['s1', 's2']
+        """
+        (names,) = init_list_args(names)
+        return self._add_iter(self.get_num, self._add_csr, beg,
+                              varindices, values, effort_levels, names,
+                              indptr)
+
     def change(self, *args):
         """Changes a MIP start or set of MIP starts.
 
@@ -6216,6 +6708,120 @@ class SolnPoolInterface(BaseInterface):
         return apply_freeform_two_args(
             getx, self._cplex.variables._conv, args)
 
+    def _pool_members(self, solns):
+        """non-public"""
+        if solns is None:
+            return range(self.get_num())
+        return [soln if isinstance(soln, int) else self.get_indices(soln)
+                for soln in solns]
+
+    def get_values_matrix(self, solns=None, out=None):
+        """Returns the values of all variables for several solutions.
+
+        This is a bulk alternative to calling `get_values` once per
+        member of the solution pool.
+
+        solns must be a sequence of solution names or indices. If it is
+        omitted, all solutions in the pool are returned.
+
+        Returns a tuple (values, objective_values). values holds the
+        values of all variables for each requested solution, as a dense
+        matrix stored row by row: the value of variable j in the i-th
+        requested solution is at position i * n + j, where n is the
+        number of variables. If out is specified, it must be a writable,
+        C-contiguous object supporting the buffer protocol with float64
+        items and len(solns) * n items in total (e.g., a NumPy array of
+        shape (len(solns), n)); the values are copied into it, and values
+        is out. Otherwise, values is a new array.array('d'), which can be
+        wrapped without copying with numpy.frombuffer. objective_values
+        is an array.array('d') with the objective value of each requested
+        solution.
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> out = c.set_results_stream(None)
+        >>> out = c.set_log_stream(None)
+        >>> c.read("ind.lp")
+        >>> c.populate_solution_pool()
+        >>> values, objs = c.solution.pool.get_values_matrix([0, 1])
+        >>> n = c.variables.get_num()
+        >>> list(values[n:2 * n]) == c.solution.pool.get_values(1)
+        True
+        >>> objs[1] == c.solution.pool.get_objective_value(1)
+        True
+        """
+        solns = self._pool_members(solns)
+        num_cols = self._cplex.variables.get_num()
+        size = len(solns) * num_cols
+        if out is None:
+            values = LAU.new_double_buffer(size)
+            view = memoryview(values)
+        else:
+            values = out
+            view = memoryview(out)
+            if view.ndim > 1:
+                # Flatten; this raises a TypeError unless C-contiguous.
+                view = view.cast("B").cast(view.format)
+            # Checks the type and length of the whole buffer.
+            view = LAU.double_buffer_view(view, size)
+        objs = LAU.new_double_buffer(len(solns))
+        env, lp = self._env._e, self._cplex._lp
+        for i, soln in enumerate(solns):
+            objs[i] = CPX_PROC.getsolnpoolobjval(env, lp, soln)
+            if num_cols > 0:
+                CPX_PROC.getsolnpoolx(
+                    env, lp, soln, 0, num_cols - 1,
+                    out=view[i * num_cols:(i + 1) * num_cols])
+        return values, objs
+
+    def get_values_csr(self, solns=None, indptr=False):
+        """Returns the nonzero values of several solutions.
+
+        This is the sparse counterpart of `get_values_matrix`. solns has
+        the same meaning as there.
+
+        Returns a tuple ((matbeg, matind, matval), objective_values).
+        The first item holds the nonzero values of the variables for each
+        requested solution in compressed sparse row format, with one row
+        per solution, as described for `LinearConstraintInterface.add_csr`.
+        If indptr is True, matbeg has an extra trailing entry equal to
+        the number of nonzeros, as in the indptr array of a
+        scipy.sparse.csr_matrix. objective_values is an array.array('d')
+        with the objective value of each requested solution.
+
+        >>> import cplex
+        >>> c = cplex.Cplex()
+        >>> out = c.set_results_stream(None)
+        >>> out = c.set_log_stream(None)
+        >>> c.read("ind.lp")
+        >>> c.populate_solution_pool()
+        >>> (beg, ind, val), objs = c.solution.pool.get_values_csr(
+        ...     indptr=True)
+        >>> len(beg) == c.solution.pool.get_num() + 1
+        True
+        """
+        solns = self._pool_members(solns)
+        num_cols = self._cplex.variables.get_num()
+        matbeg = array.array("q")
+        matind = array.array("i")
+        matval = array.array("d")
+        objs = LAU.new_double_buffer(len(solns))
+        row = LAU.new_double_buffer(num_cols)
+        columns = range(num_cols)
+        env, lp = self._env._e, self._cplex._lp
+        for i, soln in enumerate(solns):
+            objs[i] = CPX_PROC.getsolnpoolobjval(env, lp, soln)
+            matbeg.append(len(matind))
+            if num_cols > 0:
+                CPX_PROC.getsolnpoolx(env, lp, soln, 0, num_cols - 1,
+                                      out=row)
+                # compress() selects the nonzeros without a Python loop.
+                matind.extend(itertools.compress(columns, row))
+                matval.extend(itertools.compress(row, row))
+        if indptr:
+            matbeg.append(len(matind))
+        return (matbeg, matind, matval), objs
+
     def get_linear_slacks(self, soln, *args):
         """Returns a set of linear slacks for a given solution.
 
@@ -7115,6 +7721,10 @@ class SolutionInterface(BaseInterface):
     """See `SolutionStatus()` """
     type = SolutionType()
     """See `SolutionType()` """
+    advanced = LazyInterface("._subinterfaces", "AdvancedSolutionInterface",
+                             """See `AdvancedSolutionInterface()` """)
+    multiobj = LazyInterface("._multiobjsoln", "MultiObjSolnInterface",
+                             """See `MultiObjSolnInterface()` """)
 
     def __init__(self, cplex):
         """Creates a new SolutionInterface.
@@ -7136,10 +7746,13 @@ class SolutionInterface(BaseInterface):
         """See `SensitivityInterface()` """
         self.pool = SolnPoolInterface(self)
         """See `SolnPoolInterface()` """
-        self.advanced = AdvancedSolutionInterface(self)
-        """See `AdvancedSolutionInterface()` """
-        self.multiobj = MultiObjSolnInterface(self)
-        """See `MultiObjSolnInterface()` """
+
+    def _get_array(self, getfn, iface, args, out):
+        """non-public"""
+        def getfn_into(begin, end, buf):
+            getfn(self._env._e, self._cplex._lp, begin, end, buf)
+        return apply_freeform_two_args_into(
+            getfn_into, iface._conv, iface.get_num(), args, out)
 
     def get_status(self):
         """Returns the status of the solution.
@@ -7210,7 +7823,7 @@ class SolutionInterface(BaseInterface):
         """
         return CPX_PROC.getobjval(self._env._e, self._cplex._lp)
 
-    def get_values(self, *args):
+    def get_values(self, *args, out=None, as_array=False):
         """Returns the values of a set of variables at the solution.
 
         Can be called by four forms.
@@ -7233,6 +7846,14 @@ class SolutionInterface(BaseInterface):
           and end, inclusive of end. Equivalent to
           solution.get_values(range(begin, end + 1)).
 
+        If out is specified, it must be a writable object supporting the
+        buffer protocol with float64 items (e.g., a NumPy float64 array)
+        and with exactly one item per requested value. The values are
+        copied into out directly, and out is returned. If as_array is
+        True and out is not specified, the values are returned in a new
+        array.array('d'). In both cases, no Python float is created per
+        value, which makes these forms preferable for large models.
+
         >>> import cplex
         >>> c = cplex.Cplex()
         >>> out = c.set_results_stream(None)
@@ -7241,13 +7862,19 @@ class SolutionInterface(BaseInterface):
         >>> c.solve()
         >>> c.solution.get_values([0, 4, 5])
         [25.5, 0.0, 80.0]
+        >>> x = c.solution.get_values(as_array=True)
+        >>> len(x) == c.variables.get_num()
+        True
         """
+        if out is not None or as_array:
+            return self._get_array(CPX_PROC.getx, self._cplex.variables,
+                                   args, out)
         def getx(a, b=self._cplex.variables.get_num() - 1):
             return CPX_PROC.getx(self._env._e, self._cplex._lp, a, b)
         return apply_freeform_two_args(
             getx, self._cplex.variables._conv, args)
 
-    def get_reduced_costs(self, *args):
+    def get_reduced_costs(self, *args, out=None, as_array=False):
         """Returns the reduced costs of a set of variables.
 
         The values returned by this method are defined to be the dual
@@ -7274,6 +7901,9 @@ class SolutionInterface(BaseInterface):
           begin and end, inclusive of end. Equivalent to
           solution.get_reduced_costs(range(begin, end + 1)).
 
+        The optional out and as_array arguments return the values in a
+        float64 buffer rather than a list (see `get_values`).
+
         >>> import cplex
         >>> c = cplex.Cplex()
         >>> out = c.set_results_stream(None)
@@ -7283,12 +7913,15 @@ class SolutionInterface(BaseInterface):
         >>> c.solution.get_reduced_costs([0, 4, 5])
         [0.0, 10.0, 0.0]
         """
+        if out is not None or as_array:
+            return self._get_array(CPX_PROC.getdj, self._cplex.variables,
+                                   args, out)
         def getdj(a, b=self._cplex.variables.get_num() - 1):
             return CPX_PROC.getdj(self._env._e, self._cplex._lp, a, b)
         return apply_freeform_two_args(
             getdj, self._cplex.variables._conv, args)
 
-    def get_dual_values(self, *args):
+    def get_dual_values(self, *args, out=None, as_array=False):
         """Returns a set of dual values.
 
         Note that the values returned by this function are not only
@@ -7320,6 +7953,9 @@ class SolutionInterface(BaseInterface):
           inclusive of end. Equivalent to
           solution.get_dual_values(range(begin, end + 1)).
 
+        The optional out and as_array arguments return the values in a
+        float64 buffer rather than a list (see `get_values`).
+
         >>> import cplex
         >>> c = cplex.Cplex()
         >>> out = c.set_results_stream(None)
@@ -7333,6 +7969,9 @@ class SolutionInterface(BaseInterface):
         True
         True
         """
+        if out is not None or as_array:
+            return self._get_array(CPX_PROC.getpi,
+                                   self._cplex.linear_constraints, args, out)
         def getpi(a, b=self._cplex.linear_constraints.get_num() - 1):
             return CPX_PROC.getpi(self._env._e, self._cplex._lp, a, b)
         return apply_freeform_two_args(
@@ -7357,7 +7996,7 @@ class SolutionInterface(BaseInterface):
             CPX_PROC.getnumqconstrs(self._env._e, self._cplex._lp),
             args)
 
-    def get_linear_slacks(self, *args):
+    def get_linear_slacks(self, *args, out=None, as_array=False):
         """Returns a set of linear slacks.
 
         Can be called by four forms.
@@ -7383,6 +8022,9 @@ class SolutionInterface(BaseInterface):
           inclusive of end. Equivalent to
           solution.get_linear_slacks(range(begin, end + 1)).
 
+        The optional out and as_array arguments return the values in a
+        float64 buffer rather than a list (see `get_values`).
+
         >>> import cplex
         >>> c = cplex.Cplex()
         >>> out = c.set_results_stream(None)
@@ -7392,6 +8034,9 @@ class SolutionInterface(BaseInterface):
         >>> abs(c.solution.get_linear_slacks(5)) < 1e-6
         True
         """
+        if out is not None or as_array:
+            return self._get_array(CPX_PROC.getslack,
+                                   self._cplex.linear_constraints, args, out)
         def getslack(a, b=self._cplex.linear_constraints.get_num() - 1):
             return CPX_PROC.getslack(self._env._e, self._cplex._lp, a, b)
         return apply_freeform_two_args(
@@ -7579,7 +8224,7 @@ class SolutionInterface(BaseInterface):
         """
         return bool(CPX_PROC.solninfo(self._env._e, self._cplex._lp)[3])
 
-    def get_activity_levels(self, *args):
+    def get_activity_levels(self, *args, out=None, as_array=False):
         """Returns the activity levels for set of linear constraints.
 
         Can be called by four forms.
@@ -7606,6 +8251,9 @@ class SolutionInterface(BaseInterface):
           end. Equivalent to
           solution.get_activity_levels(range(begin, end + 1)).
 
+        The optional out and as_array arguments return the values in a
+        float64 buffer rather than a list (see `get_values`).
+
         >>> import cplex
         >>> c = cplex.Cplex()
         >>> out = c.set_results_stream(None)
@@ -7615,6 +8263,9 @@ class SolutionInterface(BaseInterface):
         >>> c.solution.get_activity_levels([2, 3, 12])
         [80.0, 0.0, 500.0]
         """
+        if out is not None or as_array:
+            return self._get_array(CPX_PROC.getax,
+                                   self._cplex.linear_constraints, args, out)
         def getax(a, b=self._cplex.linear_constraints.get_num() - 1):
             return CPX_PROC.getax(self._env._e, self._cplex._lp, a, b)
         return apply_freeform_two_args(
@@ -8057,965 +8708,6 @@ class PresolveInterface(BaseInterface):
                                     filename)
 
 
-class FeasoptConstraintType(ConstantClass):
-    """Types of constraints"""
-    lower_bound = _constants.CPX_CON_LOWER_BOUND
-    upper_bound = _constants.CPX_CON_UPPER_BOUND
-    linear = _constants.CPX_CON_LINEAR
-    quadratic = _constants.CPX_CON_QUADRATIC
-    indicator = _constants.CPX_CON_INDICATOR
-
-
-class FeasoptInterface(BaseInterface):
-    """Finds a minimal relaxation of the problem that is feasible.
-
-    This is a callable class. To find a feasible relaxation of a problem,
-    invoke the `__call__` method of this class.
-    """
-
-    constraint_type = FeasoptConstraintType()
-    """See `FeasoptConstraintType()` """
-
-    def all_constraints(self):
-        """Returns an object instructing feasopt to relax all constraints.
-
-        Calling Cplex.feasopt(Cplex.feasopt.all_constraints()) will
-        result in every constraint being relaxed independently with
-        equal weight.
-
-        See also the `__call__` method of this class.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> group = c.feasopt.all_constraints()
-        """
-        gp = self.upper_bound_constraints()._gp
-        gp += self.lower_bound_constraints()._gp
-        gp += self.linear_constraints()._gp
-        gp += self.quadratic_constraints()._gp
-        gp += self.indicator_constraints()._gp
-        return _group(gp)
-
-    def upper_bound_constraints(self, *args):
-        """Returns an object instructing feasopt to relax all upper bounds.
-
-        If called with no arguments, every upper bound is assigned
-        weight 1.0.
-
-        If called with one or more arguments, every upper bound is
-        assigned a weight equal to the float passed in as the first
-        argument.
-
-        If additional arguments are specified, they determine a subset
-        of upper bounds to be relaxed.  If one variable index or name
-        is specified, it is the only upper bound that can be relaxed.
-        If two variable indices or names are specified, then upper
-        bounds of all variables between the first and the second,
-        inclusive, can be relaxed.  If a sequence of variable names or
-        indices is passed in, all of their upper bounds can be
-        relaxed.
-
-        See also the `__call__` method of this class.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> group = c.feasopt.upper_bound_constraints()
-        """
-        return self._make_group(self.constraint_type.upper_bound, *args)
-
-    def lower_bound_constraints(self, *args):
-        """Returns an object instructing feasopt to relax all lower bounds.
-
-        If called with no arguments, every lower bound is assigned
-        weight 1.0.
-
-        If called with one or more arguments, every lower bound is
-        assigned a weight equal to the float passed in as the first
-        argument.
-
-        If additional arguments are specified, they determine a subset
-        of lower bounds to be relaxed.  If one variable index or name
-        is specified, it is the only lower bound that can be relaxed.
-        If two variable indices or names are specified, then lower
-        bounds of all variables between the first and the second,
-        inclusive, can be relaxed.  If a sequence of variable names or
-        indices is passed in, all of their lower bounds can be
-        relaxed.
-
-        See also the `__call__` method of this class.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> group = c.feasopt.lower_bound_constraints()
-        """
-        return self._make_group(self.constraint_type.lower_bound, *args)
-
-    def linear_constraints(self, *args):
-        """Returns an object instructing feasopt to relax all linear constraints.
-
-        If called with no arguments, every linear constraint is
-        assigned weight 1.0.
-
-        If called with one or more arguments, every linear constraint
-        is assigned a weight equal to the float passed in as the first
-        argument.
-
-        If additional arguments are specified, they determine a subset
-        of linear constraints to be relaxed.  If one linear constraint
-        index or name is specified, it is the only linear constraint
-        that can be relaxed.  If two linear constraint indices or
-        names are specified, then all linear constraints between the
-        first and the second, inclusive, can be relaxed.  If a sequence
-        of linear constraint names or indices is passed in, all of their
-        linear constraints can be relaxed.
-
-        See also the `__call__` method of this class.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> group = c.feasopt.linear_constraints()
-        """
-        return self._make_group(self.constraint_type.linear, *args)
-
-    def quadratic_constraints(self, *args):
-        """Returns an object instructing feasopt to relax all quadratic constraints.
-
-        If called with no arguments, every quadratic constraint is
-        assigned weight 1.0.
-
-        If called with one or more arguments, every quadratic
-        constraint is assigned a weight equal to the float passed in
-        as the first argument.
-
-        If additional arguments are specified, they determine a subset
-        of quadratic constraints to be relaxed.  If one quadratic
-        constraint index or name is specified, it is the only
-        quadratic constraint that can be relaxed.  If two quadratic
-        constraint indices or names are specified, then all quadratic
-        constraints between the first and the second, inclusive, can be
-        relaxed.  If a sequence of quadratic constraint names or indices
-        is passed in, all of their quadratic constraints can be relaxed.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> group = c.feasopt.quadratic_constraints()
-        """
-        return self._make_group(self.constraint_type.quadratic, *args)
-
-    def indicator_constraints(self, *args):
-        """Returns an object instructing feasopt to relax all indicator constraints.
-
-        If called with no arguments, every indicator constraint is
-        assigned weight 1.0.
-
-        If called with one or more arguments, every indicator
-        constraint is assigned a weight equal to the float passed in
-        as the first argument.
-
-        If additional arguments are specified, they determine a subset
-        of indicator constraints to be relaxed.  If one indicator
-        constraint index or name is specified, it is the only
-        indicator constraint that can be relaxed.  If two indicator
-        constraint indices or names are specified, then all indicator
-        constraints between the first and the second, inclusive, can be
-        relaxed.  If a sequence of indicator constraint names or indices
-        is passed in, all of their indicator constraints can be relaxed.
-
-        See also the `__call__` method of this class.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> group = c.feasopt.indicator_constraints()
-        """
-        return self._make_group(self.constraint_type.indicator, *args)
-
-    def __call__(self, *args):
-        """Finds a minimal relaxation of the problem that is feasible.
-
-        This method can take arbitrarily many arguments. Either the
-        object returned by feasopt.all_constraints() or any combination
-        of constraint groups and objects returned by
-        `upper_bound_constraints()`, `lower_bound_constraints()`,
-        `linear_constraints()`, `quadratic_constraints()`, or
-        `indicator_constraints()` may be used to specify the constraints
-        to consider.
-
-        Constraint groups are sequences of length two, the first entry of
-        which is the preference for the group (a float), the second of
-        which is a sequence of pairs (type, id), where type is an
-        attribute of self.constraint_type and id is either an index or a
-        valid name for the type.
-
-        See :cpxapi:`CPXfeasoptext` in the Callable Library Reference
-        Manual.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> out = c.set_results_stream(None)
-        >>> out = c.set_log_stream(None)
-        >>> c.read("infeasible.lp")
-        >>> c.feasopt(c.feasopt.all_constraints())
-        >>> c.solution.get_objective_value()
-        2.0
-        >>> c.solution.get_values()
-        [3.0, 2.0, 3.0, 2.0]
-        """
-        if not args:
-            raise WrongNumberOfArgumentsError(
-                "Requires at least one argument")
-        gpref, gbeg, ind, indt = [], [], [], []
-        args = list(args)  # so we can call extend() below
-        for group in args:
-            if isinstance(group, _group):
-                args.extend(group._gp)
-                continue
-            gpref.append(group[0])
-            gbeg.append(len(ind))
-            for con in group[1]:
-                tran = self._getconvfunc(con[0])
-                indt.append(con[0])
-                ind.append(tran(con[1]))
-        self._cplex._setup_callbacks()
-        CPX_PROC.feasoptext(self._env._e, self._cplex._lp,
-                            gpref, gbeg, ind, indt)
-
-    def _make_group(self, which, *args):
-        conv = self._getconvfunc(which)
-        max_num = self._getnum(which)
-        return make_group(conv, max_num, which, *args)
-
-    def _getinterface(self, which):
-        contype = self.constraint_type
-        switcher = {
-            contype.lower_bound: self._cplex.variables,
-            contype.upper_bound: self._cplex.variables,
-            contype.linear: self._cplex.linear_constraints,
-            contype.quadratic: self._cplex.quadratic_constraints,
-            contype.indicator: self._cplex.indicator_constraints
-        }
-        return switcher[which]
-
-    def _getnum(self, which):
-        interface = self._getinterface(which)
-        return interface.get_num()
-
-    def _getconvfunc(self, which):
-        interface = self._getinterface(which)
-        return interface._conv
-
-
-class ConflictStatus(ConstantClass):
-    """Status codes returned by conflict.get"""
-    excluded = _constants.CPX_CONFLICT_EXCLUDED
-    possible_member = _constants.CPX_CONFLICT_POSSIBLE_MEMBER
-    member = _constants.CPX_CONFLICT_MEMBER
-
-
-class ConflictConstraintType(ConstantClass):
-    """Types of constraints"""
-    lower_bound = _constants.CPX_CON_LOWER_BOUND
-    upper_bound = _constants.CPX_CON_UPPER_BOUND
-    linear = _constants.CPX_CON_LINEAR
-    quadratic = _constants.CPX_CON_QUADRATIC
-    indicator = _constants.CPX_CON_INDICATOR
-    SOS = _constants.CPX_CON_SOS
-    pwl = _constants.CPX_CON_PWL
-
-
-class ConflictInterface(BaseInterface):
-    """Methods for identifying conflicts among constraints."""
-
-    group_status = ConflictStatus()
-    """See `ConflictStatus()` """
-    constraint_type = ConflictConstraintType()
-    """See `ConflictConstraintType()` """
-
-    def __init__(self, cplex):
-        """Creates a new ConflictInterface.
-
-        The conflict interface is exposed by the top-level `Cplex` class
-        as Cplex.conflict.  This constructor is not meant to be used
-        externally.
-        """
-        super().__init__(cplex)
-
-    def all_constraints(self):
-        """Returns an object instructing the conflict refiner to include
-        all constraints.
-
-        Calling
-        Cplex.conflict.refine(Cplex.conflict.all_constraints()) or
-        Cplex.conflict.refine_MIP_start(Cplex.conflict.all_constraints())
-        will result in every constraint being included in the search
-        for conflicts with equal preference.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> group = c.conflict.all_constraints()
-        """
-        gp = self.upper_bound_constraints()._gp
-        gp += self.lower_bound_constraints()._gp
-        gp += self.linear_constraints()._gp
-        gp += self.quadratic_constraints()._gp
-        gp += self.SOS_constraints()._gp
-        gp += self.indicator_constraints()._gp
-        gp += self.pwl_constraints()._gp
-        return _group(gp)
-
-    def upper_bound_constraints(self, *args):
-        """Returns an object instructing the conflict refiner to include
-        all upper bounds.
-
-        If called with no arguments, every upper bound is assigned
-        weight 1.0.
-
-        If called with one or more arguments, every upper bound is
-        assigned a weight equal to the float passed in as the first
-        argument.
-
-        If additional arguments are specified, they determine a subset
-        of upper bounds to be included.  If one variable index or name
-        is specified, it is the only upper bound that will be
-        included.  If two variable indices or names are specified, then
-        upper bounds of all variables between the first and the
-        second, inclusive, will be included.  If a sequence of
-        variable names or indices is passed in, all of their upper
-        bounds will be included.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> group = c.conflict.upper_bound_constraints()
-        """
-        return self._make_group(self.constraint_type.upper_bound, *args)
-
-    def lower_bound_constraints(self, *args):
-        """Returns an object instructing the conflict refiner to include
-        all lower bounds.
-
-        If called with no arguments, every lower bound is assigned
-        weight 1.0.
-
-        If called with one or more arguments, every lower bound is
-        assigned a weight equal to the float passed in as the first
-        argument.
-
-        If additional arguments are specified, they determine a subset
-        of lower bounds to be included.  If one variable index or name
-        is specified, it is the only lower bound that will be
-        included.  If two variable indices or names are specified, then
-        lower bounds of all variables between the first and the
-        second, inclusive, will be included.  If a sequence of
-        variable names or indices is passed in, all of their lower
-        bounds will be included.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> group = c.conflict.lower_bound_constraints()
-        """
-        return self._make_group(self.constraint_type.lower_bound, *args)
-
-    def linear_constraints(self, *args):
-        """Returns an object instructing the conflict refiner to include
-        all linear constraints.
-
-        If called with no arguments, every linear constraint is
-        assigned weight 1.0.
-
-        If called with one or more arguments, every linear constraint
-        is assigned a weight equal to the float passed in as the first
-        argument.
-
-        If additional arguments are specified, they determine a subset
-        of linear constraints to be included.  If one linear
-        constraint index or name is specified, it is the only linear
-        constraint that will be included.  If two linear constraint
-        indices or names are specified, then all linear constraints
-        between the first and the second, inclusive, will be included.
-        If a sequence of linear constraint names or indices is passed
-        in, they will all be included.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> group = c.conflict.linear_constraints()
-        """
-        return self._make_group(self.constraint_type.linear, *args)
-
-    def quadratic_constraints(self, *args):
-        """Returns an object instructing the conflict refiner to include
-        all quadratic constraints.
-
-        If called with no arguments, every quadratic constraint is
-        assigned weight 1.0.
-
-        If called with one or more arguments, every quadratic
-        constraint is assigned a weight equal to the float passed in
-        as the first argument.
-
-        If additional arguments are specified, they determine a subset
-        of quadratic constraints to be included.  If one quadratic
-        constraint index or name is specified, it is the only
-        quadratic constraint that will be included.  If two quadratic
-        constraint indices or names are specified, then all quadratic
-        constraints between the first and the second, inclusive, will
-        be included.  If a sequence of quadratic constraint names or
-        indices is passed in, they will all be included.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> group = c.conflict.quadratic_constraints()
-        """
-        return self._make_group(self.constraint_type.quadratic, *args)
-
-    def indicator_constraints(self, *args):
-        """Returns an object instructing the conflict refiner to include
-        all indicator constraints.
-
-        If called with no arguments, every indicator constraint is
-        assigned weight 1.0.
-
-        If called with one or more arguments, every indicator
-        constraint is assigned a weight equal to the float passed in
-        as the first argument.
-
-        If additional arguments are specified, they determine a subset
-        of indicator constraints to be included.  If one indicator
-        constraint index or name is specified, it is the only
-        indicator constraint that will be included.  If two indicator
-        constraint indices or names are specified, the all indicator
-        constraints between the first and the second, inclusive, will
-        be included.  If a sequence of indicator constraint names or
-        indices is passed in, they will all be included.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> group = c.conflict.indicator_constraints()
-        """
-        return self._make_group(self.constraint_type.indicator, *args)
-
-    def pwl_constraints(self, *args):
-        """Returns an object instructing the conflict refiner to include
-        all PWL constraints.
-
-        If called with no arguments, every PWL constraint is assigned
-        weight 1.0.
-
-        If called with one or more arguments, every PWL constraint is
-        assigned a weight equal to the float passed in as the first
-        argument.
-
-        If additional arguments are specified, they determine a subset
-        of PWL constraints to be included. If one PWL constraint index or
-        name is specified, it is the only PWL constraint that will be
-        included. If two PWL constraint indices or names are specified,
-        then all PWL constraints between the first and the second,
-        inclusive, will be included. If a sequence of PWL constraint
-        names or indices is passed in, they will all be included.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> group = c.conflict.pwl_constraints()
-        """
-        return self._make_group(self.constraint_type.pwl, *args)
-
-    def SOS_constraints(self, *args):
-        """Returns an object instructing the conflict refiner to include
-        all SOS constraints.
-
-        If called with no arguments, every SOS constraint is assigned
-        weight 1.0.
-
-        If called with one or more arguments, every SOS constraint is
-        assigned a weight equal to the float passed in as the first
-        argument.
-
-        If additional arguments are specified, they determine a subset
-        of SOS constraints to be included.  If one SOS constraint
-        index or name is specified, it is the only SOS constraint that
-        will be included.  If two SOS constraint indices or names are
-        specified, then all SOS constraints between the first and the
-        second, inclusive, will be included.  If a sequence of SOS
-        constraint names or indices is passed in, they will all be
-        included.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> group = c.conflict.SOS_constraints()
-        """
-        return self._make_group(self.constraint_type.SOS, *args)
-
-    @staticmethod
-    def _expand_groups(args):
-        """Expands group arguments passed to the refine methods
-
-        These should be either _group objects or tuples of length two
-        (the first entry of which is the preference for the group (a
-        float), the second of which is a tuple of pairs (type, id),
-        where type is an attribute of conflict.constraint_type and id is
-        either an index or a valid name for the type).
-
-        As _group objects can contain many tuples, this method makes
-        sure that the expanded order is maintained.
-        """
-        groups = []
-        for arg in args:
-            try:
-                # Grab the tuple list out of any _group objects we encounter.
-                groups.extend(arg._gp)
-            except AttributeError:
-                # Otherwise, we assume these are tuples.
-                groups.append(arg)
-        return groups
-
-    def _separate_groups(self, args):
-        """Separates group information into individual lists.
-
-        This, so they can be passed into the callable library in the
-        expected format.
-        """
-        grppref, grpbeg, grpind, grptype = [], [], [], []
-        groups = self._expand_groups(args)
-        for group in groups:
-            pref, contpl = group
-            grppref.append(pref)
-            grpbeg.append(len(grpind))
-            for contype, conid in contpl:
-                tran = self._getconvfunc(contype)
-                grptype.append(contype)
-                grpind.append(tran(conid))
-        return grppref, grpbeg, grpind, grptype
-
-    def _compose_groups(self, grppref, grpbeg, grpind, grptype):
-        """Convert individual lists of group information into group
-        format.
-
-        These are tuples of length two (the first entry of which is the
-        preference for the group (a float), the second of which is a
-        tuple of pairs (type, id), where type is an attribute of
-        conflict.constraint_type and id is either an index or a valid
-        name for the type).
-        """
-        groups = []
-        grpbeglen = len(grpbeg)
-        for i in range(grpbeglen):
-            begin = grpbeg[i]
-            if i == grpbeglen - 1:
-                end = len(grpind)
-            else:
-                end = grpbeg[i + 1]
-            groups.append((grppref[i], tuple(zip(grptype[begin:end],
-                                                 grpind[begin:end]))))
-        return groups
-
-    def _make_group(self, which, *args):
-        conv = self._getconvfunc(which)
-        max_num = self._getnum(which)
-        return make_group(conv, max_num, which, *args)
-
-    def _getinterface(self, which):
-        contype = self.constraint_type
-        switcher = {
-            contype.lower_bound: self._cplex.variables,
-            contype.upper_bound: self._cplex.variables,
-            contype.linear: self._cplex.linear_constraints,
-            contype.quadratic: self._cplex.quadratic_constraints,
-            contype.SOS: self._cplex.SOS,
-            contype.indicator: self._cplex.indicator_constraints,
-            contype.pwl: self._cplex.pwl_constraints
-        }
-        return switcher[which]
-
-    def _getnum(self, which):
-        interface = self._getinterface(which)
-        return interface.get_num()
-
-    def _getconvfunc(self, which):
-        interface = self._getinterface(which)
-        return interface._conv
-
-    def refine_MIP_start(self, MIP_start, *args):
-        """Identifies a minimal conflict among a set of constraints for a
-        given MIP start.
-
-        This method can take arbitrarily many arguments.  The first
-        argument must be either a name or index of a MIP start.
-        Additional arguments are optional and can be the object returned
-        by `all_constraints()` or any combination of constraint groups
-        and objects returned by `upper_bound_constraints()`,
-        `lower_bound_constraints()`, `linear_constraints()`,
-        `quadratic_constraints()`, `indicator_constraints()`,
-        `pwl_constraints()`, or `SOS_constraints()` may be used to
-        specify the constraints to consider. If no additional arguments
-        are specified, then constraint groups are created automatically
-        as in the CPLEX interactive.
-
-        Constraint groups are sequences of length two, the first entry
-        of which is the preference for the group (a float), the second
-        of which is a sequence of pairs (type, id), where type is an
-        attribute of conflict.constraint_type and id is either an index
-        or a valid name for the type.
-
-        See :mipapi:`CPXrefinemipstartconflictext` and in the Callable
-        Library Reference Manual.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> out = c.set_results_stream(None)
-        >>> indices = c.variables.add([1], [0], [0], c.variables.type.binary)
-        >>> indices = c.variables.add([2], [0], [0], c.variables.type.binary)
-        >>> c.solve()
-        >>> indices = c.linear_constraints.add(
-        ...     lin_expr=[[[0, 1], [1.0, 1.0]]], senses="E", rhs=[2.0])
-        >>> c.conflict.refine_MIP_start(0, c.conflict.all_constraints())
-        >>> c.conflict.get()
-        [-1, -1, -1, -1, 3]
-        >>> c.conflict.group_status[3], c.conflict.group_status[-1]
-        ('member', 'excluded')
-        >>> c.conflict.get_groups(0, 3)
-        [(1.0, ((2, 0),)), (1.0, ((2, 1),)), (1.0, ((1, 0),)), (1.0, ((1, 1),))]
-        """
-        self._cplex._setup_callbacks()
-        mipstartindex = self._cplex.MIP_starts._conv(MIP_start)
-        if args:
-            grppref, grpbeg, grpind, grptype = self._separate_groups(args)
-        else:
-            grppref, grpbeg, grpind, grptype = None, None, None, None
-        CPX_PROC.refinemipstartconflictext(self._env._e, self._cplex._lp,
-                                           mipstartindex,
-                                           grppref, grpbeg, grpind, grptype)
-
-    def refine(self, *args):
-        """Identifies a minimal conflict among a set of constraints.
-
-        This method can take arbitrarily many arguments.  Either the
-        object returned by `all_constraints()` or any combination of
-        constraint groups and objects returned by
-        `upper_bound_constraints()`, `lower_bound_constraints()`,
-        `linear_constraints()`, `quadratic_constraints()`,
-        `indicator_constraints()`, `pwl_constraints()`, or
-        `SOS_constraints()` may be used to specify the constraints to
-        consider. Alternatively, if no arguments are specified, then
-        constraint groups are created automatically as in the CPLEX
-        interactive.
-
-        Constraint groups are sequences of length two, the first entry
-        of which is the preference for the group (a float), the second
-        of which is a sequence of pairs (type, id), where type is an
-        attribute of conflict.constraint_type and id is either an index or
-        a valid name for the type.
-
-        See :cpxapi:`CPXrefineconflictext` in the Callable Library
-        Reference Manual.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> out = c.set_results_stream(None)
-        >>> c.read("infeasible.lp")
-        >>> c.conflict.refine(c.conflict.linear_constraints(),
-        ...                   c.conflict.lower_bound_constraints())
-        >>> c.conflict.get()
-        [3, -1, 3, -1, -1, -1]
-        >>> c.conflict.group_status[3], c.conflict.group_status[-1]
-        ('member', 'excluded')
-        >>> c.conflict.get_groups([0, 2])
-        [(1.0, ((3, 0),)), (1.0, ((1, 0),))]
-        """
-        self._cplex._setup_callbacks()
-        if args:
-            grppref, grpbeg, grpind, grptype = self._separate_groups(args)
-        else:
-            grppref, grpbeg, grpind, grptype = None, None, None, None
-        CPX_PROC.refineconflictext(self._env._e, self._cplex._lp,
-                                   grppref, grpbeg, grpind, grptype)
-
-    def get(self, *args):
-        """Returns the status of a set of groups of constraints.
-
-        Can be called by four forms.
-
-        If called with no arguments, returns a list containing the
-        status of all constraint groups.
-
-        If called with one integer argument, returns the status of
-        that constraint group.
-
-        If called with two integer arguments, returns the status of
-        all constraint groups between the first and second argument,
-        inclusive.
-
-        If called with a sequence of integers as its argument, returns
-        the status of all constraint groups in the sequence.
-
-        The status codes are attributes of
-        Cplex.conflict.group_status.
-
-        See :cpxapi:`CPXgetconflictext` in the Callable Library Reference
-        Manual.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> out = c.set_results_stream(None)
-        >>> c.read("infeasible.lp")
-        >>> c.conflict.refine(c.conflict.all_constraints())
-        >>> confstatus = c.conflict.get()
-        """
-        def getconflict(a, b=self.get_num_groups() - 1):
-            return CPX_PROC.getconflictext(self._env._e, self._cplex._lp, a, b)
-        return apply_freeform_two_args(getconflict, None, args)
-
-    def get_num_groups(self):
-        """Returns the number of constraint groups used in the last call
-        to `refine()` or `refine_MIP_start()`.
-
-        See :cpxapi:`CPXgetconflictnumgroups` in the Callable Library
-        Reference Manual.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> out = c.set_results_stream(None)
-        >>> c.read("infeasible.lp")
-        >>> c.conflict.refine(c.conflict.all_constraints())
-        >>> c.conflict.get_num_groups()
-        10
-        """
-        return CPX_PROC.getconflictnumgroups(self._env._e, self._cplex._lp)
-
-    def get_groups(self, *args):
-        """Returns the groups of constraints used in the last call to
-        `refine()` or `refine_MIP_start()`.
-
-        Can be called by four forms.
-
-        If called with no arguments, returns a list containing all
-        constraint groups.
-
-        If called with one integer argument, returns that constraint
-        group.
-
-        If called with two integer arguments, returns all constraint
-        groups between the first and second argument, inclusive.
-
-        If called with a sequence of integers as its argument, returns
-        all constraint groups in the sequence.
-
-        Constraint groups are tuples of length two, the first entry of
-        which is the preference for the group (a float), the second of
-        which is a tuple of pairs (type, id), where type is an
-        attribute of conflict.constraint_type and id is either an index
-        or a valid name for the type.
-
-        See :cpxapi:`CPXgetconflictgroups` in the Callable Library
-        Reference Manual.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> out = c.set_results_stream(None)
-        >>> c.read("infeasible.lp")
-        >>> c.conflict.refine(c.conflict.all_constraints())
-        >>> groups = c.conflict.get_groups()
-        """
-        def getgroups(begin, end=self.get_num_groups() - 1):
-            (grppref, grpbeg, grpind,
-             grptype) = CPX_PROC.getconflictgroups(self._env._e,
-                                                   self._cplex._lp,
-                                                   begin, end)
-            return self._compose_groups(grppref, grpbeg, grpind, grptype)
-        return apply_freeform_two_args(getgroups, None, args)
-
-    def write(self, filename):
-        """Writes the conflict to a file.
-
-        See :cpxapi:`CPXclpwrite` in the Callable Library Reference
-        Manual.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> out = c.set_results_stream(None)
-        >>> c.read("infeasible.lp")
-        >>> c.conflict.refine(c.conflict.all_constraints())
-        >>> c.conflict.write("conflict.clp")
-        """
-        CPX_PROC.clpwrite(self._env._e, self._cplex._lp, filename)
-
-
-class PivotVarStatus(ConstantClass):
-    """Use as input to pivoting methods."""
-    at_lower_bound = _constants.CPX_AT_LOWER
-    at_upper_bound = _constants.CPX_AT_UPPER
-
-
-class AdvancedCplexInterface(BaseInterface):
-    """Advanced control of a Cplex object."""
-
-    no_variable = _constants.CPX_NO_VARIABLE
-    """See `_constants.CPX_NO_VARIABLE` """
-    variable_status = PivotVarStatus()
-    """See `PivotVarStatus()` """
-
-    def delete_names(self):
-        """Deletes all names from the problem and its objects."""
-        CPX_PROC.delnames(self._env._e, self._cplex._lp)
-
-    def basic_presolve(self):
-        """Performs bound strengthening and detects redundant rows.
-
-        Returns a tuple containing three lists: a list containing the
-        strengthened lower bounds, a list containing the strengthened
-        upper bounds, and a list containing the status of each row.
-
-        See :cpxapi:`CPXbasicpresolve` in the Callable Library Reference
-        Manual.
-
-        Note
-          This method does not create a presolved problem.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> out = c.set_results_stream(None)
-        >>> out = c.set_log_stream(None)
-        >>> c.read("lpex.mps")
-        >>> redlb, redub, rstat = c.advanced.basic_presolve()
-        """
-        return CPX_PROC.basicpresolve(self._env._e, self._cplex._lp)
-
-    def pivot(self, enter, leave, status):
-        """Pivots a variable into the basis.
-
-        enter is a name or index of a variable or linear constraint.
-        The index of a slack variable is specified by a negative
-        integer; -i - 1 refers to the slack associated with the ith
-        linear constraint.  enter must not identify a basic variable.
-
-        leave is a name or index of a variable or linear constraint.
-        The index of a slack variable is specified by a negative
-        integer; -i - 1 refers to the slack associated with the ith
-        linear constraint.  leave must identify either a basic
-        variable or a non-basic variable with both a lower and upper
-        bound to indicate that it is to move to its opposite bound.
-        leave may also be set to Cplex.advanced.no_variable to
-        instruct CPLEX to use a ratio test to determine the entering
-        variable.
-
-        Note
-          If a linear constraint has the same name as a column, it must
-          be specified by -index - 1, not by name.
-
-        status must be an attribute of Cplex.advanced.variable_status
-        specifying the nonbasic status to be assigned to the leaving
-        variable after the basis change.
-
-        """
-        def conv(var):
-            try:
-                return self._cplex.variables._conv(var)
-            except CplexSolverError:
-                # Variable name not found, try linear constraints.
-                return -self._cplex.linear_constraints._conv(var) - 1
-        CPX_PROC.pivot(self._env._e, self._cplex._lp, conv(enter),
-                       conv(leave), status)
-
-    def pivot_slacks_in(self, which):
-        """Forcibly pivots slack variables into the basis.
-
-        which may be either a single linear constraint index or name
-        or a sequence of linear constraint indices or names.
-
-        """
-        x = listify(self._cplex.linear_constraints._conv(which))
-        CPX_PROC.pivotin(self._env._e, self._cplex._lp, x)
-
-    def pivot_fixed_variables_out(self, which):
-        """Forcibly pivots structural variables out of the basis.
-
-        which may be either a single variable index or name or a
-        sequence of variable indices or names.
-
-        """
-        x = listify(self._cplex.variables._conv(which))
-        CPX_PROC.pivotout(self._env._e, self._cplex._lp, x)
-
-    def strong_branching(self, variables, it_limit):
-        """Performs strong branching.
-
-        variables is a sequence of names or indices of variables.
-
-        it_limit is an integer that specifies the number of iterations
-        allowed.
-
-        Returns a list of pairs (down_penalty, up_penalty) with the
-        same length as variables containing the penalties for
-        branching down or up, respectively, on each variable.
-
-        See :cpxapi:`CPXstrongbranch` in the Callable Library Reference
-        Manual for more detail.
-
-        Example usage:
-
-        >>> import cplex
-        >>> c = cplex.Cplex()
-        >>> out = c.set_results_stream(None)
-        >>> out = c.set_log_stream(None)
-        >>> itlim = c.parameters.simplex.limits.iterations.get()
-        >>> c.read("example.mps")
-        >>> c.solve()
-        >>> vars = list(range(c.variables.get_num()))
-        >>> result = c.advanced.strong_branching(vars, itlim)
-        """
-        def conv(var):
-            return self._cplex.variables._conv(var)
-        return unzip(CPX_PROC.strongbranch(
-            self._env._e, self._cplex._lp,
-            conv(variables), it_limit))
-
-    def complete(self):
-        """See :cpxapi:`CPXcompletelp` in the Callable Library Reference
-        Manual."""
-        CPX_PROC.completelp(self._env._e, self._cplex.lp)
-
-
 class BranchDirection(ConstantClass):
     """Constants defining branch directions"""
     default = _constants.CPX_BRANCH_GLOBAL
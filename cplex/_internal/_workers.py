@@ -0,0 +1,120 @@
+# --------------------------------------------------------------------------
+# File: _workers.py
+# ---------------------------------------------------------------------------
+# Licensed Materials - Property of IBM
+# 5725-A06 5725-A29 5724-Y48 5724-Y49 5724-Y54 5724-Y55 5655-Y21
+# Copyright IBM Corporation 2008, 2022. All Rights Reserved.
+#
+# US Government Users Restricted Rights - Use, duplication or
+# disclosure restricted by GSA ADP Schedule Contract with
+# IBM Corp.
+# ------------------------------------------------------------------------
+"""Task functions executed in worker processes.
+
+The functions in this module are submitted to a
+concurrent.futures.ProcessPoolExecutor.  Each worker process keeps a
+single Cplex object that is reused for all of the tasks it runs.
+Parameter settings are passed as lists of (parameter ID, value) pairs
+so that tasks and their results can be pickled.
+
+Worker processes are started with the "spawn" method, because forking
+a process that holds live CPLEX environments is not safe.  As with any
+spawned process pool, scripts that use it must guard their main code
+with an if __name__ == "__main__": block.
+"""
+import concurrent.futures
+import multiprocessing
+import os
+
+from . import _constants
+from ..exceptions import CplexError
+
+_worker_cplex = None
+
+
+def _get_cplex():
+    """non-public"""
+    global _worker_cplex  # pylint: disable=global-statement
+    if _worker_cplex is None:
+        # Imported here to avoid a circular import; this module is only
+        # used from within worker processes.
+        from .. import Cplex  # pylint: disable=import-outside-toplevel
+        cpx = Cplex()
+        cpx.set_results_stream(None)
+        cpx.set_log_stream(None)
+        cpx.set_warning_stream(None)
+        cpx.set_error_stream(None)
+        _worker_cplex = cpx
+    return _worker_cplex
+
+
+def _apply_settings(cpx, threads, settings):
+    """non-public"""
+    params = cpx.parameters
+    params.reset()
+    if threads is not None:
+        params.threads.set(threads)
+    for (param_id, value) in settings:
+        params._set(param_id, value)
+
+
+def num_workers(workers=None):
+    """Returns the number of worker processes to start.
+
+    If workers is None, one worker is started per CPU.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    return workers
+
+
+def make_executor(workers=None):
+    """Returns a process pool with the given number of workers."""
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=num_workers(workers),
+        mp_context=multiprocessing.get_context("spawn"))
+
+
+def tune_run(filename, filetype, threads, settings):
+    """Solves a problem file and returns the deterministic time used.
+
+    The parameters are reset to their defaults, then threads (if not
+    None) and settings are applied before the problem is read and
+    solved.  If reading or solving fails, float("inf") is returned so
+    that the settings rank last.
+    """
+    cpx = _get_cplex()
+    try:
+        _apply_settings(cpx, threads, settings)
+        cpx.read(filename, filetype)
+        start = cpx.get_dettime()
+        cpx.solve()
+        return cpx.get_dettime() - start
+    except CplexError:
+        return float("inf")
+
+
+def solve_run(data, threads, settings):
+    """Solves a problem given as SAV bytes.
+
+    The parameters are handled as in tune_run.  Returns a tuple
+    (status, objective, values, error).  objective and values (an
+    array.array of doubles) are None if no solution is available, and
+    error holds the message of a CplexError raised while reading or
+    solving, in which case status is None.
+    """
+    cpx = _get_cplex()
+    try:
+        _apply_settings(cpx, threads, settings)
+        cpx.read_from_bytes(data, "SAV")
+        cpx.solve()
+        solution = cpx.solution
+        status = solution.get_status()
+        if solution.get_solution_type() == _constants.CPX_NO_SOLN:
+            return status, None, None, None
+        return (status, solution.get_objective_value(),
+                solution.get_values(as_array=True), None)
+    except CplexError as exc:
+        return None, None, None, str(exc)
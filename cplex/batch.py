@@ -0,0 +1,147 @@
+# --------------------------------------------------------------------------
+# File: batch.py
+# ---------------------------------------------------------------------------
+# Licensed Materials - Property of IBM
+# 5725-A06 5725-A29 5724-Y48 5724-Y49 5724-Y54 5724-Y55 5655-Y21
+# Copyright IBM Corporation 2008, 2022. All Rights Reserved.
+#
+# US Government Users Restricted Rights - Use, duplication or
+# disclosure restricted by GSA ADP Schedule Contract with
+# IBM Corp.
+# --------------------------------------------------------------------------
+"""Batch solve API
+
+Solves many independent models concurrently in a pool of worker
+processes.  Each worker process holds its own Cplex object; models are
+shipped to the workers in SAV format and the results are streamed back
+as they become available.
+"""
+import concurrent.futures
+
+from ._internal import _workers
+from .paramset import ParameterSet, _get_id
+
+__all__ = ["BatchResult", "solve_many"]
+
+
+class BatchResult():
+    """The result of solving one model with `solve_many()`.
+
+    An instance of this class has the following members:
+
+    * index: the position of the model in the models argument
+    * status: the solution status, an attribute of
+      Cplex.solution.status, or None if an error occurred
+    * objective: the objective value, or None if no solution is
+      available
+    * values: the values of the variables as an array.array of
+      doubles, or None if no solution is available
+    * error: the message of the error raised while reading or solving
+      the model (or while passing it to or from the worker process),
+      or None
+    """
+
+    def __init__(self, index, status, objective, values, error):
+        """non-public"""
+        self.index = index
+        self.status = status
+        self.objective = objective
+        self.values = values
+        self.error = error
+
+    def __repr__(self):
+        """Returns a short description of the result."""
+        return "BatchResult(index={0}, status={1}, objective={2})".format(
+            self.index, self.status, self.objective)
+
+
+def _settings_list(parameters):
+    """non-public"""
+    if parameters is None:
+        return []
+    if isinstance(parameters, ParameterSet):
+        return [(param_id, parameters.get(param_id))
+                for param_id in parameters.get_ids()]
+    return [(_get_id(param), value) for (param, value) in parameters]
+
+
+def _model_data(model):
+    """non-public"""
+    if isinstance(model, bytes):
+        return model
+    if isinstance(model, (bytearray, memoryview)):
+        # memoryview objects cannot be pickled; copy other buffers too
+        # so that the model is not modified while it is queued.
+        return bytes(model)
+    return model.write_as_string("sav")
+
+
+def _task_result(index, future):
+    """non-public"""
+    try:
+        return BatchResult(index, *future.result())
+    except Exception as exc:  # pylint: disable=broad-except
+        # E.g., a task that cannot be pickled or a worker process that
+        # died; report it for this model instead of ending the batch.
+        return BatchResult(index, None, None, None, str(exc))
+
+
+def solve_many(models, workers=None, threads_per_worker=1,
+               parameters=None):
+    """Solves models in a pool of worker processes.
+
+    models must be an iterable whose members are either Cplex objects
+    or bytes-like objects holding problems in SAV format.  Models are
+    serialized lazily, so at most a few models per worker are held in
+    memory at a time.
+
+    workers is the number of worker processes; if it is None, one
+    worker is started per CPU.  If threads_per_worker is not None, the
+    threads parameter is set to it for every solve.
+
+    If parameters is given, it may be either a ParameterSet instance or
+    a sequence of sequences of length 2 containing instances of the
+    Parameter class and their values.  The parameters of each worker
+    are reset to their defaults and then set to these values before
+    every solve; the parameter settings of the models themselves are
+    not used.
+
+    The worker processes are spawned rather than forked, so a script
+    calling solve_many must guard its main code with
+    an if __name__ == "__main__": block.
+
+    solve_many is a generator that yields a `BatchResult` for each
+    model in the order in which the solves finish.
+
+    >>> import cplex
+    >>> import cplex.batch
+    >>> c = cplex.Cplex()
+    >>> c.read("lpex.mps")
+    >>> results = list(cplex.batch.solve_many([c, c], workers=2))
+    >>> sorted(r.index for r in results)
+    [0, 1]
+    """
+    settings = _settings_list(parameters)
+    models = enumerate(models)
+    workers = _workers.num_workers(workers)
+    max_pending = 2 * workers
+    with _workers.make_executor(workers) as executor:
+        pending = {}
+        try:
+            while True:
+                for (index, model) in models:
+                    future = executor.submit(
+                        _workers.solve_run, _model_data(model),
+                        threads_per_worker, settings)
+                    pending[future] = index
+                    if len(pending) >= max_pending:
+                        break
+                if not pending:
+                    return
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    yield _task_result(pending.pop(future), future)
+        finally:
+            for future in pending:
+                future.cancel()
@@ -50,6 +50,11 @@ Note
   registered, there will be a single instance of each of your callback
   classes shared among all threads.
 """
+import array
+import functools
+import math
+import threading
+import time
 import weakref
 
 from . import _internal
@@ -58,22 +63,97 @@ from ._internal import _constants as _const
 from ._internal._solutionstrategyenum import SolutionStrategy
 from ._internal import _procedural as _proc
 from ._internal._aux_functions import (apply_freeform_two_args,
+                                       apply_freeform_two_args_into,
                                        apply_freeform_one_arg,
                                        init_list_args, convert, max_arg_length,
                                        validate_arg_lengths, unzip)
 from ._internal._matrices import SparsePair, _HBMatrix, unpack_pair
 from ._internal._subinterfaces import SolutionStatus
 from ._internal import _pycplex
+from ._internal import _list_array_utils as LAU
 from .exceptions import (CplexError, CplexSolverError,
                          WrongNumberOfArgumentsError)
 from .constant_class import ConstantClass
 from .exceptions.error_codes import CPXERR_UNSUPPORTED_OPERATION
 
+def _name_index_map(names):
+    """non-public"""
+    index = {}
+    for i, name in enumerate(names):
+        if name is not None:
+            index.setdefault(name, i)
+    return index
+
+
+class _ProblemSnapshot():
+    """non-public
+
+    Problem data that does not change during a solve.  It is read once
+    per solve by `Cplex` for callbacks that set use_snapshot.
+    """
+
+    def __init__(self, env, lp):
+        self.num_cols = _proc.getnumcols(env, lp)
+        self.num_rows = _proc.getnumrows(env, lp)
+        if self.num_cols > 0:
+            self.obj = _proc.getobj(env, lp, 0, self.num_cols - 1)
+            self.col_index = _name_index_map(
+                _proc.getcolname(env, lp, 0, self.num_cols - 1))
+        else:
+            self.obj = []
+            self.col_index = {}
+        if self.num_rows > 0:
+            self.row_index = _name_index_map(
+                _proc.getrowname(env, lp, 0, self.num_rows - 1))
+        else:
+            self.row_index = {}
+
+
+def _profiled_call(call):
+    """non-public
+
+    Wraps the __call__ method of a legacy callback class so that the
+    invocation is timed while the callback belongs to a profiled solve
+    (see `Cplex.set_callback_profiling`).  Only the outermost __call__
+    of an instance is timed, so that a __call__ calling super().__call__
+    is not counted twice.
+    """
+    @functools.wraps(call)
+    def __call__(self):
+        profile = self._callback_profile
+        if profile is None or type(self).__call__ is not __call__:
+            return call(self)
+        return profile._time_call(self._profile_name, call, self)
+    __call__._profiled = True
+    return __call__
+
+
 class Callback():
     """Base class for Cplex callback classes.
 
     """
 
+    use_snapshot = False
+    """If True, problem data that cannot change during a solve is read
+    once when the solve starts and is served from memory afterwards.
+
+    This applies to the number of columns and rows, the objective
+    coefficients, and the conversion of variable and linear constraint
+    names to indices.  Set it to True in a subclass whose instances
+    query these data very often.
+    """
+
+    # Set by Cplex for the duration of a profiled solve.
+    _callback_profile = None
+    _profile_name = None
+
+    def __init_subclass__(cls, **kwargs):
+        """non-public"""
+        super().__init_subclass__(**kwargs)
+        call = cls.__dict__.get("__call__")
+        if call is not None and not getattr(call, "_profiled", False):
+            cls.__call__ = _profiled_call(call)
+
     def __init__(self, env):
         """non-public"""
         self._env = weakref.proxy(env)
@@ -82,6 +162,7 @@ class Callback():
         self._cbstruct = None
         self._env_lp_ptr = None
         self._status = 0
+        self._snapshot = None
 
     def __call__(self):
         """Method to be overridden by user-defined callback class.
@@ -91,20 +172,38 @@ class Callback():
         raise CplexError("Callback.__call__ is a pure virtual method")
 
     def _conv_col(self, name, cache=None):
+        profile = self._callback_profile
+        if profile is not None:
+            return profile._time_conversion(
+                convert, name, self._get_col_index, cache)
         return convert(name, self._get_col_index, cache)
 
     def _get_col_index(self, name):
         """non-public"""
+        if self._snapshot is not None:
+            try:
+                return self._snapshot.col_index[name]
+            except KeyError:
+                pass  # Let CPLEX report the unknown name.
         status = _pycplex.cb_getcolindex(
             self._cbstruct, self._env_lp_ptr, name)
         _proc.check_status(self._cbstruct, status[0], from_cb=True)
         return status[1]
 
     def _conv_row(self, name, cache=None):
+        profile = self._callback_profile
+        if profile is not None:
+            return profile._time_conversion(
+                convert, name, self._get_row_index, cache)
         return convert(name, self._get_row_index, cache)
 
     def _get_row_index(self, name):
         """non-public"""
+        if self._snapshot is not None:
+            try:
+                return self._snapshot.row_index[name]
+            except KeyError:
+                pass  # Let CPLEX report the unknown name.
         status = _pycplex.cb_getrowindex(
             self._cbstruct, self._env_lp_ptr,
             name)
@@ -237,10 +336,14 @@ class OptimizationCallback(Callback):
 
     def get_num_cols(self):
         """Returns the number of variables in the problem."""
+        if self._snapshot is not None:
+            return self._snapshot.num_cols
         return _pycplex.cb_getnumcols(self._cbstruct, self._env_lp_ptr)
 
     def get_num_rows(self):
         """Returns the number of linear constraints in the problem."""
+        if self._snapshot is not None:
+            return self._snapshot.num_rows
         return _pycplex.cb_getnumrows(self._cbstruct, self._env_lp_ptr)
 
 
@@ -741,11 +844,22 @@ class MIPCallback(MIPInfoCallback):
           indices between begin and end, inclusive of end. Equivalent to
           self.get_objective_coefficients(range(begin, end + 1))
         """
-        def getobj(begin, end=self.get_num_cols() - 1):
-            status = _pycplex.cb_getobj(self._cbstruct, self._env_lp_ptr,
-                                        begin, end)
-            _proc.check_status(self._cbstruct, status[0], from_cb=True)
-            return status[1]
+        if self._snapshot is not None:
+            obj = self._snapshot.obj
+
+            def getobj(begin, end=len(obj) - 1):
+                # Check the range as CPXgetobj does; slicing would
+                # silently return a short or empty list instead.
+                if not 0 <= begin <= end + 1 <= len(obj):
+                    raise CplexError("index out of range: {0}".format(
+                        begin if not 0 <= begin < len(obj) else end))
+                return obj[begin:end + 1]
+        else:
+            def getobj(begin, end=self.get_num_cols() - 1):
+                status = _pycplex.cb_getobj(self._cbstruct,
+                                            self._env_lp_ptr, begin, end)
+                _proc.check_status(self._cbstruct, status[0], from_cb=True)
+                return status[1]
         return apply_freeform_two_args(
             getobj, self._conv_col, args)
 
@@ -1603,6 +1717,13 @@ class HeuristicCallback(HSCallback):
         self._cb_type_string = "heuristic"
         self._cb_set_function = _proc.setheuristiccallbackfunc
         self._x = []
+        self._obj_coef = None
+
+    def _setup(self, e, lp):
+        super()._setup(e, lp)
+        # The objective does not change during a solve; it is fetched
+        # the first time set_solution needs it.
+        self._obj_coef = None
 
     def set_bounds(self, *args):
         """Sets the bounds for a set of variables.
@@ -1675,20 +1796,30 @@ class HeuristicCallback(HSCallback):
 
         If objective_value is specified, it is taken as the objective
         value of the new solution.  Otherwise, the objective value is
-        computed.
+        computed from the objective value at the current node and the
+        linear objective coefficients of the variables that are
+        changed.  For problems with a quadratic objective,
+        objective_value should therefore be specified.
 
         Do not call this method multiple times.
         Calling it again will overwrite any previously specified solution.
         """
         vars, vals = unpack_pair(solution)
         vars = self._conv_col(vars)
-        for i, v in enumerate(vars):
-            self._x[v] = vals[i]
+        x = self._x
         if objective_value is None:
-            objective_value = 0.0
-            obj_coef = self.get_objective_coefficients()
-            for i, v in enumerate(self._x):
-                objective_value += v * obj_coef[i]
+            if self._obj_coef is None:
+                self._obj_coef = self.get_objective_coefficients()
+            obj_coef = self._obj_coef
+            # Only the changed entries are visited, so the cost does not
+            # depend on the number of columns.
+            objective_value = self.get_objective_value()
+            for v, val in zip(vars, vals):
+                objective_value += obj_coef[v] * (val - x[v])
+                x[v] = val
+        else:
+            for v, val in zip(vars, vals):
+                x[v] = val
         self._objective_value = objective_value
         self._useraction = _const.CPX_CALLBACK_SET
         self._check_feasibility = 1
@@ -2224,6 +2355,19 @@ class Context():
         self._cpx = cpx
         self._contextptr = contextptr
         self._contextid = contextid
+        self._buffers = {}
+        self._cut_pool = None
+
+    def _reset(self, contextptr, contextid):
+        """non-public
+
+        Rebinds a pooled context to a new invocation of the callback.
+        """
+        self._contextptr = contextptr
+        self._contextid = contextid
+        if self._cut_pool is not None:
+            # Left over if the previous invocation raised an exception.
+            self._cut_pool._discard()
 
     def _get_column_index(self, name):
         """non-public"""
@@ -2233,7 +2377,37 @@ class Context():
 
     def _get_column_count(self):
         """non-public"""
-        return _proc.getnumcols(self._cpx._env._e, self._cpx._lp)
+        # The number of columns cannot change during a solve, so it is
+        # read once per solve by Cplex._setup_callbacks.
+        num_cols = self._cpx._generic_num_cols
+        if num_cols is None:
+            num_cols = _proc.getnumcols(self._cpx._env._e, self._cpx._lp)
+        return num_cols
+
+    def _thread_buffer(self, key, length):
+        """non-public
+
+        Returns a float64 array of the given length that is reused by
+        the calls with the same key on this context.  Contexts are pooled
+        per thread by Cplex._invoke_generic_callback, so the buffers are
+        never shared between threads.
+        """
+        buffers = self._buffers
+        buf = buffers.get(key)
+        if buf is None or len(buf) != length:
+            buf = buffers[key] = LAU.new_double_buffer(length)
+        return buf
+
+    def _get_array(self, getfn, args, out):
+        """non-public"""
+        def getfn_into(begin, end, buf):
+            getfn(self._contextptr, begin, end, buf)
+
+        def allocate(length):
+            return self._thread_buffer(getfn, length)
+        return apply_freeform_two_args_into(
+            getfn_into, self._colname2idx, self._get_column_count(), args,
+            out, allocate)
 
     def _colname2idx(self, name, cache=None):
         """non-public"""
@@ -2357,7 +2531,7 @@ class Context():
         """
         _proc.callbackabort(self._contextptr)
 
-    def get_relaxation_point(self, *args):
+    def get_relaxation_point(self, *args, out=None, as_array=False):
         """Returns the solution to the current relaxation.
 
         This method can only be invoked if `get_id()` returns
@@ -2389,9 +2563,21 @@ class Context():
           between begin and end, inclusive of end. Equivalent to
           self.get_relaxation_point(range(begin, end + 1)).
 
+        If out is specified, it must be a writable object supporting the
+        buffer protocol with float64 items (e.g., a NumPy float64 array)
+        and with exactly one item per requested value. The values are
+        copied into out directly, and out is returned. If as_array is
+        True and out is not specified, the values are returned in an
+        array.array('d') that belongs to the current thread and is
+        reused by the next call of the same method in that thread; copy
+        it if the values are needed later. Neither form creates a Python
+        float per value, which makes them preferable for large models.
+
         See :cpxapi:`CPXcallbackgetrelaxationpoint` in the Callable
         Library Reference Manual for more detail.
         """
+        if out is not None or as_array:
+            return self._get_array(_proc.callbackgetrelaxationpoint, args, out)
         def callbackgetrelaxationpoint(begin, end=self._get_column_count() - 1):
             return _proc.callbackgetrelaxationpoint(self._contextptr, begin, end)
         return apply_freeform_two_args(
@@ -2510,7 +2696,7 @@ class Context():
         """
         return _proc.callbackexitcutloop(self._contextptr)
 
-    def get_incumbent(self, *args):
+    def get_incumbent(self, *args, out=None, as_array=False):
         """Returns the current incumbent solution.
 
         The method returns the values in the current incumbent solution
@@ -2538,9 +2724,14 @@ class Context():
           between begin and end, inclusive of end. Equivalent to
           self.get_incumbent(range(begin, end + 1)).
 
+        The optional out and as_array arguments return the values in a
+        float64 buffer rather than a list (see `get_relaxation_point`).
+
         See :cpxapi:`CPXcallbackgetincumbent` in the Callable Library
         Reference Manual for more detail.
         """
+        if out is not None or as_array:
+            return self._get_array(_proc.callbackgetincumbent, args, out)
         def callbackgetincumbent(begin, end=self._get_column_count() - 1):
             return _proc.callbackgetincumbent(self._contextptr, begin, end)
         return apply_freeform_two_args(
@@ -2594,7 +2785,7 @@ class Context():
 
         return switcher[self.get_int_info(self.info.candidate_source)]
 
-    def get_candidate_point(self, *args):
+    def get_candidate_point(self, *args, out=None, as_array=False):
         """Returns the current candidate solution.
 
         This method can only be invoked if `get_id()` returns
@@ -2626,9 +2817,14 @@ class Context():
           between begin and end, inclusive of end. Equivalent to
           self.get_candidate_point(range(begin, end + 1))
 
+        The optional out and as_array arguments return the values in a
+        float64 buffer rather than a list (see `get_relaxation_point`).
+
         See :cpxapi:`CPXcallbackgetcandidatepoint` in the Callable Library
         Reference Manual for more detail.
         """
+        if out is not None or as_array:
+            return self._get_array(_proc.callbackgetcandidatepoint, args, out)
         def callbackgetcandidatepoint(begin, end=self._get_column_count() - 1):
             return _proc.callbackgetcandidatepoint(self._contextptr, begin, end)
         return apply_freeform_two_args(
@@ -2662,7 +2858,7 @@ class Context():
         """
         return _proc.callbackcandidateisray(self._contextptr)
 
-    def get_candidate_ray(self, *args):
+    def get_candidate_ray(self, *args, out=None, as_array=False):
         """Returns the current unbounded ray.
 
         This method can only be invoked if `get_id()` returns
@@ -2693,15 +2889,20 @@ class Context():
           indices between begin and end, inclusive of end. Equivalent to
           self.get_candidate_ray(range(begin, end + 1)).
 
+        The optional out and as_array arguments return the values in a
+        float64 buffer rather than a list (see `get_relaxation_point`).
+
         See :cpxapi:`CPXcallbackgetcandidateray` in the Callable Library
         Reference Manual for more detail.
         """
+        if out is not None or as_array:
+            return self._get_array(_proc.callbackgetcandidateray, args, out)
         def callbackgetcandidateray(begin, end=self._get_column_count() - 1):
             return _proc.callbackgetcandidateray(self._contextptr, begin, end)
         return apply_freeform_two_args(
             callbackgetcandidateray, self._colname2idx, args)
 
-    def get_local_lower_bounds(self, *args):
+    def get_local_lower_bounds(self, *args, out=None, as_array=False):
         """Returns the current local lower bounds.
 
         This method can only be invoked if `get_id()` returns
@@ -2730,15 +2931,20 @@ class Context():
           indices between begin and end, inclusive of end. Equivalent to
           self.get_local_lower_bounds(range(begin, end + 1)).
 
+        The optional out and as_array arguments return the values in a
+        float64 buffer rather than a list (see `get_relaxation_point`).
+
         See :mipapi:`CPXcallbackgetlocallb` in the Callable Library
         Reference Manual for more detail.
         """
+        if out is not None or as_array:
+            return self._get_array(_proc.callbackgetlocallb, args, out)
         def callbackgetlocallb(begin, end=self._get_column_count() - 1):
             return _proc.callbackgetlocallb(self._contextptr, begin, end)
         return apply_freeform_two_args(
             callbackgetlocallb, self._colname2idx, args)
 
-    def get_local_upper_bounds(self, *args):
+    def get_local_upper_bounds(self, *args, out=None, as_array=False):
         """Returns the current local upper bounds.
 
         This method can only be invoked if `get_id()` returns
@@ -2767,15 +2973,20 @@ class Context():
           indices between begin and end, inclusive of end. Equivalent to
           self.get_local_upper_bounds(range(begin, end + 1)).
 
+        The optional out and as_array arguments return the values in a
+        float64 buffer rather than a list (see `get_relaxation_point`).
+
         See :mipapi:`CPXcallbackgetlocalub` in the Callable Library
         Reference Manual for more detail.
         """
+        if out is not None or as_array:
+            return self._get_array(_proc.callbackgetlocalub, args, out)
         def callbackgetlocalub(begin, end=self._get_column_count() - 1):
             return _proc.callbackgetlocalub(self._contextptr, begin, end)
         return apply_freeform_two_args(
             callbackgetlocalub, self._colname2idx, args)
 
-    def get_global_lower_bounds(self, *args):
+    def get_global_lower_bounds(self, *args, out=None, as_array=False):
         """Returns the current globally valid lower bounds.
 
         This method cannot be invoked if `get_id()` returns
@@ -2803,15 +3014,20 @@ class Context():
           indices between begin and end, inclusive of end. Equivalent to
           self.get_global_lower_bounds(range(begin, end + 1)).
 
+        The optional out and as_array arguments return the values in a
+        float64 buffer rather than a list (see `get_relaxation_point`).
+
         See :mipapi:`CPXcallbackgetgloballb` in the Callable Library
         Reference Manual for more detail.
         """
+        if out is not None or as_array:
+            return self._get_array(_proc.callbackgetgloballb, args, out)
         def callbackgetgloballb(begin, end=self._get_column_count() - 1):
             return _proc.callbackgetgloballb(self._contextptr, begin, end)
         return apply_freeform_two_args(
             callbackgetgloballb, self._colname2idx, args)
 
-    def get_global_upper_bounds(self, *args):
+    def get_global_upper_bounds(self, *args, out=None, as_array=False):
         """Returns the current globally valid upper bounds.
 
         This method cannot be invoked if `get_id()` returns
@@ -2839,9 +3055,14 @@ class Context():
           indices between begin and end, inclusive of end. Equivalent to
           self.get_global_upper_bounds(range(begin, end + 1)).
 
+        The optional out and as_array arguments return the values in a
+        float64 buffer rather than a list (see `get_relaxation_point`).
+
         See :mipapi:`CPXcallbackgetglobalub` in the Callable Library
         Reference Manual for more detail.
         """
+        if out is not None or as_array:
+            return self._get_array(_proc.callbackgetglobalub, args, out)
         def callbackgetglobalub(begin, end=self._get_column_count() - 1):
             return _proc.callbackgetglobalub(self._contextptr, begin, end)
         return apply_freeform_two_args(
@@ -3026,3 +3247,412 @@ class Context():
                              0) as (rmat, nnz):
             _proc.callbackrejectcandidatelocal(self._contextptr, nconstraints,
                                                nnz, rhs, senses, rmat)
+
+    def get_cut_pool(self):
+        """Returns the `CutPool` of the current thread.
+
+        The pool collects user cuts or lazy constraints while the
+        callback runs and submits them to CPLEX in a single call. This
+        is faster than calling `add_user_cut()` once per cut.
+
+        The same pool is returned for all invocations of the callback in
+        the current thread during a solve, so settings such as
+        `CutPool.dedup` only need to be made once.
+        """
+        pool = self._cut_pool
+        if pool is None:
+            pool = self._cut_pool = CutPool(self)
+        return pool
+
+
+class CutPool():
+    """Buffer for the user cuts and lazy constraints of a generic callback.
+
+    A cut pool stores constraints in contiguous arrays while a generic
+    callback runs and submits all of them to CPLEX at once, instead of
+    building a temporary matrix for each call of
+    `Context.add_user_cut()`. Use `Context.get_cut_pool()` to get the
+    pool of the current thread.
+
+    Constraints that are still pending when the callback returns are
+    submitted automatically: in context `ContextType.candidate` they
+    reject the candidate (see `reject_candidate()`), in any other context
+    they are added as user cuts (see `submit_user_cuts()`). If the
+    callback raises an exception, pending constraints are discarded.
+
+    If `dedup` is True, `add()` ignores a constraint that is identical to
+    one that is pending or to a globally valid one that was submitted
+    earlier in the same solve from the same thread.
+    """
+
+    def __init__(self, context):
+        """non-public"""
+        self._context = context
+        self.dedup = False
+        self._seen = set()
+        self._pending_keys = []
+        self._beg = array.array("q")
+        self._ind = array.array("i")
+        self._val = array.array("d")
+        self._rhs = array.array("d")
+        self._senses = []
+        self._cutmanagement = array.array("i")
+        self._local = array.array("i")
+
+    def __len__(self):
+        """Returns the number of pending constraints."""
+        return len(self._beg)
+
+    def add(self, cut, sense, rhs, cutmanagement=UseCut.purge, local=False):
+        """Adds a constraint to the pool.
+
+        cut must be either a `SparsePair` instance or a list of two
+        lists, the first of which specifies variables, the second of
+        which specifies the values of the constraint.
+
+        sense must be a single-character string; ("L", "G", "E")
+
+        rhs is a float, specifying the righthand side of the constraint.
+
+        cutmanagement specifies how CPLEX should treat the cut if it is
+        submitted as a user cut (see `UseCut` constants for further
+        details). It is ignored for lazy constraints.
+
+        local specifies whether the constraint is only locally valid
+        (True) or globally valid (False).
+
+        Returns False if the constraint was ignored as a duplicate (see
+        `dedup`) and True otherwise.
+        """
+        indices, values = unpack_pair(cut)
+        indices = self._context._colname2idx(indices)
+        local = bool(local)
+        if self.dedup:
+            key = (tuple(indices), tuple(values), sense, rhs, local)
+            if key in self._seen:
+                return False
+            self._seen.add(key)
+            self._pending_keys.append(key)
+        self._beg.append(len(self._ind))
+        self._ind.extend(indices)
+        self._val.extend(values)
+        self._senses.append(sense)
+        self._rhs.append(rhs)
+        self._cutmanagement.append(cutmanagement)
+        self._local.append(local)
+        return True
+
+    def clear(self):
+        """Discards all pending constraints."""
+        self._discard()
+
+    def submit_user_cuts(self):
+        """Submits the pending constraints as user cuts.
+
+        This method can only be invoked if `Context.get_id()` returns
+        `ContextType.relaxation`. The constraints are passed to CPLEX in
+        a single call and are removed from the pool, even if CPLEX
+        reports an error.
+
+        See :cpxapi:`CPXcallbackaddusercuts` in the Callable Library
+        Reference Manual for more detail.
+        """
+        if len(self._beg) == 0:
+            return
+        try:
+            _proc.callbackaddusercuts_csr(
+                self._context._contextptr, self._rhs, "".join(self._senses),
+                self._beg, *self._nonzeros(),
+                cutmanagement=self._cutmanagement, local=self._local)
+        except BaseException:
+            self._discard()
+            raise
+        self._submitted()
+
+    def reject_candidate(self):
+        """Rejects the current candidate solution.
+
+        This method can only be invoked if `Context.get_id()` returns
+        `ContextType.candidate`. The pending constraints are passed to
+        CPLEX as constraints that cut off the candidate and are removed
+        from the pool. If any of them is only locally valid, the candidate
+        is rejected with `Context.reject_candidate_local()` semantics.
+        If the pool is empty, the candidate is just rejected.
+
+        See :cpxapi:`CPXcallbackrejectcandidate` in the Callable Library
+        Reference Manual for more detail.
+        """
+        if len(self._beg) == 0:
+            self._context.reject_candidate()
+            return
+        try:
+            _proc.callbackrejectcandidate_csr(
+                self._context._contextptr, self._rhs, "".join(self._senses),
+                self._beg, *self._nonzeros(), local=any(self._local))
+        except BaseException:
+            self._discard()
+            raise
+        self._submitted()
+
+    def _nonzeros(self):
+        """non-public"""
+        if len(self._ind) == 0:
+            # Only constraints without any nonzeros are pending.
+            return [], []
+        return self._ind, self._val
+
+    def _submit_pending(self):
+        """non-public
+
+        Called by Cplex._invoke_generic_callback when the callback
+        returns.
+        """
+        if len(self._beg) == 0:
+            return
+        if self._context._contextid == ContextType.candidate:
+            self.reject_candidate()
+        else:
+            self.submit_user_cuts()
+
+    def _submitted(self):
+        """non-public"""
+        # Locally valid constraints may be needed again at other nodes.
+        seen = self._seen
+        for key in self._pending_keys:
+            if key[-1]:
+                seen.discard(key)
+        self._pending_keys = []
+        self._clear_arrays()
+
+    def _discard(self):
+        """non-public"""
+        self._seen.difference_update(self._pending_keys)
+        self._pending_keys = []
+        self._clear_arrays()
+
+    def _clear_arrays(self):
+        """non-public"""
+        if len(self._beg) == 0:
+            return
+        for arr in (self._beg, self._ind, self._val, self._rhs,
+                    self._senses, self._cutmanagement, self._local):
+            del arr[:]
+
+
+_GENERIC_PROFILE_KEYS = {
+    getattr(ContextType, name): "generic." + name
+    for name in ("thread_up", "thread_down", "local_progress",
+                 "global_progress", "candidate", "relaxation", "branching")
+}
+
+
+# Latencies are counted in a histogram with logarithmic buckets: bucket
+# i holds the times in [_HIST_MIN * _HIST_BASE**(i-1),
+# _HIST_MIN * _HIST_BASE**i), bucket 0 everything below _HIST_MIN, and
+# the last bucket everything from 1000 seconds on.
+_HIST_MIN = 1e-7
+_HIST_BASE = 2.0 ** 0.25
+_HIST_SIZE = int(math.log(1e3 / _HIST_MIN, _HIST_BASE)) + 2
+
+
+def _hist_bucket(elapsed):
+    """non-public"""
+    if elapsed < _HIST_MIN:
+        return 0
+    return min(int(math.log(elapsed / _HIST_MIN, _HIST_BASE)) + 1,
+               _HIST_SIZE - 1)
+
+
+class CallbackStats():
+    """Timing statistics for one kind of callback invocation.
+
+    See `CallbackProfile`. The name attribute holds the name of the
+    callback kind (e.g., "generic.relaxation"). All times are wall-clock
+    times in seconds.
+
+    The memory used does not grow with the number of invocations:
+    percentiles are computed from a histogram with logarithmic buckets,
+    so they are accurate to within about 19 percent.
+    """
+
+    def __init__(self, name):
+        """non-public"""
+        self.name = name
+        # Only running aggregates are kept, so that the memory used does
+        # not grow with the number of invocations. The lock guards them
+        # against concurrent updates from several CPLEX threads.
+        self._lock = threading.Lock()
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+        self._conversion = 0.0
+        self._hist = [0] * _HIST_SIZE
+
+    def _add(self, elapsed, conversion):
+        """non-public"""
+        bucket = _hist_bucket(elapsed)
+        with self._lock:
+            self._hist[bucket] += 1
+            self._count += 1
+            self._total += elapsed
+            self._conversion += conversion
+            if elapsed > self._max:
+                self._max = elapsed
+
+    def get_count(self):
+        """Returns the number of invocations."""
+        return self._count
+
+    def get_total_time(self):
+        """Returns the total time spent in the invocations."""
+        return self._total
+
+    def get_name_conversion_time(self):
+        """Returns the time spent converting names to indices.
+
+        This is part of `get_total_time()`.
+        """
+        return self._conversion
+
+    def get_mean_time(self):
+        """Returns the mean time per invocation."""
+        if self._count == 0:
+            return 0.0
+        return self._total / self._count
+
+    def get_percentile(self, percent):
+        """Returns a percentile of the time per invocation.
+
+        percent must be a number between 0 and 100. The nearest-rank
+        method is applied to the histogram of the times, and the upper
+        bound of the bucket holding that rank is returned (but never
+        more than `get_max_time()`).
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError("percent must be between 0 and 100")
+        if self._count == 0:
+            return 0.0
+        rank = max(1, math.ceil(self._count * percent / 100))
+        seen = 0
+        for bucket, count in enumerate(self._hist):
+            seen += count
+            if seen >= rank:
+                break
+        return min(_HIST_MIN * _HIST_BASE ** bucket, self._max)
+
+    def get_max_time(self):
+        """Returns the longest time of a single invocation."""
+        return self._max
+
+
+class CallbackProfile():
+    """Report of the time spent in Python callbacks during a solve.
+
+    A profile is recorded if profiling was enabled with
+    `Cplex.set_callback_profiling()` and is returned by
+    `Cplex.get_callback_profile()`. It covers the generic callback
+    (one entry per `ContextType`, named "generic.<context>") and the
+    legacy callbacks (one entry per callback type, named
+    "legacy.<type>", e.g. "legacy.usercut").
+
+    The time of an invocation is measured from the moment control
+    passes from CPLEX to the Python API until it returns, so it includes
+    the conversion of the arguments in the Python API. The time spent
+    converting variable and constraint names to indices is reported
+    separately as well.
+
+    The stats attribute is a dictionary mapping the names of the
+    entries to `CallbackStats` instances. str() of a profile renders a
+    table of all entries.
+    """
+
+    def __init__(self):
+        """non-public"""
+        self.stats = {}
+        self._start = time.perf_counter()
+        self._end = None
+        # Name conversion time of the current invocation, per thread.
+        self._conversion = {}
+
+    def get_solve_time(self):
+        """Returns the wall-clock time of the solve in seconds.
+
+        Returns None while the solve is still running.
+        """
+        if self._end is None:
+            return None
+        return self._end - self._start
+
+    def get_callback_time(self):
+        """Returns the total time spent in callbacks in seconds.
+
+        With several threads, this can exceed `get_solve_time()`.
+        """
+        return sum(stats.get_total_time() for stats in self.stats.values())
+
+    def _stop(self):
+        """non-public"""
+        self._end = time.perf_counter()
+
+    def _time_call(self, name, fn, *args):
+        """non-public"""
+        ident = threading.get_ident()
+        conversion = self._conversion
+        conversion[ident] = 0.0
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats.setdefault(name, CallbackStats(name))
+            stats._add(elapsed, conversion.pop(ident, 0.0))
+
+    def _time_conversion(self, fn, *args):
+        """non-public"""
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            ident = threading.get_ident()
+            conversion = self._conversion
+            if ident in conversion:
+                conversion[ident] += time.perf_counter() - start
+
+    def __str__(self):
+        """Returns a table of the recorded statistics."""
+        header = ("callback", "count", "total", "mean", "p50", "p90",
+                  "p99", "max", "names")
+        rows = []
+        for name in sorted(self.stats):
+            stats = self.stats[name]
+            rows.append((name, str(stats.get_count())) + tuple(
+                "{0:.6f}".format(value) for value in (
+                    stats.get_total_time(), stats.get_mean_time(),
+                    stats.get_percentile(50), stats.get_percentile(90),
+                    stats.get_percentile(99), stats.get_max_time(),
+                    stats.get_name_conversion_time())))
+        widths = [max(len(row[i]) for row in [header] + rows)
+                  for i in range(len(header))]
+        lines = ["  ".join(cell.rjust(width) if i else cell.ljust(width)
+                           for i, (cell, width) in
+                           enumerate(zip(row, widths)))
+                 for row in [header] + rows]
+        solve_time = self.get_solve_time()
+        if solve_time is not None:
+            lines.append("solve time: {0:.6f}, callback time: {1:.6f}"
+                         .format(solve_time, self.get_callback_time()))
+        return "\n".join(lines)
+
+
+class _ProfiledContext(Context):
+    """non-public
+
+    A Context that records the time spent in name conversion.
+    """
+
+    def _colname2idx(self, name, cache=None):
+        """non-public"""
+        return self._cpx._callback_profile._time_conversion(
+            super()._colname2idx, name, cache)